@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from graphlib import CycleError, TopologicalSorter
 import logging
 import logging.handlers
 import os
@@ -16,7 +18,7 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from . import config as conf_util, config_entries, core, loader
+from . import config as conf_util, config_entries, core, loader, requirements
 from .components import http
 from .const import (
     FORMAT_DATETIME,
@@ -38,9 +40,11 @@ from .helpers import (
 from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    async_process_deps_reqs,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -106,6 +110,18 @@ STAGE_1_INTEGRATIONS = {
 }
 
 
+@dataclass(slots=True)
+class _SetupTiming:
+    """Loop times at which the setup of an integration progressed."""
+
+    scheduled: float
+    ready: float | None = None
+    prepared: float | None = None
+    done: float | None = None
+    # The prerequisite that finished last
+    blocked_by: str | None = None
+
+
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
 ) -> core.HomeAssistant | None:
@@ -135,6 +151,7 @@ async def async_setup_hass(
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     loader.async_setup(hass)
+    await loader.async_load_integration_index(hass)
     config_dict = None
     basic_setup_success = False
 
@@ -539,6 +556,188 @@ async def async_setup_multi_components(
             )
 
 
+def _setup_prerequisites(
+    domains: set[str], integrations: dict[str, loader.Integration]
+) -> dict[str, set[str]]:
+    """Return the integrations each integration has to wait for.
+
+    Only the dependencies and after dependencies that are set up
+    together with the integration are taken into account.
+    """
+    prerequisites: dict[str, set[str]] = {}
+    for domain in domains:
+        if (integration := integrations.get(domain)) is None:
+            prerequisites[domain] = set()
+            continue
+        prerequisites[domain] = (
+            {*integration.dependencies, *integration.after_dependencies} & domains
+        ) - {domain}
+
+    while True:
+        try:
+            TopologicalSorter(prerequisites).prepare()
+        except CycleError as err:
+            # Dependencies are validated to not be circular,
+            # only after dependencies can form a cycle
+            cycle: list[str] = err.args[1]
+            _LOGGER.warning("Circular after dependencies: %s", " -> ".join(cycle))
+            for domain in cycle:
+                prerequisites[domain] &= set(integrations[domain].dependencies)
+        else:
+            return prerequisites
+
+
+async def _async_prepare_integration(
+    hass: core.HomeAssistant, integration: loader.Integration
+) -> None:
+    """Process the requirements of an integration and import it in the executor.
+
+    Errors are ignored, they are logged when the integration is set up.
+    """
+    if integration.disabled or not await integration.resolve_dependencies():
+        return
+    try:
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
+        await hass.async_add_executor_job(integration.preload_modules, BASE_PLATFORMS)
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+@core.callback
+def _async_start_setup_graph(
+    hass: core.HomeAssistant,
+    domains: set[str],
+    config: dict[str, Any],
+    integrations: dict[str, loader.Integration],
+    timeline: dict[str, _SetupTiming],
+    prepare_semaphore: asyncio.Semaphore,
+) -> tuple[asyncio.Future[None], list[asyncio.Task[None]]]:
+    """Start setting up integrations as soon as their prerequisites are set up.
+
+    All integrations are prepared right away, at most MAX_LOAD_CONCURRENTLY
+    at a time, while they wait for their prerequisites. Returns a future
+    that is done once all integrations have processed their dependencies
+    and requirements together with the setup tasks.
+    """
+    prerequisites = _setup_prerequisites(domains, integrations)
+    finished: dict[str, asyncio.Future[None]] = {
+        domain: hass.loop.create_future() for domain in domains
+    }
+    all_processed = hass.loop.create_future()
+    remaining = len(domains)
+
+    def _async_processed() -> None:
+        nonlocal remaining
+        remaining -= 1
+        if not remaining:
+            all_processed.set_result(None)
+
+    async def _async_prepare(domain: str) -> None:
+        try:
+            if integration := integrations.get(domain):
+                async with prepare_semaphore:
+                    await _async_prepare_integration(hass, integration)
+        finally:
+            timeline[domain].prepared = hass.loop.time()
+
+    async def _async_set_up(domain: str) -> None:
+        timing = timeline[domain] = _SetupTiming(hass.loop.time())
+        prepare_task = hass.async_create_task(
+            _async_prepare(domain), f"prepare component {domain}"
+        )
+        processed = False
+        try:
+            for prerequisite in prerequisites[domain]:
+                # Other integrations wait for the same prerequisite
+                await asyncio.shield(finished[prerequisite])
+            if prerequisites[domain]:
+                timing.blocked_by = max(
+                    prerequisites[domain],
+                    key=lambda prerequisite: timeline[prerequisite].done or 0,
+                )
+            timing.ready = hass.loop.time()
+            await prepare_task
+            if (integration := integrations.get(domain)) and all(
+                dep in hass.config.components for dep in integration.dependencies
+            ):
+                # Process the after dependencies now, the integrations
+                # of the next stage are not to be loaded yet
+                with contextlib.suppress(HomeAssistantError):
+                    await async_process_deps_reqs(hass, config, integration)
+            processed = True
+            _async_processed()
+            await async_setup_component(hass, domain, config)
+        # pylint: disable-next=broad-except
+        except (asyncio.CancelledError, Exception) as err:
+            # A CancelledError raised by an integration is logged like
+            # any other error, but a cancelled setup task stays cancelled
+            if isinstance(err, asyncio.CancelledError) and (
+                (task := asyncio.current_task()) is None or task.cancelling()
+            ):
+                raise
+            _LOGGER.error(
+                "Error setting up integration %s - received exception",
+                domain,
+                exc_info=(type(err), err, err.__traceback__),
+            )
+        finally:
+            timing.done = hass.loop.time()
+            finished[domain].set_result(None)
+            if not processed:
+                _async_processed()
+
+    if not domains:
+        all_processed.set_result(None)
+    # Integrations without prerequisites are prepared first
+    tasks = [
+        hass.async_create_task(_async_set_up(domain), f"setup component {domain}")
+        for domain in TopologicalSorter(prerequisites).static_order()
+    ]
+    return all_processed, tasks
+
+
+def _log_setup_timeline(timeline: dict[str, _SetupTiming], start: float) -> None:
+    """Log when integrations were set up and the path that gated the setup."""
+    if not timeline or not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    end = max(timing.done or start for timing in timeline.values())
+    scale = 60 / max(end - start, 0.001)
+    lines = []
+    for domain, timing in sorted(
+        timeline.items(), key=lambda item: item[1].ready or item[1].scheduled
+    ):
+        prepared = timing.prepared or timing.scheduled
+        set_up = max(timing.ready or prepared, prepared)
+        done = timing.done or set_up
+        span = (
+            " " * round((timing.scheduled - start) * scale)
+            + "-" * round((prepared - timing.scheduled) * scale)
+            + "." * round((set_up - prepared) * scale)
+            + "=" * max(round((done - set_up) * scale), 1)
+        )
+        lines.append(
+            f"{domain:<30} {span:<61} prepared {prepared - timing.scheduled:.2f}s,"
+            f" waited {set_up - timing.scheduled:.2f}s, set up {done - set_up:.2f}s"
+        )
+
+    critical_path = []
+    last: str | None = max(timeline, key=lambda domain: timeline[domain].done or 0)
+    while last is not None:
+        critical_path.append(last)
+        last = timeline[last].blocked_by
+    _LOGGER.debug(
+        "Integration setup timeline, - preparing, . waiting, = setting up:\n%s",
+        "\n".join(lines),
+    )
+    _LOGGER.debug(
+        "Critical path of the integration setup: %s",
+        " -> ".join(reversed(critical_path)),
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -590,25 +789,36 @@ async def _async_set_up_integrations(
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
 
+    setup_start = hass.loop.time()
+    timeline: dict[str, _SetupTiming] = {}
+    prepare_semaphore = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
+
+    async def _async_set_up_wave(domains: set[str]) -> None:
+        """Set up integrations that have to be set up before all others."""
+        _, tasks = _async_start_setup_graph(
+            hass, domains, config, integration_cache, timeline, prepare_semaphore
+        )
+        await asyncio.wait(tasks)
+
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        await _async_set_up_wave(logging_domains)
 
     # Setup frontend
     if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
         _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
+        await _async_set_up_wave(frontend_domains)
 
     # Setup recorder
     if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
         _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
+        await _async_set_up_wave(recorder_domains)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        await _async_set_up_wave(debuggers)
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -644,27 +854,43 @@ async def _async_set_up_integrations(
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
-    # Start setup
+    # Integrations are set up as soon as the integrations they depend
+    # on are set up. Stage 2 only waits for the stage 1 integrations to
+    # process their dependencies and requirements so their requirements
+    # are updated before stage 2 integrations can load them, not for
+    # their setup to finish.
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+    stage_1_processed, setup_tasks = _async_start_setup_graph(
+        hass, stage_1_domains, config, integration_cache, timeline, prepare_semaphore
+    )
+    try:
+        async with hass.timeout.async_timeout(STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME):
+            await stage_1_processed
+    except asyncio.TimeoutError:
+        _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
     # Add after dependencies when setting up stage 2 domains
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        _, stage_2_tasks = _async_start_setup_graph(
+            hass,
+            stage_2_domains,
+            config,
+            integration_cache,
+            timeline,
+            prepare_semaphore,
+        )
+        setup_tasks.extend(stage_2_tasks)
+
+    if setup_tasks:
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await asyncio.wait(setup_tasks)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
@@ -678,6 +904,7 @@ async def _async_set_up_integrations(
 
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
+    _log_setup_timeline(timeline, setup_start)
 
     _LOGGER.debug(
         "Integration setup times: %s",
@@ -12,6 +12,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import CONF_STORED_TRACES
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -124,7 +125,9 @@ class IfAction(Protocol):
 
     config: list[ConfigType]
 
-    def __call__(self, variables: Mapping[str, Any] | None = None) -> bool:
+    def __call__(
+        self, variables: Mapping[str, Any] | None = None, traced: bool = True
+    ) -> bool:
         """AND all conditions."""
 
 
@@ -623,7 +626,9 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             if (
                 not skip_condition
                 and self._cond_func is not None
-                and not self._cond_func(variables)
+                and not self._cond_func(
+                    variables, traced=self._trace_config[CONF_STORED_TRACES] > 0
+                )
             ):
                 self._logger.debug(
                     "Conditions not met, aborting automation. Condition summary: %s",
@@ -987,8 +992,22 @@ async def _async_process_if(
             LOGGER.warning("Invalid condition: %s", ex)
             return None
 
-    def if_action(variables: Mapping[str, Any] | None = None) -> bool:
+    untraced_if_action = condition.async_compile_conditions(
+        "condition", checks, False, False
+    )
+
+    def if_action(
+        variables: Mapping[str, Any] | None = None, traced: bool = True
+    ) -> bool:
         """AND all conditions."""
+        if not traced:
+            # No trace is stored, evaluate the compiled plan instead
+            try:
+                return bool(untraced_if_action(hass, variables))
+            except ConditionErrorContainer as ex:
+                LOGGER.warning("Error evaluating condition in '%s':\n%s", name, ex)
+                return False
+
         errors: list[ConditionErrorIndex] = []
         for index, check in enumerate(checks):
             try:
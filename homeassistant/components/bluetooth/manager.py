@@ -199,6 +199,10 @@ class BluetoothManager:
                 service_info.as_dict() for service_info in self._all_history.values()
             ],
             "advertisement_tracker": self._advertisement_tracker.async_diagnostics(),
+            "match_cache": {
+                "integrations": self._integration_matcher.diagnostics(),
+                "callbacks": self._callback_index.diagnostics(),
+            },
         }
 
     def _find_adapter_by_address(self, address: str) -> str | None:
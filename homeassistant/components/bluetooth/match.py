@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from fnmatch import translate
 from functools import lru_cache
+import itertools
 import re
 from typing import TYPE_CHECKING, Final, Generic, TypedDict, TypeVar
 
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 
 
 MAX_REMEMBER_ADDRESSES: Final = 2048
+MAX_MATCH_CACHE_FINGERPRINTS: Final = 4096
 
 CALLBACK: Final = "callback"
 DOMAIN: Final = "domain"
@@ -112,6 +114,10 @@ class IntegrationMatcher:
             self._index.add(matcher)
         self._index.build()
 
+    def diagnostics(self) -> dict[str, int]:
+        """Return diagnostics for the match cache."""
+        return self._index.diagnostics()
+
     def async_clear_address(self, address: str) -> None:
         """Clear the history matches for a set of domains."""
         self._matched.pop(address, None)
@@ -172,6 +178,16 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
+        # Most advertisements repeat the same fields so the matches
+        # are cached by the fields the matchers look at. Manufacturer
+        # data changes often, so only the part a matcher compares
+        # with manufacturer_data_start is part of the fingerprint.
+        self._match_cache: MutableMapping[tuple, tuple[_T, ...]] = LRU(
+            MAX_MATCH_CACHE_FINGERPRINTS
+        )
+        self._manufacturer_data_start_length = 0
+        self._match_cache_hits = 0
+        self._match_cache_misses = 0
 
     def add(self, matcher: _T) -> bool:
         """Add a matcher to the index.
@@ -180,6 +196,7 @@ class BluetoothMatcherIndexBase(Generic[_T]):
 
         We put them in the bucket that they are most likely to match.
         """
+        self._match_cache.clear()
         # Local name is the cheapest to match since its just a dict lookup
         if LOCAL_NAME in matcher:
             self.local_name.setdefault(
@@ -212,6 +229,7 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         Matchers only end up in one bucket, so once we have
         removed one, we are done.
         """
+        self._match_cache.clear()
         if LOCAL_NAME in matcher:
             self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].remove(
                 matcher
@@ -237,9 +255,69 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         self.service_uuid_set = set(self.service_uuid)
         self.service_data_uuid_set = set(self.service_data_uuid)
         self.manufacturer_id_set = set(self.manufacturer_id)
+        self._manufacturer_data_start_length = max(
+            (
+                len(matcher[MANUFACTURER_DATA_START])
+                for matchers in itertools.chain(
+                    self.local_name.values(),
+                    self.service_uuid.values(),
+                    self.service_data_uuid.values(),
+                    self.manufacturer_id.values(),
+                )
+                for matcher in matchers
+                if MANUFACTURER_DATA_START in matcher
+            ),
+            default=0,
+        )
+        self._match_cache.clear()
+
+    def diagnostics(self) -> dict[str, int]:
+        """Return diagnostics for the match cache."""
+        return {
+            "fingerprints": len(self._match_cache),
+            "hits": self._match_cache_hits,
+            "misses": self._match_cache_misses,
+        }
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
+        if not (
+            self.local_name
+            or self.service_data_uuid_set
+            or self.manufacturer_id_set
+            or self.service_uuid_set
+        ):
+            return []
+        advertisement_data = service_info.advertisement
+        manufacturer_data = advertisement_data.manufacturer_data
+        manufacturer_fingerprint: tuple[int | tuple[int, bytes], ...]
+        if (start_length := self._manufacturer_data_start_length) and (
+            manufacturer_data
+        ):
+            manufacturer_fingerprint = tuple(
+                (manufacturer_id, data[:start_length])
+                for manufacturer_id, data in manufacturer_data.items()
+            )
+        else:
+            manufacturer_fingerprint = tuple(manufacturer_data)
+        fingerprint = (
+            service_info.name,
+            advertisement_data.local_name or service_info.device.name,
+            service_info.connectable,
+            tuple(advertisement_data.service_uuids),
+            tuple(advertisement_data.service_data),
+            manufacturer_fingerprint,
+        )
+        if (cached_matches := self._match_cache.get(fingerprint)) is not None:
+            self._match_cache_hits += 1
+            return list(cached_matches)
+        self._match_cache_misses += 1
+        matches = self._match(service_info)
+        self._match_cache[fingerprint] = tuple(matches)
+        return matches
+
+    def _match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
+        """Check the matchers in the buckets for a match."""
         matches = []
         if service_info.name and len(service_info.name) >= LOCAL_NAME_MIN_MATCH_LENGTH:
             for matcher in self.local_name.get(
@@ -612,6 +612,10 @@ class PassiveBluetoothProcessorEntity(Entity, Generic[_PassiveBluetoothDataProce
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # The attributes only come from the entity description and the
+    # availability, subclasses which add attributes that change with
+    # the data must call async_mark_attributes_dirty or disable this
+    _cache_attributes = True
 
     def __init__(
         self,
@@ -5,3 +5,8 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+HISTORY_STREAM_CHUNK_SIZE = 1000
+
+# Seconds a recorder worker waits for a chunk to be written to the client
+HISTORY_STREAM_WRITE_TIMEOUT = 10
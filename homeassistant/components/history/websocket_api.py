@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Coroutine, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
@@ -12,6 +12,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -38,7 +39,12 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_SIZE,
+    HISTORY_STREAM_WRITE_TIMEOUT,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +65,7 @@ class HistoryLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_history_during_period_stream)
     websocket_api.async_register_command(hass, ws_stream)
 
 
@@ -170,6 +177,163 @@ async def ws_get_history_during_period(
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    send_chunk: Callable[[str], Coroutine[Any, Any, bool]],
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> bool:
+    """Fetch history significant_states in chunks and send them as they are read.
+
+    The next rows are only read from the database once the previous chunk
+    was written to the client, so the memory used stays bounded by the
+    chunk size instead of the length of the period even for slow clients.
+
+    Returns False if the client did not read a chunk in time. Streaming
+    is stopped then so the recorder worker is not kept busy.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        for states in history.get_significant_states_chunks_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            chunk_size,
+        ):
+            message = JSON_DUMP(messages.event_message(msg_id, {"states": states}))
+            future = asyncio.run_coroutine_threadsafe(send_chunk(message), hass.loop)
+            try:
+                if not future.result(HISTORY_STREAM_WRITE_TIMEOUT):
+                    return True
+            except TimeoutError:
+                future.cancel()
+                return False
+    return True
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_during_period_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size", default=HISTORY_STREAM_CHUNK_SIZE): vol.All(
+            int, vol.Range(min=1, max=HISTORY_STREAM_CHUNK_SIZE * 10)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_during_period_stream(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history during period websocket command with streamed chunks.
+
+    The result is sent first, then one event per chunk of at most
+    chunk_size states of a single entity and a final event with done
+    set once all states have been sent.
+    """
+    msg_id: int = msg["id"]
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    entity_ids: list[str] = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+            connection.send_error(msg_id, "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    cancelled = False
+
+    @callback
+    def _async_cancel() -> None:
+        """Stop sending chunks."""
+        nonlocal cancelled
+        cancelled = True
+
+    async def _async_send_chunk(message: str) -> bool:
+        """Send a chunk and return if the next one is wanted.
+
+        Waits until the chunk was written to the client.
+        """
+        if cancelled:
+            return False
+        connection.send_message(message)
+        await connection.async_drain()
+        return not cancelled
+
+    connection.subscriptions[msg_id] = _async_cancel
+    connection.send_result(msg_id)
+
+    include_start_time_state = msg["include_start_time_state"]
+    no_attributes = msg["no_attributes"]
+    if start_time <= dt_util.utcnow() and (
+        include_start_time_state
+        or entities_may_have_state_changes_after(
+            hass, entity_ids, start_time, no_attributes
+        )
+    ):
+        written = await get_instance(hass).async_add_executor_job(
+            _ws_stream_significant_states,
+            hass,
+            _async_send_chunk,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            msg["significant_changes_only"],
+            msg["minimal_response"],
+            no_attributes,
+            msg["chunk_size"],
+        )
+        if not written and not cancelled:
+            _LOGGER.debug("History stream %s timed out writing to the client", msg_id)
+            connection.subscriptions.pop(msg_id, None)
+            connection.send_error(
+                msg_id,
+                websocket_api.ERR_TIMEOUT,
+                "The client did not read the history in time",
+            )
+            return
+
+    if cancelled:
+        return
+    connection.subscriptions.pop(msg_id, None)
+    connection.send_message(messages.event_message(msg_id, {"done": True}))
+
+
 def _generate_stream_message(
     states: MutableMapping[str, list[dict[str, Any]]],
     start_day: dt,
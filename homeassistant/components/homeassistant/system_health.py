@@ -2,6 +2,9 @@
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.loader import DATA_IMPORT_TIMES, PACKAGE_BUILTIN
+
+SLOWEST_IMPORTS = 5
 
 
 @callback
@@ -30,4 +33,18 @@ async def system_health_info(hass):
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        **_import_time_info(hass),
+    }
+
+
+def _import_time_info(hass: HomeAssistant) -> dict[str, str]:
+    """Return how long importing integrations and their platforms took."""
+    import_times: dict[str, float] = hass.data.get(DATA_IMPORT_TIMES, {})
+    slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "import_time": f"{sum(import_times.values()):.2f}s",
+        "slowest_imports": ", ".join(
+            f"{name.removeprefix(f'{PACKAGE_BUILTIN}.')} ({seconds:.2f}s)"
+            for name, seconds in slowest[:SLOWEST_IMPORTS]
+        ),
     }
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from dataclasses import asdict, dataclass
 from functools import lru_cache
 from itertools import chain, groupby
 import logging
@@ -93,6 +94,10 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+# The number of topics for which the matching subscriptions are cached
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+# The maximum number of received messages dispatched per loop iteration
+MESSAGE_BATCH_SIZE = 100
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -167,9 +172,14 @@ async def async_subscribe(
     msg_callback: AsyncMessageCallbackType | MessageCallbackType,
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
+    drop_superseded_retained: bool = False,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
+    If drop_superseded_retained is set, a retained message is not passed to
+    msg_callback if a newer retained message for the same topic was received
+    with it.
+
     Call the return value to unsubscribe.
     """
     if not mqtt_config_entry_enabled(hass):
@@ -183,17 +193,19 @@ async def async_subscribe(
             f"Cannot subscribe to topic '{topic}', "
             "make sure MQTT is set up correctly"
         ) from ex
-    async_remove = await mqtt_data.client.async_subscribe(
-        topic,
-        catch_log_exception(
-            msg_callback,
-            lambda msg: (
-                f"Exception in {msg_callback.__name__} when handling msg on "
-                f"'{msg.topic}': '{msg.payload}'"
-            ),
+    wrapped_msg_callback = catch_log_exception(
+        msg_callback,
+        lambda msg: (
+            f"Exception in {msg_callback.__name__} when handling msg on "
+            f"'{msg.topic}': '{msg.payload}'"
         ),
-        qos,
-        encoding,
+    )
+    if drop_superseded_retained:
+        return await mqtt_data.client.async_subscribe(
+            topic, wrapped_msg_callback, qos, encoding, drop_superseded_retained=True
+        )
+    async_remove = await mqtt_data.client.async_subscribe(
+        topic, wrapped_msg_callback, qos, encoding
     )
     return async_remove
 
@@ -223,10 +235,22 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    drop_superseded_retained: bool = False
+
+
+@dataclass(slots=True)
+class MessageQueueMetrics:
+    """Metrics of the messages queued by the paho thread for the event loop."""
+
+    batches: int = 0
+    messages: int = 0
+    max_queue_depth: int = 0
+    last_batch_latency: float = 0.0
+    max_batch_latency: float = 0.0
+    superseded_retained: int = 0
 
 
 class MqttClientSetup:
@@ -295,6 +319,103 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _TopicTrieNode:
+    """Node of a topic trie for one level of the subscribed topics."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Trie of wildcard subscriptions segmented by topic level.
+
+    The subscriptions matching a topic are resolved by walking the levels
+    of the topic once, instead of matching every subscription.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        # Matches are returned in the order the subscriptions were added
+        self._order: dict[Subscription, int] = {}
+        self._next_order = 0
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in the order they were added."""
+        return iter(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._order[subscription] = self._next_order
+        self._next_order += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, raise ValueError if it was not added."""
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"{subscription} is not in the trie")
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        del self._order[subscription]
+        # Prune the nodes which are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription to the topic."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        match_root_wildcards = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcards = idx or match_root_wildcards
+            if wildcards and (multi_level := children.get("#")) is not None:
+                matches.extend(multi_level.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if (
+                wildcards
+                and (single_level := children.get("+")) is not None
+                and single_level is not child
+            ):
+                stack.append((single_level, idx + 1))
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -387,7 +508,7 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -409,6 +530,10 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages received by the paho thread and the time they were received
+        self._pending_messages: deque[tuple[mqtt.MQTTMessage, float]] = deque()
+        self._pending_messages_scheduled = False
+        self.message_queue_metrics = MessageQueueMetrics()
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -464,6 +589,13 @@ class MQTT:
             *self._wildcard_subscriptions,
         ]
 
+    def message_queue_diagnostics(self) -> dict[str, Any]:
+        """Return the queue depth and metrics of the received messages."""
+        return {
+            "queue_depth": len(self._pending_messages),
+            **asdict(self.message_queue_metrics),
+        }
+
     def cleanup(self) -> None:
         """Clean up listeners."""
         while self._cleanup_on_unload:
@@ -490,8 +622,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -587,7 +719,7 @@ class MQTT:
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -632,6 +764,7 @@ class MQTT:
         msg_callback: AsyncMessageCallbackType | MessageCallbackType,
         qos: int,
         encoding: str | None = None,
+        drop_superseded_retained: bool = False,
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos.
 
@@ -641,7 +774,7 @@ class MQTT:
             raise HomeAssistantError("Topic needs to be a string!")
 
         subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
+            topic, HassJob(msg_callback), qos, encoding, drop_superseded_retained
         )
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
@@ -812,21 +945,56 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        The messages are queued and dispatched in batches, so the event
+        loop is only woken up once for the messages received meanwhile.
+        """
+        self._pending_messages.append((msg, time.monotonic()))
+        if not self._pending_messages_scheduled:
+            self._pending_messages_scheduled = True
+            self.loop.call_soon_threadsafe(self._mqtt_handle_pending_messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @callback
+    def _mqtt_handle_pending_messages(self) -> None:
+        """Dispatch a batch of the messages queued by the paho thread."""
+        # Reset before draining, messages queued from now on schedule a new batch
+        self._pending_messages_scheduled = False
+        pending_messages = self._pending_messages
+        if not (queue_depth := len(pending_messages)):
+            return
+        metrics = self.message_queue_metrics
+        metrics.max_queue_depth = max(metrics.max_queue_depth, queue_depth)
+        batch = [
+            pending_messages.popleft()
+            for _ in range(min(queue_depth, MESSAGE_BATCH_SIZE))
+        ]
+        latency = time.monotonic() - batch[0][1]
+        metrics.batches += 1
+        metrics.messages += len(batch)
+        metrics.last_batch_latency = latency
+        metrics.max_batch_latency = max(metrics.max_batch_latency, latency)
+
+        superseded = _superseded_retained_messages(batch)
+        for idx, (msg, _) in enumerate(batch):
+            self._mqtt_handle_message(msg, idx in superseded)
+
+        if pending_messages and not self._pending_messages_scheduled:
+            # Let other callbacks run before dispatching the next batch
+            self._pending_messages_scheduled = True
+            self.loop.call_soon(self._mqtt_handle_pending_messages)
+
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscriptions.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+            return [*self._simple_subscriptions[topic], *subscriptions]
         return subscriptions
 
     @callback
-    def _mqtt_handle_message(self, msg: mqtt.MQTTMessage) -> None:
+    def _mqtt_handle_message(
+        self, msg: mqtt.MQTTMessage, superseded: bool = False
+    ) -> None:
         _LOGGER.debug(
             "Received%s message on %s (qos=%s): %s",
             " retained" if msg.retain else "",
@@ -839,6 +1007,9 @@ class MQTT:
         subscriptions = self._matching_subscriptions(msg.topic)
 
         for subscription in subscriptions:
+            if superseded and subscription.drop_superseded_retained:
+                self.message_queue_metrics.superseded_retained += 1
+                continue
             if msg.retain:
                 retained_topics = self._retained_topics.setdefault(subscription, set())
                 # Skip if the subscription already received a retained message
@@ -960,6 +1131,21 @@ class MQTT:
             )
 
 
+def _superseded_retained_messages(
+    batch: list[tuple[mqtt.MQTTMessage, float]]
+) -> set[int]:
+    """Return the indexes of retained messages followed by one for the same topic."""
+    last_retained: dict[str, int] = {}
+    superseded: set[int] = set()
+    for idx, (msg, _) in enumerate(batch):
+        if not msg.retain:
+            continue
+        if (previous := last_retained.get(topic := msg.topic)) is not None:
+            superseded.add(previous)
+        last_retained[topic] = idx
+    return superseded
+
+
 def _raise_on_error(result_code: int) -> None:
     """Raise error if error result."""
     # pylint: disable-next=import-outside-toplevel
@@ -967,13 +1153,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
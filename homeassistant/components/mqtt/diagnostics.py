@@ -17,6 +17,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import debug_info, is_connected
+from .discovery import async_discovery_diagnostics
 from .util import get_mqtt_data
 
 REDACT_CONFIG = {CONF_PASSWORD, CONF_USERNAME}
@@ -53,6 +54,8 @@ def _async_get_diagnostics(
     data = {
         "connected": is_connected(hass),
         "mqtt_config": redacted_config,
+        "message_queue": mqtt_instance.message_queue_diagnostics(),
+        "discovery": async_discovery_diagnostics(hass),
     }
 
     if device:
@@ -102,7 +102,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    get_mqtt_data(hass).discovery_already_discovered.remove(discovery_hash)
+    mqtt_data = get_mqtt_data(hass)
+    mqtt_data.discovery_already_discovered.remove(discovery_hash)
+    mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -110,6 +112,25 @@ def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) ->
     get_mqtt_data(hass).discovery_already_discovered.add(discovery_hash)
 
 
+@callback
+def async_discovery_diagnostics(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the discovery throughput and the time it took to settle."""
+    metrics = get_mqtt_data(hass).discovery_metrics
+    time_to_settle: float | None = None
+    throughput: float | None = None
+    if metrics.processed:
+        time_to_settle = metrics.last_processed - metrics.started
+        if time_to_settle > 0:
+            throughput = metrics.processed / time_to_settle
+    return {
+        "messages": metrics.messages,
+        "unchanged": metrics.unchanged,
+        "processed": metrics.processed,
+        "time_to_settle": time_to_settle,
+        "throughput": throughput,
+    }
+
+
 @callback
 def async_log_discovery_origin_info(
     message: str, discovery_payload: MQTTDiscoveryPayload
@@ -139,12 +160,14 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = get_mqtt_data(hass)
+    metrics = mqtt_data.discovery_metrics
     mqtt_integrations = {}
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
         """Process the received message."""
         mqtt_data.last_discovery = time.time()
+        metrics.messages += 1
         payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
@@ -168,6 +191,23 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # The broker sends all retained discovery messages again when
+        # reconnecting, these only need to be processed if they changed
+        if (
+            mqtt_data.discovery_payloads.get(discovery_hash) == payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+        ):
+            metrics.unchanged += 1
+            _LOGGER.debug(
+                "Discovery payload for %s %s is unchanged", component, discovery_id
+            )
+            return
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -235,10 +275,6 @@ async def async_start(  # noqa: C901
                         if topic[-1] == TOPIC_BASE:
                             availability_conf[CONF_TOPIC] = f"{topic[:-1]}{base}"
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
@@ -255,6 +291,10 @@ async def async_start(  # noqa: C901
 
             discovery_payload[CONF_PLATFORM] = "mqtt"
 
+        mqtt_data.discovery_payloads[discovery_hash] = payload
+        metrics.processed += 1
+        metrics.last_processed = mqtt_data.last_discovery
+
         if discovery_hash in mqtt_data.discovery_pending_discovered:
             pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
             pending.appendleft(discovery_payload)
@@ -323,6 +363,7 @@ async def async_start(  # noqa: C901
                 hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
             )
 
+    metrics.started = time.time()
     discovery_topics = [
         f"{discovery_topic}/+/+/config",
         f"{discovery_topic}/+/+/+/config",
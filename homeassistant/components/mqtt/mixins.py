@@ -408,6 +408,14 @@ async def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = get_mqtt_data(hass)
+    discovered_entities: list[Entity] = []
+
+    @callback
+    def _async_add_discovered_entities() -> None:
+        """Add the entities discovered since the last loop iteration."""
+        entities = discovered_entities.copy()
+        discovered_entities.clear()
+        async_add_entities(entities)
 
     @callback
     def async_setup_from_discovery(
@@ -420,8 +428,12 @@ async def async_setup_entity_entry_helper(
             entity_class = schema_class_mapping[config[CONF_SCHEMA]]
         if TYPE_CHECKING:
             assert entity_class is not None
-        async_add_entities(
-            [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+        # Retained discovery messages arrive in bursts, adding the
+        # entities together saves scheduling a task for each of them
+        if not discovered_entities:
+            hass.loop.call_soon(_async_add_discovered_entities)
+        discovered_entities.append(
+            entity_class(hass, config, entry, discovery_payload.discovery_data)
         )
 
     mqtt_data.reload_dispatchers.append(
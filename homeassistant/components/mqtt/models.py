@@ -318,6 +318,17 @@ class EntityTopicState:
         self.subscribe_calls[entity.entity_id] = entity
 
 
+@dataclass(slots=True)
+class DiscoveryMetrics:
+    """Keep track of the processed MQTT discovery messages."""
+
+    messages: int = 0
+    unchanged: int = 0
+    processed: int = 0
+    started: float = 0.0
+    last_processed: float = 0.0
+
+
 @dataclass
 class MqttData:
     """Keep the MQTT entry data."""
@@ -331,6 +342,10 @@ class MqttData:
     device_triggers: dict[str, Trigger] = field(default_factory=dict)
     data_config_flow_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     discovery_already_discovered: set[tuple[str, str]] = field(default_factory=set)
+    discovery_metrics: DiscoveryMetrics = field(default_factory=DiscoveryMetrics)
+    discovery_payloads: dict[tuple[str, str], ReceivePayloadType] = field(
+        default_factory=dict
+    )
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
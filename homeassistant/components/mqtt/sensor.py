@@ -287,6 +287,8 @@ class MqttSensor(MqttEntity, RestoreSensor):
             "msg_callback": message_received,
             "qos": self._config[CONF_QOS],
             "encoding": self._config[CONF_ENCODING] or None,
+            # Only the newest retained state is of interest
+            "drop_superseded_retained": True,
         }
 
         self._sub_state = subscription.async_prepare_subscribe_topics(
@@ -25,6 +25,7 @@ class EntitySubscription:
     unsubscribe_callback: Callable[[], None] | None = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
+    drop_superseded_retained: bool = attr.ib(default=False)
 
     def resubscribe_if_necessary(
         self, hass: HomeAssistant, other: EntitySubscription | None
@@ -51,7 +52,12 @@ class EntitySubscription:
         debug_info.add_subscription(self.hass, self.message_callback, self.topic)
 
         self.subscribe_task = mqtt.async_subscribe(
-            hass, self.topic, self.message_callback, self.qos, self.encoding
+            hass,
+            self.topic,
+            self.message_callback,
+            self.qos,
+            self.encoding,
+            self.drop_superseded_retained,
         )
 
     async def subscribe(self) -> None:
@@ -69,10 +75,12 @@ class EntitySubscription:
             self.topic,
             self.qos,
             self.encoding,
+            self.drop_superseded_retained,
         ) != (
             other.topic,
             other.qos,
             other.encoding,
+            other.drop_superseded_retained,
         )
 
 
@@ -103,6 +111,7 @@ def async_prepare_subscribe_topics(
             unsubscribe_callback=None,
             qos=value.get("qos", DEFAULT_QOS),
             encoding=value.get("encoding", "utf-8"),
+            drop_superseded_retained=value.get("drop_superseded_retained", False),
             hass=hass,
             subscribe_task=None,
         )
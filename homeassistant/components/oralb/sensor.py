@@ -127,6 +127,9 @@ class OralBBluetoothSensorEntity(
 ):
     """Representation of a OralB sensor."""
 
+    # The assumed state changes with the availability of the processor
+    _cache_attributes = False
+
     @property
     def native_value(self) -> str | int | None:
         """Return the native value."""
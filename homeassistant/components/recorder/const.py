@@ -66,6 +66,11 @@ INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD = {
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
 }
 
+# Phases of compiling statistics which are timed for system health
+STATISTICS_COMPILE_COLLECT = "collect"
+STATISTICS_COMPILE_INSERT = "insert"
+STATISTICS_COMPILE_HOURLY = "hourly"
+
 
 class SupportedDialect(StrEnum):
     """Supported dialects."""
@@ -58,6 +58,7 @@ from .const import (
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_COMPILE_COLLECT,
     STATISTICS_ROWS_SCHEMA_VERSION,
     SupportedDialect,
 )
@@ -97,6 +98,7 @@ from .tasks import (
     AdjustStatisticsTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
+    CollectStatisticsTask,
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
@@ -107,6 +109,7 @@ from .tasks import (
     EventTask,
     EventTypeIDMigrationTask,
     ImportStatisticsTask,
+    InsertStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
@@ -223,6 +226,8 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # Seconds the last statistics compile phases took, by phase
+        self.statistics_compile_durations: dict[str, float] = {}
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -566,10 +571,50 @@ class Recorder(threading.Thread):
     def async_periodic_statistics(self) -> None:
         """Trigger the statistics run.
 
-        Short term statistics run every 5 minutes
+        Short term statistics run every 5 minutes. They are collected in
+        the database executor once the recorder has committed the pending
+        states, only writing them is done in the recorder thread.
         """
         start = statistics.get_start_time()
-        self.queue_task(StatisticsTask(start, True))
+        self.queue_task(CollectStatisticsTask(start))
+
+    async def async_collect_statistics(
+        self, start: datetime, platforms: list[tuple[str, Any]]
+    ) -> None:
+        """Collect the statistics of the platforms in parallel."""
+        collect_start = time.monotonic()
+        try:
+            compiled = await asyncio.gather(
+                *(
+                    self.async_add_executor_job(
+                        statistics.collect_platform_statistics,
+                        self,
+                        domain,
+                        platform,
+                        start,
+                    )
+                    for domain, platform in platforms
+                )
+            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug(
+                "Error collecting statistics for %s, compiling in recorder thread",
+                start,
+                exc_info=True,
+            )
+            self.queue_task(StatisticsTask(start, True))
+            return
+        self.statistics_compile_durations[STATISTICS_COMPILE_COLLECT] = (
+            time.monotonic() - collect_start
+        )
+        if any(platform_compiled is None for platform_compiled in compiled):
+            # Already compiled
+            return
+        self.queue_task(
+            InsertStatisticsTask(
+                start, True, cast(list[statistics.PlatformCompiledStatistics], compiled)
+            )
+        )
 
     @callback
     def async_adjust_statistics(
@@ -775,6 +820,7 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._enable_states_staging()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -851,6 +897,20 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _enable_states_staging(self) -> None:
+        """Stage new states for bulk inserts if the database supports it.
+
+        The staged rows are written with an executemany INSERT that
+        must return the new state_ids in the order the rows were passed
+        so they can be linked as the old_state_id of the next states.
+        """
+        assert self.engine is not None
+        if (
+            self.schema_version == SCHEMA_VERSION
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        ):
+            self.states_manager.enable_staging()
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -1072,6 +1132,10 @@ class Recorder(threading.Thread):
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
+        if self.states_manager.staged is not None:
+            self._stage_state_changed_event(event)
+            return
+
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
@@ -1111,21 +1175,111 @@ class Recorder(threading.Thread):
             # it either never existed or was just renamed.
             return
         else:
-            states_meta = StatesMeta(entity_id=entity_id)
-            states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
+            dbstate.states_meta_rel = self._add_pending_states_meta(session, entity_id)
 
         # Map the event data to the StateAttributes table
-        shared_attrs = shared_attrs_bytes.decode("utf-8")
         dbstate.attributes = None
+        attributes_id, pending_attributes = self._resolve_state_attributes(
+            session, shared_attrs_bytes
+        )
+        if attributes_id:
+            dbstate.attributes_id = attributes_id
+        else:
+            dbstate.state_attributes = pending_attributes
+
+        self._add_to_session(session, dbstate)
+        states_manager.history_cache.add_pending(
+            entity_id,
+            dbstate.state,
+            cast(float, dbstate.last_updated_ts),
+            dbstate.last_changed_ts,
+        )
+
+    def _stage_state_changed_event(self, event: Event) -> None:
+        """Stage a state_changed event for a bulk insert at commit time.
+
+        Resolves the same ids as _process_state_changed_event_into_session
+        without creating a States ORM object.
+        """
+        states_meta_manager = self.states_meta_manager
+        states_manager = self.states_manager
+        staged = states_manager.staged
+        assert staged is not None
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+
+        old_state_row = states_manager.pop_pending_row(entity_id)
+        old_state_id = (
+            None
+            if old_state_row is not None
+            else states_manager.pop_committed(entity_id)
+        )
+
+        if entity_id is None or not (
+            shared_attrs_bytes := self.state_attributes_manager.serialize_from_event(
+                event
+            )
+        ):
+            return
+
+        assert self.event_session is not None
+        session = self.event_session
+        # Map the entity_id to the StatesMeta table
+        metadata_id: int | None = None
+        if not (pending_states_meta := states_meta_manager.get_pending(entity_id)) and (
+            not (metadata_id := states_meta_manager.get(entity_id, session, True))
+        ):
+            if states_meta_manager.active and entity_removed:
+                # If the entity was removed, we don't need to add it to the
+                # StatesMeta table or record it in the pending commit
+                # if it does not have a metadata_id allocated to it as
+                # it either never existed or was just renamed.
+                return
+            pending_states_meta = self._add_pending_states_meta(session, entity_id)
+
+        # Map the event data to the StateAttributes table
+        attributes_id, pending_attributes = self._resolve_state_attributes(
+            session, shared_attrs_bytes
+        )
+
+        row = staged.append(
+            event,
+            None if states_meta_manager.active else entity_id,
+            metadata_id,
+            pending_states_meta,
+            attributes_id,
+            pending_attributes,
+            old_state_id,
+            -1 if old_state_row is None else old_state_row,
+        )
+        self._event_session_has_pending_writes = True
+        if not entity_removed:
+            states_manager.add_pending_row(entity_id, row)
+        states_manager.history_cache.add_pending(
+            entity_id,
+            staged.state[row],
+            staged.last_updated_ts[row],
+            staged.last_changed_ts[row],
+        )
+
+    def _add_pending_states_meta(self, session: Session, entity_id: str) -> StatesMeta:
+        """Add a new StatesMeta for an entity_id to the session."""
+        states_meta = StatesMeta(entity_id=entity_id)
+        self.states_meta_manager.add_pending(states_meta)
+        self._add_to_session(session, states_meta)
+        return states_meta
+
+    def _resolve_state_attributes(
+        self, session: Session, shared_attrs_bytes: bytes
+    ) -> tuple[int | None, StateAttributes | None]:
+        """Resolve serialized attributes to an attributes_id or a pending row."""
+        state_attributes_manager = self.state_attributes_manager
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
-        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            return None, pending_attributes
         # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
+        if (attributes_id := state_attributes_manager.get_from_cache(shared_attrs)) or (
             (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
             and (
                 attributes_id := state_attributes_manager.get(
@@ -1133,15 +1287,12 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
-        else:
-            # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
-
-        self._add_to_session(session, dbstate)
+            return attributes_id, None
+        # No matching attributes found, save them in the DB
+        dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+        state_attributes_manager.add_pending(dbstate_attributes)
+        self._add_to_session(session, dbstate_attributes)
+        return None, dbstate_attributes
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1180,6 +1331,7 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.states_manager.insert_staged(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
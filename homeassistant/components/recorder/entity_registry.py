@@ -69,3 +69,6 @@ def update_states_metadata(
                 entity_id,
                 new_entity_id,
             )
+
+    # The history of the old entity_id now belongs to the new one
+    instance.states_manager.history_cache.evict((entity_id, new_entity_id))
@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +16,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_chunks_with_session as _modern_get_significant_states_chunks_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_chunks_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -152,6 +154,55 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_chunks_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = 1000,
+) -> Iterator[MutableMapping[str, list[State | dict[str, Any]]]]:
+    """Yield significant states during a time period in per entity chunks."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        yield from _modern_get_significant_states_chunks_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            chunk_size,
+        )
+        return
+
+    # The legacy schema cannot be streamed so the
+    # result is only split up after it is fetched
+    for entity_id, states in get_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    ).items():
+        for idx in range(0, len(states), chunk_size):
+            yield {entity_id: states[idx : idx + chunk_size]}
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
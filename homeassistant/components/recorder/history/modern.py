@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from functools import partial
+from itertools import groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -20,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -35,7 +37,8 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
-from ..util import execute_stmt_lambda_element, session_scope
+from ..table_managers.states import HISTORY_CACHE_WINDOW
+from ..util import DEFAULT_YIELD_STATES_ROWS, execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -211,6 +214,45 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        prepared := _prepare_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, include_start_time_state = prepared
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        dt_util.utc_to_timestamp(start_time) if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _prepare_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], bool] | None:
+    """Build the significant states statement for the entity_ids.
+
+    Returns None if none of the entity_ids have ever been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +261,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,15 +299,68 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+    return stmt, entity_id_to_metadata_id, include_start_time_state
+
+
+def get_significant_states_chunks_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+) -> Iterator[MutableMapping[str, list[State | dict[str, Any]]]]:
+    """Yield significant states during UTC period start_time - end_time in chunks.
+
+    Each chunk holds at most chunk_size states of a single entity. The rows
+    are read from a server-side cursor as the chunks are consumed so the
+    memory used does not grow with the length of the period.
+
+    With minimal_response, the first state of every chunk is a full state.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        prepared := _prepare_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, entity_id_to_metadata_id, include_start_time_state = prepared
+    start_time_ts = (
+        dt_util.utc_to_timestamp(start_time) if include_start_time_state else None
     )
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    rows = session.connection().execute(
+        stmt,
+        execution_options={"stream_results": True, "yield_per": chunk_size},
+    )
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        while chunk := list(islice(group, chunk_size)):
+            yield _sorted_states_to_dict(
+                chunk,
+                start_time_ts,
+                [entity_id],
+                {entity_id: metadata_id},
+                minimal_response,
+                compressed_state_format,
+                no_attributes=no_attributes,
+            )
 
 
 def get_full_significant_states_with_session(
@@ -372,9 +467,28 @@ def state_changes_during_period(
     if not entity_id:
         raise ValueError("entity_id must be provided")
     entity_ids = [entity_id.lower()]
+    instance = recorder.get_instance(hass)
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    history_cache = instance.states_manager.history_cache
+    # Only the state and last_updated of the rows are cached
+    if (
+        no_attributes
+        and (
+            cached := history_cache.get(
+                entity_id, start_time_ts, end_time_ts, include_start_time_state, limit
+            )
+        )
+        is not None
+    ):
+        return _cached_states_to_dict(cached, entity_id, start_time_ts, descending)
 
     with session_scope(hass=hass, read_only=True) as session:
-        instance = recorder.get_instance(hass)
         if not (
             possible_metadata_id := instance.states_meta_manager.get(
                 entity_id, session, False
@@ -385,13 +499,25 @@ def state_changes_during_period(
         entity_id_to_metadata_id: dict[str, int | None] = {
             entity_id: single_metadata_id
         }
-        run_start_ts: float | None = None
-        if include_start_time_state and not (
-            run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
-        ):
-            include_start_time_state = False
-        start_time_ts = dt_util.utc_to_timestamp(start_time)
-        end_time_ts = datetime_to_timestamp_or_none(end_time)
+        now_ts = dt_util.utc_to_timestamp(dt_util.utcnow())
+        if no_attributes and start_time_ts >= now_ts - HISTORY_CACHE_WINDOW:
+            history_cache.load(
+                entity_id,
+                now_ts,
+                partial(_fetch_history_cache_rows, session, single_metadata_id),
+            )
+            if (
+                cached := history_cache.get(
+                    entity_id,
+                    start_time_ts,
+                    end_time_ts,
+                    include_start_time_state,
+                    limit,
+                )
+            ) is not None:
+                return _cached_states_to_dict(
+                    cached, entity_id, start_time_ts, descending
+                )
         stmt = lambda_stmt(
             lambda: _state_changed_during_period_stmt(
                 start_time_ts,
@@ -424,6 +550,74 @@ def state_changes_during_period(
         )
 
 
+def _cached_states_to_dict(
+    cached: list[tuple[str | None, float | None]],
+    entity_id: str,
+    start_time_ts: float,
+    descending: bool,
+) -> MutableMapping[str, list[State]]:
+    """Convert rows from the history cache to the state_changes_during_period result."""
+    if not cached:
+        return {}
+    states: list[State] = [
+        LazyState(
+            None,  # type: ignore[arg-type]
+            {},
+            start_time_ts,
+            entity_id,
+            state,  # type: ignore[arg-type]
+            last_updated_ts,
+            True,
+        )
+        for state, last_updated_ts in cached
+    ]
+    if descending:
+        states.reverse()
+    return {entity_id: states}
+
+
+def _history_cache_rows_stmt(metadata_id: int, cached_from: float) -> Select:
+    """Return the rows of an entity since cached_from and the last row before it."""
+    last_row_before = (
+        select(States.state, States.last_updated_ts, States.last_changed_ts)
+        .filter(
+            States.metadata_id == metadata_id,
+            States.last_updated_ts < cached_from,
+        )
+        .order_by(States.last_updated_ts.desc())
+        .limit(1)
+        .subquery()
+    )
+    rows = union_all(
+        select(
+            last_row_before.c.state,
+            last_row_before.c.last_updated_ts,
+            last_row_before.c.last_changed_ts,
+        ),
+        select(States.state, States.last_updated_ts, States.last_changed_ts).filter(
+            States.metadata_id == metadata_id,
+            States.last_updated_ts >= cached_from,
+        ),
+    ).subquery()
+    return select(
+        rows.c.state, rows.c.last_updated_ts, rows.c.last_changed_ts
+    ).order_by(rows.c.last_updated_ts)
+
+
+def _fetch_history_cache_rows(
+    session: Session, metadata_id: int, cached_from: float
+) -> Iterable[tuple[str | None, float, float | None]]:
+    """Fetch the rows of an entity for the history cache."""
+    return cast(
+        Iterable[tuple[str | None, float, float | None]],
+        execute_stmt_lambda_element(
+            session,
+            lambda_stmt(lambda: _history_cache_rows_stmt(metadata_id, cached_from)),
+            orm_rows=False,
+        ),
+    )
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False)
@@ -12,6 +12,7 @@ import logging
 from operator import itemgetter
 import re
 from statistics import mean
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
@@ -51,6 +52,9 @@ from .const import (
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    STATISTICS_COMPILE_COLLECT,
+    STATISTICS_COMPILE_HOURLY,
+    STATISTICS_COMPILE_INSERT,
     SupportedDialect,
 )
 from .db_schema import (
@@ -479,21 +483,107 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         )
 
     if modified_statistic_ids:
-        # In the rare case that we have modified statistic_ids, we reload the modified
-        # statistics meta data into the cache in a fresh session to ensure that the
-        # cache is up to date and future calls to get statistics meta data will
-        # not have to hit the database again.
-        with session_scope(session=instance.get_session(), read_only=True) as session:
-            instance.statistics_meta_manager.get_many(session, modified_statistic_ids)
+        _reload_modified_statistics_meta(instance, modified_statistic_ids)
 
     return True
 
 
+def collect_platform_statistics(
+    instance: Recorder, domain: str, platform: Any, start: datetime
+) -> PlatformCompiledStatistics | None:
+    """Collect 5-minute statistics of one platform without writing them.
+
+    This runs in the database executor with its own read only session,
+    so the platforms are collected in parallel and the recorder thread
+    only has to write the result with insert_compiled_statistics.
+
+    Returns None if the statistics for the period are already compiled.
+    """
+    end = start + timedelta(minutes=5)
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        if execute_stmt_lambda_element(session, _get_first_id_stmt(start)):
+            return None
+        return _compile_platform_statistics(
+            instance, session, domain, platform, start, end
+        )
+
+
+@retryable_database_job("insert compiled statistics")
+def insert_compiled_statistics(
+    instance: Recorder,
+    start: datetime,
+    fire_events: bool,
+    compiled: list[PlatformCompiledStatistics],
+) -> bool:
+    """Write 5-minute statistics collected by collect_platform_statistics."""
+    with session_scope(
+        session=instance.get_session(),
+        exception_filter=_filter_unique_constraint_integrity_error(instance),
+    ) as session:
+        # Statistics may have been compiled while they were collected
+        if execute_stmt_lambda_element(session, _get_first_id_stmt(start)):
+            _LOGGER.debug("Statistics already compiled for %s", start)
+            return True
+        modified_statistic_ids = _insert_compiled_statistics(
+            instance, session, start, fire_events, compiled
+        )
+
+    if modified_statistic_ids:
+        _reload_modified_statistics_meta(instance, modified_statistic_ids)
+
+    return True
+
+
+def _reload_modified_statistics_meta(
+    instance: Recorder, modified_statistic_ids: set[str]
+) -> None:
+    """Reload modified statistics meta data into the cache.
+
+    In the rare case that we have modified statistic_ids, we reload the modified
+    statistics meta data into the cache in a fresh session to ensure that the
+    cache is up to date and future calls to get statistics meta data will
+    not have to hit the database again.
+    """
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        instance.statistics_meta_manager.get_many(session, modified_statistic_ids)
+
+
 def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
     """Return a statement that returns the first run_id at start."""
     return lambda_stmt(lambda: select(StatisticsRuns.run_id).filter_by(start=start))
 
 
+def _compile_platform_statistics(
+    instance: Recorder,
+    session: Session,
+    domain: str,
+    platform: Any,
+    start: datetime,
+    end: datetime,
+) -> PlatformCompiledStatistics | None:
+    """Compile 5-minute statistics of one platform.
+
+    Returns None if the platform does not support compiling statistics.
+    """
+    if not (
+        platform_compile_statistics := getattr(
+            platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS, None
+        )
+    ):
+        return None
+    compiled: PlatformCompiledStatistics = platform_compile_statistics(
+        instance.hass, session, start, end
+    )
+    _LOGGER.debug(
+        "Statistics for %s during %s-%s: %s",
+        domain,
+        start,
+        end,
+        compiled.platform_stats,
+    )
+    return compiled
+
+
 def _compile_statistics(
     instance: Recorder, session: Session, start: datetime, fire_events: bool
 ) -> set[str]:
@@ -506,37 +596,50 @@ def _compile_statistics(
     """
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
     end = start + timedelta(minutes=5)
-    statistics_meta_manager = instance.statistics_meta_manager
-    modified_statistic_ids: set[str] = set()
 
     # Return if we already have 5-minute statistics for the requested period
     if execute_stmt_lambda_element(session, _get_first_id_stmt(start)):
         _LOGGER.debug("Statistics already compiled for %s-%s", start, end)
-        return modified_statistic_ids
+        return set()
 
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
-    platform_stats: list[StatisticResult] = []
-    current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
+    collect_start = time.monotonic()
     # Collect statistics from all platforms implementing support
-    for domain, platform in instance.hass.data[DOMAIN].recorder_platforms.items():
-        if not (
-            platform_compile_statistics := getattr(
-                platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS, None
+    compiled = [
+        platform_compiled
+        for domain, platform in instance.hass.data[DOMAIN].recorder_platforms.items()
+        if (
+            platform_compiled := _compile_platform_statistics(
+                instance, session, domain, platform, start, end
             )
-        ):
-            continue
-        compiled: PlatformCompiledStatistics = platform_compile_statistics(
-            instance.hass, session, start, end
-        )
-        _LOGGER.debug(
-            "Statistics for %s during %s-%s: %s",
-            domain,
-            start,
-            end,
-            compiled.platform_stats,
         )
-        platform_stats.extend(compiled.platform_stats)
-        current_metadata.update(compiled.current_metadata)
+        is not None
+    ]
+    instance.statistics_compile_durations[STATISTICS_COMPILE_COLLECT] = (
+        time.monotonic() - collect_start
+    )
+    return _insert_compiled_statistics(instance, session, start, fire_events, compiled)
+
+
+def _insert_compiled_statistics(
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    compiled: list[PlatformCompiledStatistics],
+) -> set[str]:
+    """Insert compiled 5-minute statistics and summarize a full hour.
+
+    returns a set of modified statistic_ids if any were modified.
+    """
+    insert_start = time.monotonic()
+    statistics_meta_manager = instance.statistics_meta_manager
+    modified_statistic_ids: set[str] = set()
+    platform_stats: list[StatisticResult] = []
+    current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
+    for platform_compiled in compiled:
+        platform_stats.extend(platform_compiled.platform_stats)
+        current_metadata.update(platform_compiled.current_metadata)
 
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
@@ -558,7 +661,11 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
+        hourly_start = time.monotonic()
         _compile_hourly_statistics(session, start)
+        instance.statistics_compile_durations[STATISTICS_COMPILE_HOURLY] = (
+            time.monotonic() - hourly_start
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -584,6 +691,9 @@ def _compile_statistics(
             )
         )
 
+    instance.statistics_compile_durations[STATISTICS_COMPILE_INSERT] = (
+        time.monotonic() - insert_start
+    )
     return modified_statistic_ids
 
 
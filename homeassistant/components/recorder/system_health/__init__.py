@@ -54,6 +54,15 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_statistics_info(instance: Recorder) -> dict[str, Any]:
+    """Get how long the last statistics compile took."""
+    return {
+        f"statistics_{phase}_duration": f"{duration:.2f} s"
+        for phase, duration in instance.statistics_compile_durations.items()
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -71,4 +80,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_statistics_info(instance)
@@ -1,7 +1,440 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import threading
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from ..db_schema import EVENT_ORIGIN_TO_IDX, StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+_INSERT_STATES_RETURNING_STATE_ID = insert(States).returning(
+    States.state_id, sort_by_parameter_order=True
+)
+
+# How far back the history of an entity is cached
+HISTORY_CACHE_WINDOW = 86400.0
+# The maximum number of state rows cached for all entities
+HISTORY_CACHE_MAX_ROWS = 200000
+
+
+class StagedStates:
+    """Stage new rows for the states table in column arrays.
+
+    Staged rows are written with one bulk INSERT per commit instead of
+    building and flushing a States ORM object for every state_changed event.
+    """
+
+    __slots__ = (
+        "entity_id",
+        "state",
+        "last_updated_ts",
+        "last_changed_ts",
+        "origin_idx",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "metadata_id",
+        "states_meta",
+        "attributes_id",
+        "state_attributes",
+        "old_state_id",
+        "old_state_row",
+        "state_ids",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the staged states."""
+        self.entity_id: list[str | None] = []
+        self.state: list[str | None] = []
+        self.last_updated_ts = array("d")
+        self.last_changed_ts: list[float | None] = []
+        self.origin_idx: list[int | None] = []
+        self.context_id_bin: list[bytes | None] = []
+        self.context_user_id_bin: list[bytes | None] = []
+        self.context_parent_id_bin: list[bytes | None] = []
+        self.metadata_id: list[int | None] = []
+        self.states_meta: list[StatesMeta | None] = []
+        self.attributes_id: list[int | None] = []
+        self.state_attributes: list[StateAttributes | None] = []
+        self.old_state_id: list[int | None] = []
+        # Index of the staged row holding the old state or -1
+        self.old_state_row = array("q")
+        self.state_ids: list[int | None] = []
+
+    def __len__(self) -> int:
+        """Return the number of staged rows."""
+        return len(self.state)
+
+    def append(
+        self,
+        event: Event,
+        entity_id: str | None,
+        metadata_id: int | None,
+        states_meta: StatesMeta | None,
+        attributes_id: int | None,
+        state_attributes: StateAttributes | None,
+        old_state_id: int | None,
+        old_state_row: int,
+    ) -> int:
+        """Stage a row from a state_changed event and return its index.
+
+        The column values mirror States.from_event.
+        """
+        state: State | None = event.data.get("new_state")
+        context = event.context
+        self.entity_id.append(entity_id)
+        if state is None:
+            # None state means the state was removed from the state machine
+            self.state.append(None)
+            self.last_updated_ts.append(dt_util.utc_to_timestamp(event.time_fired))
+            self.last_changed_ts.append(None)
+        else:
+            self.state.append(state.state)
+            self.last_updated_ts.append(dt_util.utc_to_timestamp(state.last_updated))
+            self.last_changed_ts.append(
+                None
+                if state.last_updated == state.last_changed
+                else dt_util.utc_to_timestamp(state.last_changed)
+            )
+        self.origin_idx.append(EVENT_ORIGIN_TO_IDX.get(event.origin))
+        self.context_id_bin.append(ulid_to_bytes_or_none(context.id))
+        self.context_user_id_bin.append(uuid_hex_to_bytes_or_none(context.user_id))
+        self.context_parent_id_bin.append(ulid_to_bytes_or_none(context.parent_id))
+        self.metadata_id.append(metadata_id)
+        self.states_meta.append(states_meta)
+        self.attributes_id.append(attributes_id)
+        self.state_attributes.append(state_attributes)
+        self.old_state_id.append(old_state_id)
+        self.old_state_row.append(old_state_row)
+        return len(self.state) - 1
+
+    def _params(self, row: int, state_ids: list[int | None]) -> dict[str, Any]:
+        """Build the insert parameters for a staged row."""
+        if (states_meta := self.states_meta[row]) is not None:
+            metadata_id: int | None = states_meta.metadata_id
+        else:
+            metadata_id = self.metadata_id[row]
+        if (state_attributes := self.state_attributes[row]) is not None:
+            attributes_id: int | None = state_attributes.attributes_id
+        else:
+            attributes_id = self.attributes_id[row]
+        if (old_state_row := self.old_state_row[row]) >= 0:
+            old_state_id = state_ids[old_state_row]
+        else:
+            old_state_id = self.old_state_id[row]
+        return {
+            "entity_id": self.entity_id[row],
+            "state": self.state[row],
+            "last_updated_ts": self.last_updated_ts[row],
+            "last_changed_ts": self.last_changed_ts[row],
+            "old_state_id": old_state_id,
+            "attributes_id": attributes_id,
+            "origin_idx": self.origin_idx[row],
+            "context_id_bin": self.context_id_bin[row],
+            "context_user_id_bin": self.context_user_id_bin[row],
+            "context_parent_id_bin": self.context_parent_id_bin[row],
+            "metadata_id": metadata_id,
+        }
+
+    def insert(self, session: Session) -> None:
+        """Insert the staged rows and collect their state_ids.
+
+        Pending StatesMeta and StateAttributes are flushed first so
+        their ids are known. Rows that link to an older row in the same
+        batch can only be written once that row has a state_id, so the
+        rows are inserted in generations: the first statement has every
+        row whose old state is already in the database, the next one the
+        rows that follow those, and so on.
+        """
+        session.flush()
+        rows = len(self.state)
+        generation_of_row = array("q", bytes(8 * rows))
+        generations: list[list[int]] = []
+        old_state_rows = self.old_state_row
+        for row in range(rows):
+            if (old_state_row := old_state_rows[row]) >= 0:
+                generation = generation_of_row[old_state_row] + 1
+                generation_of_row[row] = generation
+            else:
+                generation = 0
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(row)
+
+        # When the commit is retried after an error the generations
+        # inserted before are still part of the open transaction and
+        # must not be inserted again. If the transaction is rolled back
+        # instead the event session is reset which clears the rows.
+        state_ids = self.state_ids
+        if len(state_ids) != rows:
+            state_ids = self.state_ids = [None] * rows
+        for generation_rows in generations:
+            if state_ids[generation_rows[0]] is not None:
+                continue
+            result = session.execute(
+                _INSERT_STATES_RETURNING_STATE_ID,
+                [self._params(row, state_ids) for row in generation_rows],
+            )
+            for row, state_id in zip(generation_rows, result.scalars()):
+                state_ids[row] = state_id
+
+    def clear(self) -> None:
+        """Clear the staged rows."""
+        columns: tuple[list[Any], ...] = (
+            self.entity_id,
+            self.state,
+            self.last_changed_ts,
+            self.origin_idx,
+            self.context_id_bin,
+            self.context_user_id_bin,
+            self.context_parent_id_bin,
+            self.metadata_id,
+            self.states_meta,
+            self.attributes_id,
+            self.state_attributes,
+            self.old_state_id,
+            self.state_ids,
+        )
+        for column in columns:
+            column.clear()
+        del self.last_updated_ts[:]
+        del self.old_state_row[:]
+
+
+class _EntityHistory:
+    """The recent state rows of a single entity."""
+
+    __slots__ = ("states", "last_updated_ts", "significant", "cached_from", "loading")
+
+    def __init__(self, cached_from: float) -> None:
+        """Initialize the entity history."""
+        self.states: list[str | None] = []
+        self.last_updated_ts = array("d")
+        # 1 if last_changed_ts is last_updated_ts, these are the
+        # rows state_changes_during_period returns
+        self.significant = array("b")
+        # Every row at or after cached_from is in the arrays
+        # together with the last row before it, if there is one
+        self.cached_from = cached_from
+        # Rows committed while the entity is loaded from the database
+        self.loading: list[tuple[str | None, float, bool]] | None = []
+
+    def add(self, state: str | None, last_updated_ts: float, significant: bool) -> None:
+        """Add a row in last_updated_ts order."""
+        times = self.last_updated_ts
+        if not times or last_updated_ts >= times[-1]:
+            self.states.append(state)
+            times.append(last_updated_ts)
+            self.significant.append(significant)
+            return
+        idx = bisect_right(times, last_updated_ts)
+        self.states.insert(idx, state)
+        times.insert(idx, last_updated_ts)
+        self.significant.insert(idx, significant)
+
+    def trim(self, cached_from: float) -> int:
+        """Drop the rows before cached_from except the last one and return the count."""
+        self.cached_from = cached_from
+        if (idx := bisect_left(self.last_updated_ts, cached_from) - 1) <= 0:
+            return 0
+        del self.states[:idx]
+        del self.last_updated_ts[:idx]
+        del self.significant[:idx]
+        return idx
+
+
+class StatesHistoryCache:
+    """Cache the recent state rows of the entities history is requested for.
+
+    Rows are added from the commit path of the recorder so the cache
+    never has to go back to the database once an entity is loaded.
+    The cache is bounded by HISTORY_CACHE_MAX_ROWS and the least
+    recently requested entities are evicted first.
+    """
+
+    def __init__(
+        self,
+        window: float = HISTORY_CACHE_WINDOW,
+        max_rows: int = HISTORY_CACHE_MAX_ROWS,
+    ) -> None:
+        """Initialize the history cache."""
+        self._window = window
+        self._max_rows = max_rows
+        self._lock = threading.Lock()
+        self._entities: OrderedDict[str, _EntityHistory] = OrderedDict()
+        self._pending: list[tuple[str, str | None, float, bool]] = []
+        self._rows = 0
+
+    def add_pending(
+        self,
+        entity_id: str,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+    ) -> None:
+        """Add a state row that is in the session but not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append(
+            (
+                entity_id,
+                state,
+                last_updated_ts,
+                last_changed_ts is None or last_changed_ts == last_updated_ts,
+            )
+        )
+
+    def post_commit_pending(self) -> None:
+        """Add the committed rows to the cached entities.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (entities := self._entities):
+            self._pending.clear()
+            return
+        with self._lock:
+            for entity_id, state, last_updated_ts, significant in self._pending:
+                if (history := entities.get(entity_id)) is None:
+                    continue
+                if history.loading is not None:
+                    history.loading.append((state, last_updated_ts, significant))
+                    continue
+                history.add(state, last_updated_ts, significant)
+                self._rows += 1
+                if last_updated_ts - history.cached_from > 2 * self._window:
+                    self._rows -= history.trim(last_updated_ts - self._window)
+            self._pending.clear()
+            self._evict_overflow()
+
+    def reset(self) -> None:
+        """Drop all cached entities and pending rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            self._entities.clear()
+            self._pending.clear()
+            self._rows = 0
+
+    def evict(self, entity_ids: Iterable[str]) -> None:
+        """Evict entities from the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            for entity_id in entity_ids:
+                if history := self._entities.pop(entity_id, None):
+                    self._rows -= len(history.states)
+
+    def _evict_overflow(self) -> None:
+        """Evict the least recently used entities while over the row budget.
+
+        Must be called with the lock held.
+        """
+        entities = self._entities
+        while self._rows > self._max_rows and len(entities) > 1:
+            self._rows -= len(entities.popitem(last=False)[1].states)
+
+    def load(
+        self,
+        entity_id: str,
+        now: float,
+        fetch_rows: Callable[[float], Iterable[tuple[str | None, float, float | None]]],
+    ) -> None:
+        """Load the recent rows of an entity into the cache.
+
+        fetch_rows is called with the start of the cached period and
+        must return the state, last_updated_ts and last_changed_ts of
+        the last row before it and every row after it, in order.
+        Rows committed while fetching are merged in afterwards.
+        """
+        cached_from = now - self._window
+        with self._lock:
+            if entity_id in self._entities:
+                return
+            self._entities[entity_id] = history = _EntityHistory(cached_from)
+        try:
+            rows = list(fetch_rows(cached_from))
+        except BaseException:
+            with self._lock:
+                if self._entities.get(entity_id) is history:
+                    del self._entities[entity_id]
+            raise
+        with self._lock:
+            if self._entities.get(entity_id) is not history:
+                # The cache was reset while loading
+                return
+            for state, last_updated_ts, last_changed_ts in rows:
+                history.add(
+                    state,
+                    last_updated_ts,
+                    last_changed_ts is None or last_changed_ts == last_updated_ts,
+                )
+            assert history.loading is not None
+            times = history.last_updated_ts
+            for state, last_updated_ts, significant in history.loading:
+                # Rows committed before the fetch are already included
+                if not times or last_updated_ts > times[-1]:
+                    history.add(state, last_updated_ts, significant)
+            history.loading = None
+            self._rows += len(history.states)
+            self._evict_overflow()
+
+    def get(
+        self,
+        entity_id: str,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+        limit: int | None,
+    ) -> list[tuple[str | None, float | None]] | None:
+        """Return the state changes of an entity during a period.
+
+        Returns None if the period is not cached. The state at the
+        start time is returned with a last_updated_ts of None.
+        """
+        with self._lock:
+            if (
+                (history := self._entities.get(entity_id)) is None
+                or history.loading is not None
+                or start_time_ts < history.cached_from
+            ):
+                return None
+            self._entities.move_to_end(entity_id)
+            states = history.states
+            times = history.last_updated_ts
+            significant = history.significant
+            start = bisect_right(times, start_time_ts)
+            end = len(times) if end_time_ts is None else bisect_left(times, end_time_ts)
+            result: list[tuple[str | None, float | None]] = []
+            if include_start_time_state and (
+                start_idx := bisect_left(times, start_time_ts)
+            ):
+                result.append((states[start_idx - 1], None))
+            changes = 0
+            for idx in range(start, end):
+                if not significant[idx]:
+                    continue
+                if limit and changes == limit:
+                    break
+                result.append((states[idx], times[idx]))
+                changes += 1
+            return result
 
 
 class StatesManager:
@@ -10,7 +443,22 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_rows: dict[str, int] = {}
         self._last_committed_id: dict[str, int] = {}
+        self.staged: StagedStates | None = None
+        self.history_cache = StatesHistoryCache()
+
+    def enable_staging(self) -> None:
+        """Stage new states in column arrays instead of ORM objects.
+
+        This should only be enabled when the database supports
+        returning the ids of an executemany INSERT in parameter order.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self.staged is None:
+            self.staged = StagedStates()
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -22,6 +470,14 @@ class StatesManager:
         """
         return self._pending.pop(entity_id, None)
 
+    def pop_pending_row(self, entity_id: str) -> int | None:
+        """Pop the index of a pending staged row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_rows.pop(entity_id, None)
+
     def pop_committed(self, entity_id: str) -> int | None:
         """Pop a committed state.
 
@@ -43,6 +499,23 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_row(self, entity_id: str, row: int) -> None:
+        """Add the index of a pending staged row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows[entity_id] = row
+
+    def insert_staged(self, session: Session) -> None:
+        """Insert the staged rows before the session is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self.staged:
+            self.staged.insert(session)
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -52,6 +525,14 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        if (staged := self.staged) is not None:
+            state_ids = staged.state_ids
+            for entity_id, row in self._pending_rows.items():
+                if (state_id := state_ids[row]) is not None:
+                    self._last_committed_id[entity_id] = state_id
+            self._pending_rows.clear()
+            staged.clear()
+        self.history_cache.post_commit_pending()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +542,10 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
+        if self.staged is not None:
+            self.staged.clear()
+        self.history_cache.reset()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -80,6 +565,9 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+        # The cached rows may include purged states
+        self.history_cache.reset()
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -89,3 +577,4 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+        self.history_cache.evict(purged_entity_ids)
@@ -14,7 +14,7 @@ from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_COMPILE_STATISTICS
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -168,6 +168,48 @@ class StatisticsTask(RecorderTask):
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
 
 
+@dataclass(slots=True)
+class CollectStatisticsTask(RecorderTask):
+    """An object to insert into the recorder queue to collect statistics.
+
+    Statistics are collected in the database executor once the states
+    queued before this task have been committed.
+    """
+
+    start: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Start collecting statistics."""
+        platforms = [
+            (domain, platform)
+            for domain, platform in instance.hass.data[
+                DOMAIN
+            ].recorder_platforms.items()
+            if hasattr(platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS)
+        ]
+        instance.hass.add_job(instance.async_collect_statistics, self.start, platforms)
+
+
+@dataclass(slots=True)
+class InsertStatisticsTask(RecorderTask):
+    """An object to insert into the recorder queue to write collected statistics."""
+
+    start: datetime
+    fire_events: bool
+    compiled: list[statistics.PlatformCompiledStatistics]
+
+    def run(self, instance: Recorder) -> None:
+        """Write the collected statistics."""
+        if statistics.insert_compiled_statistics(
+            instance, self.start, self.fire_events, self.compiled
+        ):
+            return
+        # Schedule a new insert task if this one didn't finish
+        instance.queue_task(
+            InsertStatisticsTask(self.start, self.fire_events, self.compiled)
+        )
+
+
 @dataclass(slots=True)
 class CompileMissingStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a compile missing statistics."""
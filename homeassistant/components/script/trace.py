@@ -6,9 +6,9 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
     async_store_trace,
+    async_trace_finished,
 )
 from homeassistant.core import Context, HomeAssistant
 
@@ -32,7 +32,7 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    async_store_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -43,3 +43,4 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+            async_trace_finished(hass, trace, trace_config)
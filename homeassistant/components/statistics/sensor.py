@@ -1,13 +1,13 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -183,6 +183,15 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics which are read from the sorted sample values
+STATS_SORTED_VALUES = {
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -271,6 +280,153 @@ async def async_setup_platform(
     )
 
 
+class SampleWindow:
+    """Hold the samples of a statistics sensor and their running aggregates.
+
+    The aggregates are updated when a sample enters or leaves the window,
+    so characteristics do not need a pass over all samples on every update.
+    Sums and the variance (Welford's algorithm) are recalculated from the
+    samples whenever as many samples have left the window as it holds, to
+    keep floating point errors from adding up.
+    """
+
+    def __init__(
+        self, max_size: int | None, sorted_values: bool, circular: bool
+    ) -> None:
+        """Initialize the sample window."""
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self.sorted_values: list[float | bool] | None = [] if sorted_values else None
+        self._max_size = max_size
+        self._circular = circular
+        self._removed = 0
+        self.sum: float = 0
+        self.mean: float = 0
+        self.m2: float = 0
+        self.sin_sum: float = 0
+        self.cos_sum: float = 0
+        self.sum_differences: float = 0
+        self.sum_differences_nonnegative: float = 0
+        self.area_linear: float = 0
+        self.area_step: float = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest one if the window is full."""
+        states = self.states
+        if self._max_size is not None and len(states) >= self._max_size:
+            self.popleft()
+        if states:
+            self._add_pair(states[-1], value, (age - self.ages[-1]).total_seconds(), 1)
+        states.append(value)
+        self.ages.append(age)
+        self._add_value(value)
+        if self.sorted_values is not None:
+            insort(self.sorted_values, value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        states = self.states
+        ages = self.ages
+        value = states.popleft()
+        age = ages.popleft()
+        if self.sorted_values is not None:
+            del self.sorted_values[bisect_left(self.sorted_values, value)]
+        if not states:
+            self._reset()
+            return
+        self._add_pair(value, states[0], (ages[0] - age).total_seconds(), -1)
+        self._remove_value(value)
+        self._removed += 1
+        if self._removed >= len(states):
+            self._recalculate()
+
+    def _add_pair(self, first: float, second: float, seconds: float, sign: int) -> None:
+        """Add or remove the aggregates of two consecutive samples."""
+        self.sum_differences += sign * abs(second - first)
+        self.sum_differences_nonnegative += sign * (
+            second - first if second >= first else second
+        )
+        self.area_linear += sign * 0.5 * (first + second) * seconds
+        self.area_step += sign * first * seconds
+
+    def _add_value(self, value: float) -> None:
+        """Add a sample to the running sums."""
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / len(self.states)
+        self.m2 += delta * (value - self.mean)
+        if self._circular:
+            self.sin_sum += math.sin(math.radians(value))
+            self.cos_sum += math.cos(math.radians(value))
+
+    def _remove_value(self, value: float) -> None:
+        """Remove a sample from the running sums."""
+        self.sum -= value
+        delta = value - self.mean
+        self.mean -= delta / len(self.states)
+        self.m2 -= delta * (value - self.mean)
+        if self._circular:
+            self.sin_sum -= math.sin(math.radians(value))
+            self.cos_sum -= math.cos(math.radians(value))
+
+    def _reset(self) -> None:
+        """Reset the running aggregates."""
+        self._removed = 0
+        self.sum = self.mean = self.m2 = 0
+        self.sin_sum = self.cos_sum = 0
+        self.sum_differences = self.sum_differences_nonnegative = 0
+        self.area_linear = self.area_step = 0
+
+    def _recalculate(self) -> None:
+        """Recalculate the running aggregates from the samples."""
+        states = self.states
+        ages = self.ages
+        self._reset()
+        count = 0
+        for value in states:
+            count += 1
+            self.sum += value
+            delta = value - self.mean
+            self.mean += delta / count
+            self.m2 += delta * (value - self.mean)
+            if self._circular:
+                self.sin_sum += math.sin(math.radians(value))
+                self.cos_sum += math.cos(math.radians(value))
+        for i in range(1, len(states)):
+            self._add_pair(
+                states[i - 1], states[i], (ages[i] - ages[i - 1]).total_seconds(), 1
+            )
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, needs at least two samples."""
+        return max(self.m2, 0) / (len(self.states) - 1)
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, needs at least two samples and sorted values.
+
+        Same as statistics.quantiles(n=100, method="exclusive").
+        """
+        data = cast(list[float], self.sorted_values)
+        size = len(data)
+        position = percentile * (size + 1)
+        idx = min(max(position // 100, 1), size - 1)
+        delta = position - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
+
+    def median(self) -> float:
+        """Return the median, needs at least one sample and sorted values."""
+        data = cast(list[float], self.sorted_values)
+        size = len(data)
+        if size % 2:
+            return data[size // 2]
+        return (data[size // 2 - 1] + data[size // 2]) / 2
+
+
 class StatisticsSensor(SensorEntity):
     """Representation of a Statistics sensor."""
 
@@ -303,8 +459,13 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.samples = SampleWindow(
+            self._samples_max_buffer_size,
+            not self.is_binary and state_characteristic in STATS_SORTED_VALUES,
+            not self.is_binary and state_characteristic == STAT_MEAN_CIRCULAR,
+        )
+        self.states = self.samples.states
+        self.ages = self.samples.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[
@@ -356,10 +517,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self.samples.append(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self.samples.append(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -467,8 +627,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self.samples.popleft()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -599,27 +758,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self.samples.area_linear / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self.samples.area_step / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -677,24 +823,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            sorted_values = cast(list[float], self.samples.sorted_values)
+            return sorted_values[-1] - sorted_values[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self.samples.sum / len(self.states)
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+            sin_sum = self.samples.sin_sum
+            cos_sum = self.samples.cos_sum
             return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self.samples.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -704,35 +851,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self.samples.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self.samples.variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self.samples.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum
+            return self.samples.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum_nn = sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum_nn
+            return self.samples.sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -740,27 +879,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return cast(list[float], self.samples.sorted_values)[-1]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return cast(list[float], self.samples.sorted_values)[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self.samples.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            # The step area of the on (1) and off (0) samples
+            on_seconds = self.samples.area_step
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -772,10 +909,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return int(self.samples.sum)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - int(self.samples.sum)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -785,5 +922,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self.samples.sum
         return None
@@ -1,6 +1,7 @@
 """Support for script and automation tracing and debugging."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
 import logging
 from typing import Any
@@ -18,11 +19,17 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_EVERY,
+    CONF_SLOW_RUN,
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_EVERY,
     DEFAULT_STORED_TRACES,
+    MAX_TRACE_ELEMENTS,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -31,10 +38,19 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "trace"
 
 STORAGE_KEY = "trace.saved_traces"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+
+# Keys of the extended dict of a trace which are not in the short dict
+_EXTENDED_KEYS = ("trace", "config", "blueprint_inputs", "context")
+# Keys of the extended dict which are stored once per script or automation
+_SHARED_KEYS = ("config", "blueprint_inputs")
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_SAMPLE_EVERY, default=DEFAULT_SAMPLE_EVERY): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_SLOW_RUN): cv.positive_time_period,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -47,13 +63,125 @@ def _get_data(hass: HomeAssistant) -> TraceData:
     return hass.data[DATA_TRACE]
 
 
+def _compact_traces(extended_dicts: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the stored form of the traces of a script or automation.
+
+    The short dicts are not stored since they are part of the extended
+    dicts, and the configuration is stored once unless it was changed.
+    """
+    shared = {key: extended_dicts[-1][key] for key in _SHARED_KEYS}
+    return {
+        **shared,
+        "traces": [
+            {
+                key: value
+                for key, value in extended_dict.items()
+                if key not in shared or value != shared[key]
+            }
+            for extended_dict in extended_dicts
+        ],
+    }
+
+
+def _expand_trace(
+    saved_trace: dict[str, Any], saved_traces: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the dictionary version of a stored trace."""
+    extended_dict = {key: saved_traces[key] for key in _SHARED_KEYS} | saved_trace
+    return {
+        "extended_dict": extended_dict,
+        "short_dict": {
+            key: value
+            for key, value in extended_dict.items()
+            if key not in _EXTENDED_KEYS
+        },
+    }
+
+
+class TraceStore(Store[dict[str, dict[str, Any]]]):
+    """Store traces of scripts and automations."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate to the new version."""
+        if old_major_version == 1:
+            # Version 2 stores the configuration once per script or automation
+            old_data = {
+                key: _compact_traces([trace["extended_dict"] for trace in traces])
+                for key, traces in old_data.items()
+                if traces
+            }
+        return old_data
+
+
+class TraceBudget:
+    """Keep the trace elements of the finished traces within a budget.
+
+    The oldest finished traces are evicted when the budget is exceeded,
+    variables of a trace which are equal to those of previous traces of
+    the same script or automation are shared with them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the budget."""
+        self._hass = hass
+        self._max_elements = MAX_TRACE_ELEMENTS
+        self._element_counts: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._trace_counts: dict[str, int] = {}
+        self._shared_variables: dict[str, dict[str, Any]] = {}
+        self.element_count = 0
+
+    @callback
+    def async_add(self, trace: BaseTrace, oldest: bool = False) -> None:
+        """Add a finished trace and evict traces if over budget."""
+        key = trace.key
+        trace_id = (key, trace.run_id)
+        self.async_discard(*trace_id)
+        if isinstance(trace, ActionTrace):
+            trace.share_variables(self._shared_variables.setdefault(key, {}))
+        self._element_counts[trace_id] = element_count = trace.element_count
+        self._trace_counts[key] = self._trace_counts.get(key, 0) + 1
+        self.element_count += element_count
+        if oldest:
+            self._element_counts.move_to_end(trace_id, last=False)
+
+        data = _get_data(self._hass)
+        # Keep at least the newest trace no matter how large it is
+        while self.element_count > self._max_elements and len(self._element_counts) > 1:
+            (key, run_id), element_count = self._element_counts.popitem(last=False)
+            self._async_removed(key, element_count)
+            if traces := data.get(key):
+                traces.pop(run_id, None)
+
+    @callback
+    def async_discard(self, key: str, run_id: str) -> None:
+        """Discard a trace which was evicted."""
+        if (element_count := self._element_counts.pop((key, run_id), None)) is not None:
+            self._async_removed(key, element_count)
+
+    @callback
+    def _async_removed(self, key: str, element_count: int) -> None:
+        """Account for a removed trace.
+
+        The shared variables of a script or automation are dropped
+        together with its last trace.
+        """
+        self.element_count -= element_count
+        if (trace_count := self._trace_counts[key] - 1) > 0:
+            self._trace_counts[key] = trace_count
+            return
+        del self._trace_counts[key]
+        self._shared_variables.pop(key, None)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_BUDGET] = TraceBudget(hass)
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
-    store = Store[dict[str, list]](
-        hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
-    )
+    store = TraceStore(hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder)
     hass.data[DATA_TRACE_STORE] = store
 
     async def _async_store_traces_at_stop(_: Event) -> None:
@@ -61,7 +189,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.debug("Storing traces")
         try:
             await store.async_save(
-                {key: list(traces.values()) for key, traces in _get_data(hass).items()}
+                {
+                    key: _compact_traces(
+                        [trace.as_extended_dict() for trace in traces.values()]
+                    )
+                    for key, traces in _get_data(hass).items()
+                    if traces
+                }
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error storing traces", exc_info=exc)
@@ -138,17 +272,58 @@ async def async_list_traces(
     return traces
 
 
-def async_store_trace(
+def _async_add_trace(
     hass: HomeAssistant, trace: ActionTrace, stored_traces: int
 ) -> None:
-    """Store a trace if its key is valid."""
+    """Add a trace, evicting the oldest traces of its key if needed."""
+    key = trace.key
+    traces = _get_data(hass)
+    if key not in traces:
+        traces[key] = LimitedSizeDict(size_limit=stored_traces)
+    else:
+        traces[key].size_limit = stored_traces
+    key_traces = traces[key]
+    budget: TraceBudget = hass.data[DATA_TRACE_BUDGET]
+    while key_traces and len(key_traces) >= stored_traces:
+        run_id, _ = key_traces.popitem(last=False)
+        budget.async_discard(key, run_id)
+    key_traces[trace.run_id] = trace
+
+
+def async_store_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store a trace if its key is valid and the run is sampled."""
     if key := trace.key:
-        traces = _get_data(hass)
-        if key not in traces:
-            traces[key] = LimitedSizeDict(size_limit=stored_traces)
-        else:
-            traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+        run = runs[key] = runs.get(key, 0) + 1
+        if (run - 1) % trace_config[CONF_SAMPLE_EVERY] == 0:
+            _async_add_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_trace_finished(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Account for a finished trace.
+
+    The trace of a run which was not sampled is stored if the run
+    failed or took longer than the slow run threshold.
+    """
+    if not (key := trace.key):
+        return
+    traces = _get_data(hass)
+    if (key not in traces or trace.run_id not in traces[key]) and (
+        trace.failed
+        or (
+            (slow_run := trace_config.get(CONF_SLOW_RUN)) is not None
+            and trace.duration >= slow_run
+        )
+    ):
+        _async_add_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if key in traces and traces[key].get(trace.run_id) is trace:
+        budget: TraceBudget = hass.data[DATA_TRACE_BUDGET]
+        budget.async_add(trace)
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -159,6 +334,8 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
         traces[key] = LimitedSizeDict()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
+    budget: TraceBudget = hass.data[DATA_TRACE_BUDGET]
+    budget.async_add(trace, oldest=True)
 
 
 async def async_restore_traces(hass: HomeAssistant) -> None:
@@ -168,16 +345,16 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
 
     hass.data[DATA_TRACES_RESTORED] = True
 
-    store: Store[dict[str, list]] = hass.data[DATA_TRACE_STORE]
+    store: TraceStore = hass.data[DATA_TRACE_STORE]
     try:
         restored_traces = await store.async_load() or {}
     except HomeAssistantError:
         _LOGGER.exception("Error loading traces")
         restored_traces = {}
 
-    for key, traces in restored_traces.items():
+    for key, saved_traces in restored_traces.items():
         # Add stored traces in reversed order to priorize the newest traces
-        for json_trace in reversed(traces):
+        for saved_trace in reversed(saved_traces["traces"]):
             if (
                 (stored_traces := _get_data(hass).get(key))
                 and stored_traces.size_limit is not None
@@ -186,7 +363,7 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
                 break
 
             try:
-                trace = RestoredTrace(json_trace)
+                trace = RestoredTrace(_expand_trace(saved_trace, saved_traces))
             # Catch any exception to not blow up if the stored trace is invalid
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Failed to restore trace")
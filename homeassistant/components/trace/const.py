@@ -1,7 +1,14 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_SAMPLE_EVERY = "sample_every"
+CONF_SLOW_RUN = "slow_run"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_BUDGET = "trace_budget"
+DATA_TRACE_RUNS = "trace_runs"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_EVERY = 1  # Store the trace of every run
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+# The maximum number of trace elements of the finished traces kept in memory
+MAX_TRACE_ELEMENTS = 50000
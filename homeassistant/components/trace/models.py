@@ -36,6 +36,11 @@ class BaseTrace(abc.ABC):
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
 
+    @property
+    @abc.abstractmethod
+    def element_count(self) -> int:
+        """Return the number of trace elements."""
+
     @abc.abstractmethod
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
@@ -85,6 +90,35 @@ class ActionTrace(BaseTrace):
         self._state = "stopped"
         self._script_execution = script_execution_get()
 
+    @property
+    def element_count(self) -> int:
+        """Return the number of trace elements."""
+        if not self._trace:
+            return 0
+        return sum(len(trace_list) for trace_list in self._trace.values())
+
+    @property
+    def failed(self) -> bool:
+        """Return if the run ended with an error."""
+        return self._error is not None or self._script_execution == "error"
+
+    @property
+    def duration(self) -> dt.timedelta:
+        """Return the duration of the run, or how long it has been running."""
+        return (self._timestamp_finish or dt_util.utcnow()) - self._timestamp_start
+
+    def share_variables(self, shared_variables: dict[str, Any]) -> None:
+        """Share variables which are equal to ones of previous traces.
+
+        Variable snapshots which did not change between runs of the same
+        script or automation are then only kept in memory once.
+        """
+        if not self._trace:
+            return
+        for trace_list in self._trace.values():
+            for item in trace_list:
+                item.share_variables(shared_variables)
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
         if self._dict:
@@ -165,6 +199,11 @@ class RestoredTrace(BaseTrace):
         """Return an extended dictionary version of this RestoredTrace."""
         return self._dict
 
+    @property
+    def element_count(self) -> int:
+        """Return the number of trace elements."""
+        return sum(len(trace_list) for trace_list in self._dict["trace"].values())
+
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
         return self._short_dict
@@ -357,26 +357,96 @@ def _send_handle_get_states_response(
     )
 
 
+_EntitySubscription = tuple[Callable[[str | dict[str, Any]], None], set[str], User]
+
+
+class _EntitySubscriptionFanout:
+    """Forward state changed events to all subscribe_entities subscriptions.
+
+    A single listener serves every connection. Clients like the frontend
+    use the same id for the subscription on every connection so the
+    message is built once per id and the same string is queued for all
+    of them.
+    """
+
+    __slots__ = ("_hass", "_subscriptions", "_groups", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the fanout."""
+        self._hass = hass
+        self._subscriptions: dict[int, dict[object, _EntitySubscription]] = {}
+        # Immutable snapshot of the subscriptions grouped by id so a
+        # subscription can be removed while an event is forwarded
+        self._groups: tuple[tuple[int, tuple[_EntitySubscription, ...]], ...] = ()
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        msg_id: int,
+        subscription: _EntitySubscription,
+    ) -> Callable[[], None]:
+        """Subscribe to state changed events."""
+        token = object()
+        self._subscriptions.setdefault(msg_id, {})[token] = subscription
+        self._async_update_groups()
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            subscriptions = self._subscriptions[msg_id]
+            del subscriptions[token]
+            if not subscriptions:
+                del self._subscriptions[msg_id]
+            self._async_update_groups()
+            if not self._subscriptions and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_update_groups(self) -> None:
+        """Update the snapshot of the subscriptions."""
+        self._groups = tuple(
+            (msg_id, tuple(subscriptions.values()))
+            for msg_id, subscriptions in self._subscriptions.items()
+        )
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        for msg_id, subscriptions in self._groups:
+            message: str | None = None
+            for send_message, entity_ids, user in subscriptions:
+                if entity_ids and entity_id not in entity_ids:
+                    continue
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                permissions = user.permissions
+                if not permissions.access_all_entities(
+                    POLICY_READ
+                ) and not permissions.check_entity(entity_id, POLICY_READ):
+                    continue
+                if message is None:
+                    message = messages.cached_state_diff_message(msg_id, event)
+                send_message(message)
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+def _async_get_entity_subscription_fanout(
+    hass: HomeAssistant,
+) -> _EntitySubscriptionFanout:
+    """Return the fanout for the subscribe_entities subscriptions."""
+    if (fanout := hass.data.get(const.DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        fanout = hass.data[const.DATA_ENTITY_SUBSCRIPTIONS] = _EntitySubscriptionFanout(
+            hass
+        )
+    return cast(_EntitySubscriptionFanout, fanout)
 
 
 @callback
@@ -395,17 +465,9 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
-    )
+    connection.subscriptions[msg["id"]] = _async_get_entity_subscription_fanout(
+        hass
+    ).async_subscribe(msg["id"], (connection.send_message, entity_ids, connection.user))
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
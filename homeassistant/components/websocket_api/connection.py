@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -45,6 +45,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_drain",
     )
 
     def __init__(
@@ -54,6 +55,7 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        drain: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -69,6 +71,7 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._drain = drain
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -123,6 +126,11 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    async def async_drain(self) -> None:
+        """Wait until the messages sent so far were written to the client."""
+        if self._drain is not None:
+            await self._drain()
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -239,6 +247,7 @@ class ActiveConnection:
                 )
         self.subscriptions.clear()
         self.send_message = self._connect_closed_error
+        self._drain = None
         current_request.set(None)
         current_connection.set(None)
 
@@ -49,4 +49,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the subscribe_entities fanout
+DATA_ENTITY_SUBSCRIPTIONS: Final = f"{DOMAIN}.entity_subscriptions"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
@@ -75,6 +75,8 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_queued_messages",
+        "_drain_waiters",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -96,6 +98,10 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[str | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # The number of messages ever queued, the messages queued
+        # before a drain are written once the writer gets past them
+        self._queued_messages = 0
+        self._drain_waiters: list[tuple[int, asyncio.Future[None]]] = []
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -149,6 +155,8 @@ class WebSocketHandler:
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
                     await send_str(message)
+                    if self._drain_waiters:
+                        self._release_drain_waiters()
                     continue
 
                 messages: list[str] = [message]
@@ -163,6 +171,8 @@ class WebSocketHandler:
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_str(coalesced_messages)
+                if self._drain_waiters:
+                    self._release_drain_waiters()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -172,6 +182,29 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # Nothing more will be written
+            self._release_drain_waiters(True)
+
+    @callback
+    def _release_drain_waiters(self, closed: bool = False) -> None:
+        """Release the drain waiters whose messages were written."""
+        written = self._queued_messages - len(self._message_queue)
+        waiters = self._drain_waiters
+        self._drain_waiters = []
+        for queued, future in waiters:
+            if closed or queued <= written:
+                if not future.done():
+                    future.set_result(None)
+            else:
+                self._drain_waiters.append((queued, future))
+
+    async def _async_drain(self) -> None:
+        """Wait until the messages queued so far were written to the client."""
+        if self._closing or not self._message_queue:
+            return
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        self._drain_waiters.append((self._queued_messages, future))
+        await future
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -213,6 +246,7 @@ class WebSocketHandler:
             return
 
         message_queue.append(message)
+        self._queued_messages += 1
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -291,7 +325,14 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            self._async_drain,
+        )
         connection = None
         disconnect_warn = None
 
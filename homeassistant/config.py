@@ -67,7 +67,7 @@ from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml import SECRET_YAML, Secrets, load_yaml, yaml_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,6 +75,8 @@ DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
+# The parsed YAML files of the last load, see yaml_snapshot
+YAML_SNAPSHOT_FILE = ".storage/core.yaml_snapshot"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
@@ -402,6 +404,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        hass.config.path(YAML_SNAPSHOT_FILE),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
@@ -409,15 +412,24 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    snapshot_path: str | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
+    When a snapshot path is given, the parsed files are stored in the snapshot
+    and reused on the next load as long as they did not change.
+
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    if snapshot_path is None:
+        conf_dict = load_yaml(config_path, secrets)
+    else:
+        with yaml_snapshot(snapshot_path):
+            conf_dict = load_yaml(config_path, secrets)
 
     if not isinstance(conf_dict, dict):
         msg = (
@@ -1025,17 +1025,24 @@ _FilterableJobType = tuple[
     bool,  # run_immediately
 ]
 
+_KeyedIndexType = dict[str, list[HassJob[[Event], Coroutine[Any, Any, None] | None]]]
+_KeyedListenerType = tuple[
+    str,  # data_key
+    _KeyedIndexType,  # index
+]
+
 
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_match_all_listeners", "_keyed_listeners", "_hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[str, list[_KeyedListenerType]] = {}
         self._hass = hass
 
     @callback
@@ -1044,7 +1051,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(keyed_listeners)
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1083,12 +1093,21 @@ class EventBus:
 
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
+        if keyed_listeners:
+            data = event.data
+            for data_key, index in keyed_listeners:
+                if (key := data.get(data_key)) is not None and key in index:
+                    self._hass.loop.call_soon(
+                        self._async_run_keyed_jobs, index, key, event
+                    )
+
         if not listeners and not match_all_listeners:
             return
 
@@ -1112,6 +1131,19 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_run_keyed_jobs(
+        self, index: _KeyedIndexType, key: str, event: Event
+    ) -> None:
+        """Run the jobs registered in a keyed index for a key."""
+        if not (jobs := index.get(key)):
+            return
+        for job in jobs[:]:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: str,
@@ -1171,6 +1203,54 @@ class EventBus:
             ),
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        index: _KeyedIndexType,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type routed by a key in the event data.
+
+        When an event of event_type is fired, the jobs stored in
+        index[event.data[data_key]] are scheduled without running
+        any event filters. This makes the cost of firing an event
+        independent of the number of keys being tracked.
+
+        The index is owned by the caller and may be mutated to add
+        or remove jobs for a key while the listener is registered.
+
+        This method must be run in the event loop.
+        """
+        keyed_listener: _KeyedListenerType = (data_key, index)
+        self._keyed_listeners.setdefault(event_type, []).append(keyed_listener)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, keyed_listener
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, keyed_listener: _KeyedListenerType
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners.get(event_type, [])
+        for idx, registered in enumerate(keyed_listeners):
+            # Compare by identity since indexes with the
+            # same content are still separate listeners
+            if registered is keyed_listener:
+                del keyed_listeners[idx]
+                break
+        else:
+            _LOGGER.error("Unable to remove unknown keyed listener for %s", event_type)
+            return
+
+        # delete event_type list if empty
+        if not keyed_listeners:
+            self._keyed_listeners.pop(event_type)
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
@@ -1310,7 +1390,12 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # Attributes that are already read only can be shared between states
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # pylint: disable=unidiomatic-typecheck
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1705,7 +1790,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities that cache their attributes pass the attributes
+            # of the current state if they did not change
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
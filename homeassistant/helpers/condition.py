@@ -9,6 +9,7 @@ from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import re
 import sys
+from time import perf_counter
 from typing import Any, Protocol, cast
 
 import voluptuous as vol
@@ -94,6 +95,9 @@ INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
 
+# How often the conditions of an evaluation plan are timed to order them
+PLAN_SAMPLE_INTERVAL = 64
+
 
 class ConditionProtocol(Protocol):
     """Define the format of device_condition modules.
@@ -169,8 +173,16 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None
             trace_stack_pop(trace_stack_cv)
 
 
-def trace_condition_function(condition: ConditionCheckerType) -> ConditionCheckerType:
-    """Wrap a condition function to enable basic tracing."""
+def trace_condition_function(
+    condition: ConditionCheckerType, untraced: ConditionCheckerType | None = None
+) -> ConditionCheckerType:
+    """Wrap a condition function to enable basic tracing.
+
+    The untraced function, which defaults to the condition function itself,
+    is what async_compile_conditions builds evaluation plans from.
+    """
+    if untraced is None:
+        untraced = condition
 
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
@@ -180,9 +192,161 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
             condition_trace_update_result(result=result)
             return result
 
+    wrapper.untraced = untraced  # type: ignore[attr-defined]
     return wrapper
 
 
+def async_get_untraced(check: ConditionCheckerType) -> ConditionCheckerType:
+    """Return the trace-free version of a condition checker."""
+    return cast(ConditionCheckerType, getattr(check, "untraced", check))
+
+
+class _ConstantCondition:
+    """A condition which always has the same result."""
+
+    __slots__ = ("result",)
+
+    def __init__(self, result: bool | None) -> None:
+        """Initialize the condition."""
+        self.result = result
+
+    def __call__(
+        self, hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool | None:
+        """Return the result."""
+        return self.result
+
+
+class _ConditionPlan:
+    """Trace-free evaluation plan of the conditions of an and, or or not condition.
+
+    The conditions are evaluated until one returns the stop_on result. Errors
+    are only raised if none does, so the order of evaluation does not change
+    the result. Conditions with a constant result are folded at compile time
+    and the others are ordered by their measured cost, so the cheap ones get
+    the first chance to short-circuit.
+    """
+
+    __slots__ = (
+        "_checks",
+        "_costs",
+        "_default_result",
+        "_error_type",
+        "_evaluations",
+        "_order",
+        "_stop_on",
+        "_stop_result",
+        "_total",
+    )
+
+    def __init__(
+        self,
+        error_type: str,
+        checks: list[tuple[int, ConditionCheckerType]],
+        total: int,
+        stop_on: bool,
+        stop_result: bool,
+    ) -> None:
+        """Initialize the plan."""
+        self._error_type = error_type
+        self._checks = checks
+        self._costs = [0.0] * len(checks)
+        self._order = list(range(len(checks)))
+        self._evaluations = 0
+        self._total = total
+        self._stop_on = stop_on
+        self._stop_result = stop_result
+        self._default_result = not stop_result
+
+    def __call__(self, hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Evaluate the plan."""
+        self._evaluations += 1
+        if self._evaluations % PLAN_SAMPLE_INTERVAL == 1:
+            return self._evaluate_timed(hass, variables)
+        checks = self._checks
+        stop_on = self._stop_on
+        errors: list[ConditionErrorIndex] | None = None
+        for position in self._order:
+            index, check = checks[position]
+            try:
+                if check(hass, variables) is stop_on:
+                    return self._stop_result
+            except ConditionError as ex:
+                if errors is None:
+                    errors = []
+                errors.append(
+                    ConditionErrorIndex(
+                        self._error_type, index=index, total=self._total, error=ex
+                    )
+                )
+        return self._finish(errors)
+
+    def _evaluate_timed(self, hass: HomeAssistant, variables: TemplateVarsType) -> bool:
+        """Evaluate the plan timing each condition and reorder it by cost."""
+        checks = self._checks
+        costs = self._costs
+        stop_on = self._stop_on
+        errors: list[ConditionErrorIndex] | None = None
+        try:
+            for position in self._order:
+                index, check = checks[position]
+                start = perf_counter()
+                try:
+                    result = check(hass, variables)
+                except ConditionError as ex:
+                    if errors is None:
+                        errors = []
+                    errors.append(
+                        ConditionErrorIndex(
+                            self._error_type, index=index, total=self._total, error=ex
+                        )
+                    )
+                    continue
+                finally:
+                    cost = perf_counter() - start
+                    costs[position] = (
+                        cost if not costs[position] else (costs[position] + cost) / 2
+                    )
+                if result is stop_on:
+                    return self._stop_result
+        finally:
+            self._order.sort(key=costs.__getitem__)
+        return self._finish(errors)
+
+    def _finish(self, errors: list[ConditionErrorIndex] | None) -> bool:
+        """Raise the errors if no condition short-circuited."""
+        if errors:
+            errors.sort(key=lambda error: error.index)
+            raise ConditionErrorContainer(self._error_type, errors=errors)
+        return self._default_result
+
+
+def async_compile_conditions(
+    error_type: str,
+    checks: list[ConditionCheckerType],
+    stop_on: bool,
+    stop_result: bool,
+) -> ConditionCheckerType:
+    """Compile conditions into a trace-free evaluation plan.
+
+    The plan returns stop_result as soon as a condition returns stop_on.
+    Otherwise it raises the errors of the conditions, or returns the opposite
+    of stop_result if there are none.
+    """
+    plan_checks: list[tuple[int, ConditionCheckerType]] = []
+    for index, check in enumerate(checks):
+        untraced = async_get_untraced(check)
+        if isinstance(untraced, _ConstantCondition):
+            if untraced.result is stop_on:
+                return _ConstantCondition(stop_result)
+            # A constant that never short-circuits can be left out
+            continue
+        plan_checks.append((index, untraced))
+    if not plan_checks:
+        return _ConstantCondition(not stop_result)
+    return _ConditionPlan(error_type, plan_checks, len(checks), stop_on, stop_result)
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -228,14 +392,13 @@ async def async_from_config(
     # Check if condition is not enabled
     if not config.get(CONF_ENABLED, True):
 
-        @trace_condition_function
         def disabled_condition(
             hass: HomeAssistant, variables: TemplateVarsType = None
         ) -> bool | None:
             """Condition not enabled, will act as if it didn't exist."""
             return None
 
-        return disabled_condition
+        return trace_condition_function(disabled_condition, _ConstantCondition(None))
 
     # Check for partials to properly determine if coroutine function
     check_factory = factory
@@ -253,7 +416,6 @@ async def async_and_from_config(
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -275,7 +437,10 @@ async def async_and_from_config(
 
         return True
 
-    return if_and_condition
+    return trace_condition_function(
+        if_and_condition,
+        async_compile_conditions("and", checks, False, False),
+    )
 
 
 async def async_or_from_config(
@@ -284,7 +449,6 @@ async def async_or_from_config(
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -306,7 +470,10 @@ async def async_or_from_config(
 
         return False
 
-    return if_or_condition
+    return trace_condition_function(
+        if_or_condition,
+        async_compile_conditions("or", checks, True, True),
+    )
 
 
 async def async_not_from_config(
@@ -315,7 +482,6 @@ async def async_not_from_config(
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -337,7 +503,10 @@ async def async_not_from_config(
 
         return True
 
-    return if_not_condition
+    return trace_condition_function(
+        if_not_condition,
+        async_compile_conditions("not", checks, True, False),
+    )
 
 
 def numeric_state(
@@ -495,9 +664,8 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
-    @trace_condition_function
     def if_numeric_state(
-        hass: HomeAssistant, variables: TemplateVarsType = None
+        hass: HomeAssistant, variables: TemplateVarsType = None, traced: bool = True
     ) -> bool:
         """Test numeric state condition."""
         if value_template is not None:
@@ -506,8 +674,8 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
         errors = []
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if not async_numeric_state(
+                if not traced:
+                    matches = async_numeric_state(
                         hass,
                         entity_id,
                         below,
@@ -515,8 +683,22 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
                         value_template,
                         variables,
                         attribute,
+                    )
+                else:
+                    with trace_path(["entity_id", str(index)]), trace_condition(
+                        variables
                     ):
-                        return False
+                        matches = async_numeric_state(
+                            hass,
+                            entity_id,
+                            below,
+                            above,
+                            value_template,
+                            variables,
+                            attribute,
+                        )
+                if not matches:
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex(
@@ -530,7 +712,9 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_numeric_state
+    return trace_condition_function(
+        if_numeric_state, ft.partial(if_numeric_state, traced=False)
+    )
 
 
 def state(
@@ -617,21 +801,35 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
-    @trace_condition_function
-    def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+    def if_state(
+        hass: HomeAssistant, variables: TemplateVarsType = None, traced: bool = True
+    ) -> bool:
         """Test if condition."""
         template_attach(hass, for_period)
         errors = []
         result: bool = match != ENTITY_MATCH_ANY
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if state(
+                if not traced:
+                    matches = state(
                         hass, entity_id, req_states, for_period, attribute, variables
+                    )
+                else:
+                    with trace_path(["entity_id", str(index)]), trace_condition(
+                        variables
                     ):
-                        result = True
-                    elif match == ENTITY_MATCH_ALL:
-                        return False
+                        matches = state(
+                            hass,
+                            entity_id,
+                            req_states,
+                            for_period,
+                            attribute,
+                            variables,
+                        )
+                if matches:
+                    result = True
+                elif match == ENTITY_MATCH_ALL:
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex(
@@ -645,7 +843,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return result
 
-    return if_state
+    return trace_condition_function(if_state, ft.partial(if_state, traced=False))
 
 
 def sun(
@@ -779,14 +977,30 @@ def async_template_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
 
-    @trace_condition_function
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
         value_template.hass = hass
 
         return async_template(hass, value_template, variables)
 
-    return template_if
+    if value_template.is_static:
+        # Static templates are rendered as they are
+        return trace_condition_function(
+            template_if, _ConstantCondition(value_template.template.lower() == "true")
+        )
+
+    def untraced_template_if(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Validate template based if-condition without collecting render info."""
+        value_template.hass = hass
+        try:
+            value = value_template.async_render(variables, parse_result=False)
+        except TemplateError as ex:
+            raise ConditionErrorMessage("template", str(ex)) from ex
+        return cast(str, value).lower() == "true"
+
+    return trace_condition_function(template_if, untraced_template_if)
 
 
 def time(
@@ -23,6 +23,7 @@ from . import storage
 from .debounce import Debouncer
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import unindex
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -436,10 +437,61 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Also maintains indexes to look up the ids of the devices by area_id
+    and config entry. These map to dicts which are used as ordered sets.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add an item."""
+        old_entry = self.data.get(key)
+        super().__setitem__(key, entry)
+        old_area_id = None if old_entry is None else old_entry.area_id
+        if old_area_id != entry.area_id:
+            unindex(self._area_id_index, old_area_id, key)
+            if entry.area_id is not None:
+                self._area_id_index.setdefault(entry.area_id, {})[key] = True
+        old_config_entries = set() if old_entry is None else old_entry.config_entries
+        for config_entry_id in old_config_entries - entry.config_entries:
+            unindex(self._config_entry_id_index, config_entry_id, key)
+        for config_entry_id in entry.config_entries - old_config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[key] = True
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        entry = self[key]
+        unindex(self._area_id_index, entry.area_id, key)
+        for config_entry_id in entry.config_entries:
+            unindex(self._config_entry_id_index, config_entry_id, key)
+        super().__delitem__(key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -785,7 +837,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -881,7 +933,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -922,9 +974,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -943,7 +994,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -951,11 +1002,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
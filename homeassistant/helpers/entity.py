@@ -51,6 +51,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -277,6 +278,20 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
+    # If True the attributes are only generated again when they were marked
+    # dirty with async_mark_attributes_dirty, the state is read on every write
+    _cache_attributes = False
+
+    # The attributes of the last write and what they were generated from
+    # when the attributes are cached
+    _attributes_snapshot: tuple[
+        bool,
+        Any,
+        er.RegistryEntry | None,
+        dr.DeviceEntry | None,
+        ReadOnlyDict[str, Any],
+    ] | None = None
+
     # Entry in the entity registry
     registry_entry: er.RegistryEntry | None = None
 
@@ -818,6 +833,53 @@ class Entity(ABC):
 
         return (state, attr)
 
+    @callback
+    def _async_generate_cached_attributes(self) -> tuple[str, ReadOnlyDict[str, Any]]:
+        """Calculate state string and reuse the attributes of the last write.
+
+        The attributes are generated again when they were marked dirty or
+        anything else they depend on changed.
+        """
+        available = self.available
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        if (
+            (snapshot := self._attributes_snapshot) is not None
+            and snapshot[0] == available
+            and snapshot[1] is customize
+            and snapshot[2] is self.registry_entry
+            and snapshot[3] is self.device_entry
+        ):
+            return self._stringify_state(available), snapshot[4]
+
+        state, attr = self._async_generate_attributes()
+        if customize:
+            attr.update(customize.get(self.entity_id))
+        # Reuse the attributes of the current state if they did not change
+        # so the state machine can tell they are unchanged by identity
+        if (
+            old_state := self.hass.states.get(self.entity_id)
+        ) is not None and old_state.attributes == attr:
+            attributes = old_state.attributes
+        else:
+            attributes = ReadOnlyDict(attr)
+        self._attributes_snapshot = (
+            available,
+            customize,
+            self.registry_entry,
+            self.device_entry,
+            attributes,
+        )
+        return state, attributes
+
+    @callback
+    def async_mark_attributes_dirty(self) -> None:
+        """Generate the attributes again on the next write.
+
+        Only entities that cache their attributes need to call this when
+        anything but the state changed.
+        """
+        self._attributes_snapshot = None
+
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
@@ -842,7 +904,15 @@ class Entity(ABC):
             return
 
         start = timer()
-        state, attr = self._async_generate_attributes()
+        attr: Mapping[str, Any]
+        if self._cache_attributes:
+            state, attr = self._async_generate_cached_attributes()
+        else:
+            state, generated_attr = self._async_generate_attributes()
+            # Overwrite properties that have been set in the config file.
+            if customize := hass.data.get(DATA_CUSTOMIZE):
+                generated_attr.update(customize.get(entity_id))
+            attr = generated_attr
         end = timer()
 
         if end - start > 0.4 and not self._slow_reported:
@@ -856,10 +926,6 @@ class Entity(ABC):
                 report_issue,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if customize := hass.data.get(DATA_CUSTOMIZE):
-            attr.update(customize.get(entity_id))
-
         if (
             self._context_set is not None
             and hass.loop.time() - self._context_set
@@ -52,6 +52,7 @@ from homeassistant.util.read_only_dict import ReadOnlyDict
 from . import device_registry as dr, storage
 from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import unindex
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -439,6 +440,10 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
     Maintains two additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+
+    And indexes to look up the entity_ids of the entries by device_id,
+    area_id, config_entry_id and platform. These map to dicts which are
+    used as ordered sets.
     """
 
     def __init__(self) -> None:
@@ -446,6 +451,17 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._platform_index: dict[str, dict[str, Literal[True]]] = {}
+        # The indexes in the order of _indexed_values
+        self._indexes = (
+            self._device_id_index,
+            self._area_id_index,
+            self._config_entry_id_index,
+            self._platform_index,
+        )
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -454,19 +470,31 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
         data = self.data
-        if key in data:
-            old_entry = data[key]
+        old_entry = data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         data[key] = entry
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        old_values = _NOT_INDEXED if old_entry is None else _indexed_values(old_entry)
+        for index, old_value, value in zip(
+            self._indexes, old_values, _indexed_values(entry)
+        ):
+            if old_value == value:
+                # Keep the position of the entry in the index
+                continue
+            unindex(index, old_value, key)
+            if value is not None:
+                index.setdefault(value, {})[key] = True
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, value in zip(self._indexes, _indexed_values(entry)):
+            unindex(index, value, key)
         super().__delitem__(key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
@@ -477,6 +505,40 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [data[key] for key in self._device_id_index.get(device_id, ())]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        data = self.data
+        return [data[key] for key in self._platform_index.get(platform, ())]
+
+
+_NOT_INDEXED: tuple[None, None, None, None] = (None, None, None, None)
+
+
+def _indexed_values(
+    entry: RegistryEntry,
+) -> tuple[str | None, str | None, str | None, str]:
+    """Return the values an entry is indexed by."""
+    return entry.device_id, entry.area_id, entry.config_entry_id, entry.platform
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -494,6 +556,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -1158,12 +1221,8 @@ class EntityRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry_id == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry_id):
+            self.async_remove(entry.entity_id)
         for key, deleted_entity in list(self.deleted_entities.items()):
             if config_entry_id != deleted_entity.config_entry_id:
                 continue
@@ -1192,9 +1251,8 @@ class EntityRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -1215,12 +1273,10 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    entries = registry.entities.get_entries_for_device_id(device_id)
+    if include_disabled_entities:
+        return entries
+    return [entry for entry in entries if not entry.disabled_by]
 
 
 @callback
@@ -1228,7 +1284,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1236,11 +1292,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -280,36 +280,6 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
@@ -317,14 +287,13 @@ def _async_track_state_change_event(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
+    return _async_track_keyed_event(
         hass,
         entity_ids,
         TRACK_STATE_CHANGE_CALLBACKS,
         TRACK_STATE_CHANGE_LISTENER,
         EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
+        "entity_id",
         action,
     )
 
@@ -411,6 +380,53 @@ def _async_track_event(
     return ft.partial(_remove_listener, hass, listeners_key, keys, job, callbacks)
 
 
+def _async_track_keyed_event(
+    hass: HomeAssistant,
+    keys: str | Iterable[str],
+    callbacks_key: str,
+    listeners_key: str,
+    event_type: str,
+    data_key: str,
+    action: Callable[[EventType[_TypedDictT]], None],
+) -> CALLBACK_TYPE:
+    """Track an event by an exact match on a key in the event data.
+
+    The callbacks dict is handed to the event bus as a dispatch index
+    so firing an event only touches the jobs registered for its key.
+    """
+    if not keys:
+        return _remove_empty_listener
+
+    if isinstance(keys, str):
+        keys = [keys]
+
+    hass_data = hass.data
+
+    callbacks: dict[
+        str, list[HassJob[[EventType[_TypedDictT]], Any]]
+    ] | None = hass_data.get(callbacks_key)
+    if not callbacks:
+        callbacks = hass_data[callbacks_key] = {}
+
+    if listeners_key not in hass_data:
+        hass_data[listeners_key] = hass.bus.async_listen_keyed(
+            event_type,
+            data_key,
+            callbacks,  # type: ignore[arg-type]
+        )
+
+    job = HassJob(action, f"track {event_type} event {keys}")
+
+    for key in keys:
+        callback_list = callbacks.get(key)
+        if callback_list:
+            callback_list.append(job)
+        else:
+            callbacks[key] = [job]
+
+    return ft.partial(_remove_listener, hass, listeners_key, keys, job, callbacks)
+
+
 @callback
 def _async_dispatch_old_entity_id_or_entity_id_event(
     hass: HomeAssistant,
@@ -474,40 +490,6 @@ def async_track_entity_registry_updated_event(
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventDeviceRegistryUpdatedData],
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event.data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
-
-
 @callback
 def async_track_device_registry_updated_event(
     hass: HomeAssistant,
@@ -518,14 +500,13 @@ def async_track_device_registry_updated_event(
 
     Similar to async_track_entity_registry_updated_event.
     """
-    return _async_track_event(
+    return _async_track_keyed_event(
         hass,
         device_ids,
         TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
         TRACK_DEVICE_REGISTRY_UPDATED_LISTENER,
         EVENT_DEVICE_REGISTRY_UPDATED,
-        _async_dispatch_device_id_event,
-        _async_device_registry_updated_filter,
+        "device_id",
         action,
     )
 
@@ -902,6 +883,8 @@ class TrackTemplateResultInfo:
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
+            # Only re-render the parts of the template that use changed states
+            track_template_.template.incremental = True
         self._track_templates = track_templates
         self._has_super_template = has_super_template
 
@@ -160,6 +160,20 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    json_data = prepare_save_json(filename, data, encoder=encoder)
+    if atomic_writes:
+        write_utf8_file_atomic(filename, json_data, private)
+    else:
+        write_utf8_file(filename, json_data, private)
+
+
+def prepare_save_json(
+    filename: str,
+    data: list | dict,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> str:
+    """Serialize JSON data the way save_json writes it to a file."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -181,10 +195,7 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    if atomic_writes:
-        write_utf8_file_atomic(filename, json_data, private)
-    else:
-        write_utf8_file(filename, json_data, private)
+    return json_data
 
 
 def find_paths_unserializable_data(
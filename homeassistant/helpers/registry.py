@@ -0,0 +1,16 @@
+"""Provide helpers shared by the registries."""
+from __future__ import annotations
+
+from typing import Literal
+
+
+def unindex(
+    index: dict[str, dict[str, Literal[True]]], value: str | None, key: str
+) -> None:
+    """Remove a key from the keys indexed under a value."""
+    if value is None:
+        return
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
@@ -31,6 +31,11 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How old the last seen time of an unchanged state may get before it is
+# written again, keeping it fresh on every dump would rewrite every state.
+# Expiry allows for it, so states are kept at least STATE_EXPIRATION.
+LAST_SEEN_RESOLUTION = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -74,7 +79,7 @@ class StoredState:
         result = {
             "state": self.state.as_dict(),
             "extra_data": self.extra_data.as_dict() if self.extra_data else None,
-            "last_seen": self.last_seen,
+            "last_seen": self.last_seen.isoformat(),
         }
         return result
 
@@ -93,6 +98,45 @@ class StoredState:
         )
 
 
+class _LoadedStoredState(StoredState):
+    """A stored state loaded from storage.
+
+    The state, extra data and last seen time are only deserialized when they
+    are first accessed, most entities restore their state once and the
+    expired ones never do.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, json_dict: dict[str, Any]
+    ) -> None:
+        """Initialize a stored state from a dict, without deserializing it."""
+        self._json_dict = json_dict
+
+    def __getattr__(self, name: str) -> Any:
+        """Deserialize an attribute on first access."""
+        value: Any
+        if name == "state":
+            value = State.from_dict(self._json_dict["state"])
+        elif name == "extra_data":
+            extra_data_dict = self._json_dict.get("extra_data")
+            value = RestoredExtraData(extra_data_dict) if extra_data_dict else None
+        elif name == "last_seen":
+            value = dt_util.parse_datetime(self._json_dict["last_seen"])
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state."""
+        return self._json_dict
+
+    @classmethod
+    def from_dict(cls, json_dict: dict) -> Self:
+        """Initialize a stored state from a dict."""
+        return cls(json_dict)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -133,10 +177,15 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The dicts written by the last dump with the state and the extra
+        # data they were created from, keyed by entity_id
+        self._dumped: dict[
+            str, tuple[State, dict[str, Any] | None, datetime, dict[str, Any]]
+        ] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -161,7 +210,7 @@ class RestoreStateData:
             self.last_states = {}
         else:
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: _LoadedStoredState.from_dict(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -194,7 +243,8 @@ class RestoreStateData:
             # Ignore all states that are entity registry placeholders
             not state.attributes.get(ATTR_RESTORED)
         ]
-        expiration_time = now - STATE_EXPIRATION
+        # The stored last seen time can be up to LAST_SEEN_RESOLUTION old
+        expiration_time = now - STATE_EXPIRATION - LAST_SEEN_RESOLUTION
 
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
@@ -211,16 +261,52 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_state_dicts(self) -> list[dict[str, Any]]:
+        """Get the dict representations of the states which should be stored.
+
+        The dict of a state is reused as long as the state and its extra data
+        did not change, so the store only writes the states that changed.
+        """
+        refresh_before = dt_util.utcnow() - LAST_SEEN_RESOLUTION
+        old_dumped = self._dumped
+        dumped: dict[
+            str, tuple[State, dict[str, Any] | None, datetime, dict[str, Any]]
+        ] = {}
+        result: list[dict[str, Any]] = []
+        for stored_state in self.async_get_stored_states():
+            if isinstance(stored_state, _LoadedStoredState):
+                # Still as it was loaded, there is no need to deserialize it
+                result.append(stored_state.as_dict())
+                continue
+            state = stored_state.state
+            extra_data = stored_state.extra_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            last_seen = stored_state.last_seen
+            if (
+                (old := old_dumped.get(state.entity_id)) is not None
+                and old[0] is state
+                and old[1] == extra_data_dict
+                and (old[2] == last_seen or refresh_before <= old[2] <= last_seen)
+            ):
+                dumped[state.entity_id] = old
+                result.append(old[3])
+                continue
+            as_dict = {
+                "state": state.as_dict(),
+                "extra_data": extra_data_dict,
+                "last_seen": last_seen.isoformat(),
+            }
+            dumped[state.entity_id] = (state, extra_data_dict, last_seen, as_dict)
+            result.append(as_dict)
+        self._dumped = dumped
+        return result
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_get_stored_state_dicts())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
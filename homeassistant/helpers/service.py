@@ -481,32 +481,34 @@ def async_extract_referenced_entity_ids(
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
+    for area_id in selector.area_ids:
+        for device_entry in device_registry.async_entries_for_area(dev_reg, area_id):
             selected.referenced_devices.add(device_entry.id)
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
+    entities: list[entity_registry.RegistryEntry] = []
+    for area_id in selector.area_ids:
+        # The entity's area matches a targeted area
+        entities.extend(entity_registry.async_entries_for_area(ent_reg, area_id))
+    for device_id in selected.referenced_devices:
+        entities.extend(
+            ent_entry
+            for ent_entry in entity_registry.async_entries_for_device(
+                ent_reg, device_id, include_disabled_entities=True
+            )
+            # The entity's device matches a device referenced by an area and the
+            # entity has no explicitly set area, or it matches a targeted device
+            if not ent_entry.area_id or device_id in selector.device_ids
+        )
+
+    for ent_entry in entities:
         # Do not add entities which are hidden or which are config
         # or diagnostic entities.
         if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
             continue
-
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+        selected.indirectly_referenced.add(ent_entry.entity_id)
 
     return selected
 
@@ -1020,10 +1022,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.entities.get_entries_for_platform(domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
@@ -5,10 +5,12 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
+import time
 from typing import Any, Generic, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
@@ -24,7 +26,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 
 from . import json as json_helper
 
@@ -35,6 +37,12 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITE_METRICS = "storage_write_metrics"
+
+# The journal is compacted into a new snapshot once it would grow
+# larger than the snapshot, but never before it reaches this size
+JOURNAL_MIN_COMPACT_SIZE = 65536
+JOURNAL_POSTFIX = ".journal"
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +87,232 @@ async def async_migrator(
     return config
 
 
+@dataclass(slots=True)
+class StoreWriteMetrics:
+    """Write metrics of a storage key."""
+
+    writes: int = 0
+    journal_writes: int = 0
+    bytes_written: int = 0
+    serialization_time: float = 0.0
+
+
+@callback
+def async_get_write_metrics(hass: HomeAssistant) -> dict[str, StoreWriteMetrics]:
+    """Return the write metrics per storage key."""
+    metrics: dict[str, StoreWriteMetrics] = hass.data.setdefault(
+        STORAGE_WRITE_METRICS, {}
+    )
+    return metrics
+
+
+# An item as it was written, serialized and parsed back
+_JournalItem = tuple[bytes, Any]
+_JournalItems = dict[str | None, _JournalItem | list[_JournalItem]]
+
+
+def _serialize_journal_item(
+    value: Any, old_item: _JournalItem | None
+) -> tuple[_JournalItem, bool]:
+    """Serialize a value unless it is unchanged since it was written.
+
+    Comparing with the parsed value avoids serializing the unchanged items,
+    values that compare equal to what was written (like 1 and 1.0) are
+    considered unchanged.
+    """
+    if old_item is not None and value == old_item[1]:
+        return old_item, False
+    json_data = json_helper.json_bytes(value)
+    if old_item is not None and json_data == old_item[0]:
+        return old_item, False
+    return (json_data, json_util.json_loads(json_data)), True
+
+
+class _StoreJournal:
+    """Track the data on disk to write changes as deltas to a journal.
+
+    The payload is split into items, the top level values of a dict or
+    the entries of the lists it contains (or of the payload if it is a
+    list). Each item is serialized on its own so a delta only contains
+    the items that changed. Each line of the journal is one change, the
+    first line holds the id of the snapshot it applies to.
+    """
+
+    __slots__ = ("journal_id", "journal_size", "snapshot_size", "compact", "_items")
+
+    def __init__(self) -> None:
+        """Initialize the journal."""
+        self.journal_id = 0
+        self.journal_size = 0
+        self.snapshot_size = 0
+        # Write a snapshot on the next write even if the delta is small
+        self.compact = False
+        self._items: _JournalItems | None = None
+
+    def payload(self) -> Any:
+        """Return the payload as it was last written or None if unknown."""
+        if (items := self._items) is None:
+            return None
+        values = {
+            key: [entry[1] for entry in item] if isinstance(item, list) else item[1]
+            for key, item in items.items()
+        }
+        return values[None] if None in values else values
+
+    def update(self, payload: Any) -> tuple[_JournalItems, bytes | None] | None:
+        """Serialize the items of the payload and the changes since the last write.
+
+        Returns None if the payload can not be journaled. The changes are
+        None if there is no snapshot to apply them to.
+        """
+        values: dict[str | None, Any]
+        if isinstance(payload, list):
+            values = {None: payload}
+        elif isinstance(payload, dict) and all(isinstance(key, str) for key in payload):
+            values = payload
+        else:
+            return None
+        if (old_items := self._items) is not None and old_items.keys() != values.keys():
+            old_items = None
+        items: _JournalItems = {}
+        lines: list[bytes] = []
+        for key, value in values.items():
+            old_item = None if old_items is None else old_items[key]
+            if not isinstance(value, list):
+                item, changed = _serialize_journal_item(
+                    value, old_item if isinstance(old_item, tuple) else None
+                )
+                items[key] = item
+                if changed and old_items is not None:
+                    lines.append(
+                        b'{"k":%s,"v":%s}\n' % (json_helper.json_bytes(key), item[0])
+                    )
+                continue
+            old_list = old_item if isinstance(old_item, list) else []
+            old_len = len(old_list)
+            new_list: list[_JournalItem] = []
+            changed_idx: list[int] = []
+            for idx, entry in enumerate(value):
+                item, changed = _serialize_journal_item(
+                    entry, old_list[idx] if idx < old_len else None
+                )
+                new_list.append(item)
+                if changed:
+                    changed_idx.append(idx)
+            items[key] = new_list
+            if old_items is None or not (changed_idx or len(new_list) < old_len):
+                continue
+            json_key = json_helper.json_bytes(key)
+            if not isinstance(old_item, list):
+                joined = b",".join(item[0] for item in new_list)
+                lines.append(b'{"k":%s,"v":[%s]}\n' % (json_key, joined))
+                continue
+            lines.extend(
+                b'{"k":%s,"i":%d,"v":%s}\n' % (json_key, idx, new_list[idx][0])
+                for idx in changed_idx
+            )
+            if len(new_list) < old_len:
+                lines.append(b'{"k":%s,"n":%d}\n' % (json_key, len(new_list)))
+        return items, None if old_items is None else b"".join(lines)
+
+    def should_compact(self, delta_size: int) -> bool:
+        """Return if a new snapshot should be written instead of the delta."""
+        return self.compact or self.journal_size + delta_size > max(
+            self.snapshot_size, JOURNAL_MIN_COMPACT_SIZE
+        )
+
+    def append(
+        self,
+        path: str,
+        items: _JournalItems,
+        delta: bytes,
+        private: bool,
+        atomic_writes: bool,
+    ) -> int:
+        """Append the delta to items to the journal and return the bytes written."""
+        if not self.journal_size:
+            delta = b'{"journal":%d}\n%s' % (self.journal_id, delta)
+        try:
+            fd = os.open(
+                path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if private else 0o644,
+            )
+            try:
+                os.write(fd, delta)
+                if atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", path)
+            raise WriteError(error) from error
+        self._items = items
+        self.journal_size += len(delta)
+        return len(delta)
+
+    def compacted(
+        self,
+        path: str,
+        items: _JournalItems | None,
+        snapshot_size: int,
+    ) -> None:
+        """Start a new journal after a snapshot was written."""
+        self._items = items
+        self.snapshot_size = snapshot_size
+        self.journal_size = 0
+        self.compact = False
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+
+    def replay(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the journal to the data of a snapshot."""
+        journal_id = data.pop("journal", None)
+        self.journal_id = journal_id or 0
+        try:
+            with open(path, encoding="utf-8") as fdesc:
+                lines = fdesc.readlines()
+        except FileNotFoundError:
+            return
+        if not lines or journal_id is None:
+            return
+        try:
+            if json_util.json_loads(lines[0]) != {"journal": journal_id}:
+                # The snapshot was written after this journal was started
+                return
+        except ValueError:
+            return
+        payload = data["data"]
+        for line in lines[1:]:
+            try:
+                record: dict[str, Any] = json_util.json_loads_object(line)
+            except ValueError:
+                # The last change was not written completely
+                break
+            try:
+                key = record["k"]
+                if "n" in record:
+                    del (payload if key is None else payload[key])[record["n"] :]
+                elif "i" in record:
+                    target = payload if key is None else payload[key]
+                    if (idx := record["i"]) == len(target):
+                        target.append(record["v"])
+                    else:
+                        target[idx] = record["v"]
+                elif key is None:
+                    payload = record["v"]
+                else:
+                    payload[key] = record["v"]
+            except (IndexError, KeyError, TypeError) as err:
+                _LOGGER.warning(
+                    "Ignoring the rest of journal %s, a change does not apply: %r",
+                    path,
+                    err,
+                )
+                break
+        data["data"] = payload
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -94,8 +328,15 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the items that changed since the last
+        write to a journal file instead of writing the whole data.
+        """
+        if journal and encoder not in (None, json_helper.JSONEncoder):
+            raise ValueError("A journaled store does not support custom encoders")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +350,29 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = _StoreJournal() if journal else None
+        self._write_metrics: StoreWriteMetrics | None = None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def write_metrics(self) -> StoreWriteMetrics:
+        """Return the write metrics of the storage key."""
+        if self._write_metrics is None:
+            # Stores can be created before hass.data is set up
+            self._write_metrics = async_get_write_metrics(self.hass).setdefault(
+                self.key, StoreWriteMetrics()
+            )
+        return self._write_metrics
+
+    @property
+    def _journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_POSTFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -158,9 +416,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -326,6 +582,19 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (journal := self._journal) is not None and (
+            self._data is not None or journal.journal_size
+        ):
+            # Leave a complete snapshot behind so versions which
+            # do not know about the journal do not lose changes
+            journal.compact = True
+            if self._data is None:
+                self._data = {
+                    "version": self.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "data": journal.payload(),
+                }
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -353,21 +622,76 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal is not None and self._journal.journal_size:
+                # Compact the journal into a snapshot when stopping
+                self._async_ensure_final_write_listener()
+
+    def _load_data(self) -> Any:
+        """Load the data and apply the journal."""
+        data = json_util.load_json(self.path)
+        if self._journal is not None and isinstance(data, dict) and "data" in data:
+            self._journal.replay(self._journal_path, data)
+        return data
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
+        metrics = self.write_metrics
+        start = time.perf_counter()
 
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+        if (journal := self._journal) is None:
+            json_data = json_helper.prepare_save_json(path, data, encoder=self._encoder)
+            metrics.serialization_time += time.perf_counter() - start
+            self._write_snapshot(path, json_data)
+            return
+
+        update: tuple[_JournalItems, bytes | None] | None = None
+        with suppress(TypeError):
+            # Unserializable data is reported when the snapshot is written
+            update = journal.update(data["data"])
+        if (
+            update is not None
+            and data["version"] == self.version
+            and data["minor_version"] == self.minor_version
+            and (delta := update[1]) is not None
+            and not journal.should_compact(len(delta))
+        ):
+            metrics.serialization_time += time.perf_counter() - start
+            if not delta:
+                return
+            journal_path = self._journal_path
+            _LOGGER.debug("Appending changes for %s to %s", self.key, journal_path)
+            metrics.bytes_written += journal.append(
+                journal_path, update[0], delta, self._private, self._atomic_writes
+            )
+            metrics.journal_writes += 1
+            return
+
+        journal_id = journal.journal_id + 1
+        json_data = json_helper.prepare_save_json(
+            path, {**data, "journal": journal_id}, encoder=self._encoder
         )
+        metrics.serialization_time += time.perf_counter() - start
+        snapshot_size = self._write_snapshot(path, json_data)
+        journal.journal_id = journal_id
+        journal.compacted(
+            self._journal_path, None if update is None else update[0], snapshot_size
+        )
+
+    def _write_snapshot(self, path: str, json_data: str) -> int:
+        """Write the serialized data and return the bytes written."""
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        if self._atomic_writes:
+            write_utf8_file_atomic(path, json_data, self._private)
+        else:
+            write_utf8_file(path, json_data, self._private)
+        size = os.path.getsize(path)
+        self.write_metrics.bytes_written += size
+        self.write_metrics.writes += 1
+        return size
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -380,3 +704,8 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self._journal_path)
+            # The next write has no snapshot to append to
+            self._journal = _StoreJournal()
@@ -13,7 +13,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
-from operator import contains
+from operator import contains, is_
 import pathlib
 import random
 import re
@@ -36,7 +36,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -406,6 +406,15 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def _update(self, other: RenderInfo) -> None:
+        """Add what was collected while rendering a fragment of the template."""
+        self.all_states |= other.all_states
+        self.all_states_lifecycle |= other.all_states_lifecycle
+        self.domains = self.domains | other.domains
+        self.domains_lifecycle = self.domains_lifecycle | other.domains_lifecycle
+        self.entities = self.entities | other.entities
+        self.has_time |= other.has_time
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
@@ -445,6 +454,152 @@ class RenderInfo:
             self.filter = _false
 
 
+# Statements that bind names which are visible to the
+# statements after them unless they are inside a loop or with block.
+_BINDING_NODES = (nodes.Assign, nodes.AssignBlock, nodes.Macro)
+
+# Statements that can not be rendered on their own.
+_UNSPLITTABLE_NODES = (
+    nodes.Block,
+    nodes.CallBlock,
+    nodes.ExprStmt,
+    nodes.Extends,
+    nodes.FromImport,
+    nodes.Import,
+    nodes.Include,
+)
+
+# Functions, filters and tests whose result depends on something else than
+# the state machine, their arguments or the time.
+_NON_STATE_NAMES = frozenset(
+    {
+        "area_devices",
+        "area_entities",
+        "area_id",
+        "area_name",
+        "areas",
+        "config_entry_id",
+        "device_attr",
+        "device_entities",
+        "device_id",
+        "integration_entities",
+        "is_device_attr",
+        "is_hidden_entity",
+        "lipsum",
+        "random",
+    }
+)
+
+
+def _binds_names(node: nodes.Node) -> bool:
+    """Return if a node binds names outside of a loop or with block."""
+    if isinstance(node, _BINDING_NODES):
+        return True
+    children: Iterable[nodes.Node]
+    if isinstance(node, nodes.For):
+        # The body of a loop has its own scope
+        children = node.else_
+    elif isinstance(node, nodes.With):
+        children = ()
+    else:
+        children = node.iter_child_nodes()
+    return any(_binds_names(child) for child in children)
+
+
+def _compile_fragments(
+    env: TemplateEnvironment, source: str
+) -> tuple[str | jinja2.Template, ...] | None:
+    """Split a template into fragments which can be rendered on their own.
+
+    Each top level statement and each expression in top level output
+    becomes a fragment. Literal output is kept as a string.
+
+    Returns None if the template can not be split, if it depends on
+    something else than the state machine, or if it would not result
+    in more than one fragment to render.
+    """
+    ast = env.parse(source)
+    if (
+        any(True for _ in ast.find_all(_UNSPLITTABLE_NODES))
+        or any(_binds_names(node) for node in ast.body)
+        or any(node.name in _NON_STATE_NAMES for node in ast.find_all(nodes.Name))
+        or any(
+            node.name in _NON_STATE_NAMES
+            for node in ast.find_all((nodes.Filter, nodes.Test))
+        )
+    ):
+        return None
+
+    fragments: list[str | jinja2.Template] = []
+    for node in ast.body:
+        children = node.nodes if isinstance(node, nodes.Output) else (node,)
+        for child in children:
+            if isinstance(child, nodes.TemplateData):
+                fragments.append(child.data)
+                continue
+            if isinstance(node, nodes.Output):
+                child = nodes.Output([child], lineno=child.lineno)
+            fragment = nodes.Template([child], lineno=child.lineno)
+            fragment.set_environment(env)
+            fragments.append(
+                jinja2.Template.from_code(env, env.compile(fragment), env.globals, None)
+            )
+
+    if sum(not isinstance(fragment, str) for fragment in fragments) < 2:
+        return None
+    return tuple(fragments)
+
+
+class _RenderedFragment:
+    """Hold the result of a template fragment and the states it used."""
+
+    __slots__ = ("result", "render_info", "entity_states", "domain_states")
+
+    def __init__(
+        self, hass: HomeAssistant, result: str, render_info: RenderInfo
+    ) -> None:
+        """Remember the states that the fragment was rendered with."""
+        self.result = result
+        self.render_info = render_info
+        states = hass.states
+        self.entity_states = {
+            entity_id: states.get(entity_id) for entity_id in render_info.entities
+        }
+        self.domain_states = {
+            domain: states.async_all(domain)
+            for domain in (*render_info.domains, *render_info.domains_lifecycle)
+        }
+
+    def async_is_current(self, hass: HomeAssistant) -> bool:
+        """Return if none of the states used by the fragment have changed.
+
+        State objects are replaced when they change so comparing
+        identity is enough.
+        """
+        states = hass.states
+        for entity_id, state in self.entity_states.items():
+            if states.get(entity_id) is not state:
+                return False
+        for domain, domain_states in self.domain_states.items():
+            current = states.async_all(domain)
+            if len(current) != len(domain_states) or not all(
+                map(is_, current, domain_states)
+            ):
+                return False
+        return True
+
+
+def _fragment_is_cacheable(render_info: RenderInfo) -> bool:
+    """Return if a fragment result only depends on the collected states."""
+    return not (
+        render_info.all_states
+        or render_info.all_states_lifecycle
+        or render_info.has_time
+    ) and bool(
+        render_info.entities or render_info.domains or render_info.domains_lifecycle
+    )
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -461,10 +616,24 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "incremental",
+        "_fragments",
+        "_rendered_fragments",
+        "_fragment_variables",
     )
 
-    def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
-        """Instantiate a template."""
+    def __init__(
+        self,
+        template: str,
+        hass: HomeAssistant | None = None,
+        incremental: bool = False,
+    ) -> None:
+        """Instantiate a template.
+
+        If incremental is True, renders to info only re-render the parts of
+        the template which use a state that changed since the previous render.
+        Templates which use the registries or random are always fully rendered.
+        """
         if not isinstance(template, str):
             raise TypeError("Expected template to be a string")
 
@@ -479,6 +648,10 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self.incremental = incremental
+        self._fragments: tuple[str | jinja2.Template, ...] | None = None
+        self._rendered_fragments: list[_RenderedFragment | None] = []
+        self._fragment_variables: TemplateVarsType = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -692,9 +865,14 @@ class Template:
 
         token = _render_info.set(render_info)
         try:
-            render_info._result = self.async_render(
-                variables, strict=strict, log_fn=log_fn, **kwargs
-            )
+            if self.incremental:
+                render_info._result = self._async_render_fragments(
+                    render_info, variables, strict, log_fn, kwargs
+                )
+            else:
+                render_info._result = self.async_render(
+                    variables, strict=strict, log_fn=log_fn, **kwargs
+                )
         except TemplateError as ex:
             render_info.exception = ex
         finally:
@@ -703,6 +881,69 @@ class Template:
         render_info._freeze()
         return render_info
 
+    def _async_render_fragments(
+        self,
+        render_info: RenderInfo,
+        variables: TemplateVarsType,
+        strict: bool,
+        log_fn: Callable[[int, str], None] | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Render the template one fragment at a time.
+
+        The result of a fragment is reused as long as the states it
+        collected are unchanged and it is rendered with the same variables.
+        """
+        if self._compiled is None:
+            self._ensure_compiled(strict=strict, log_fn=log_fn)
+        if self._fragments is None:
+            self._fragments = _compile_fragments(self._env, self.template) or ()
+            self._rendered_fragments = [None] * len(self._fragments)
+        if not (fragments := self._fragments):
+            return self.async_render(variables, strict=strict, log_fn=log_fn, **kwargs)
+
+        assert self.hass is not None, "hass variable not set on template"
+        hass = self.hass
+        rendered_fragments = self._rendered_fragments
+        reuse = not kwargs and variables is self._fragment_variables
+        self._fragment_variables = variables
+        if variables is not None:
+            kwargs.update(variables)
+
+        results: list[str] = []
+        # pylint: disable=protected-access
+        for idx, fragment in enumerate(fragments):
+            if isinstance(fragment, str):
+                results.append(fragment)
+                continue
+            if (
+                reuse
+                and (rendered := rendered_fragments[idx]) is not None
+                and rendered.async_is_current(hass)
+            ):
+                render_info._update(rendered.render_info)
+                results.append(rendered.result)
+                continue
+
+            rendered_fragments[idx] = None
+            fragment_info = RenderInfo(self)
+            token = _render_info.set(fragment_info)
+            try:
+                result = _render_with_context(self.template, fragment, **kwargs)
+            except Exception as err:
+                raise TemplateError(err) from err
+            finally:
+                _render_info.reset(token)
+                render_info._update(fragment_info)
+            if _fragment_is_cacheable(fragment_info):
+                rendered_fragments[idx] = _RenderedFragment(hass, result, fragment_info)
+            results.append(result)
+
+        render_result = "".join(results).strip()
+        if hass.config.legacy_templates:
+            return render_result
+        return self._parse_result(render_result)
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -2643,10 +2884,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             or filename is not None
             or raw is not False
             or defer_init is not False
+            or not isinstance(source, str)
         ):
             # If there are any non-default keywords args, we do
             # not cache.  In prodution we currently do not have
-            # any instance of this.
+            # any instance of this.  Parsed templates are only
+            # compiled once per template fragment.
             return super().compile(  # type: ignore[no-any-return,call-overload]
                 source,
                 name,
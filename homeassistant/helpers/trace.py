@@ -14,6 +14,28 @@ import homeassistant.util.dt as dt_util
 from .typing import TemplateVarsType
 
 
+def _same_value(value: Any, other: Any) -> bool:
+    """Return True if the values are equal and of the same types.
+
+    Unlike ==, this does not consider True, 1 and 1.0 the same.
+    """
+    if type(value) is not type(other):
+        return False
+    if isinstance(value, dict):
+        return _same_value(set(value), set(other)) and all(
+            _same_value(item, other[key]) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return len(value) == len(other) and all(
+            _same_value(item, other_item) for item, other_item in zip(value, other)
+        )
+    if isinstance(value, (set, frozenset)):
+        return {(type(item), item) for item in value} == {
+            (type(item), item) for item in other
+        }
+    return bool(value == other)
+
+
 class TraceElement:
     """Container for trace data."""
 
@@ -53,6 +75,24 @@ class TraceElement:
         """Container for trace data."""
         return str(self.as_dict())
 
+    def share_variables(self, shared_variables: dict[str, Any]) -> None:
+        """Replace changed variables by equal values in shared_variables.
+
+        Values must also have the same types to be shared. Other values are
+        added to shared_variables instead.
+        """
+        variables = self._variables
+        for key, value in variables.items():
+            if key not in shared_variables:
+                shared_variables[key] = value
+                continue
+            if (shared_value := shared_variables[key]) is value:
+                continue
+            if _same_value(shared_value, value):
+                variables[key] = shared_value
+            else:
+                shared_variables[key] = value
+
     def set_child_id(self, child_key: str, child_run_id: str) -> None:
         """Set trace id of a nested script run."""
         self._child_key = child_key
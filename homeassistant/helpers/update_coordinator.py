@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from random import randint
@@ -46,10 +47,22 @@ _DataUpdateCoordinatorT = TypeVar(
 )
 
 
+# Used for contexts missing from the data
+_MISSING = object()
+
+
 class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class CoordinatorUpdateMetrics:
+    """Listener update metrics of a coordinator."""
+
+    updated: int = 0
+    skipped: int = 0
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -66,6 +79,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`update_changed_contexts` to ``True`` will cause coordinator
+    to only callback the listeners whose context is a key of the data that
+    changed, if the data is a mapping. Listeners without a context are always
+    called. This requires that the values implement ``__eq__``.
     """
 
     def __init__(
@@ -78,6 +96,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        update_changed_contexts: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -88,6 +107,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.update_changed_contexts = update_changed_contexts
+        self.update_metrics = CoordinatorUpdateMetrics()
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -179,7 +200,37 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
+        listeners = list(self._listeners.values())
+        self.update_metrics.updated += len(listeners)
+        for update_callback, _ in listeners:
+            update_callback()
+
+    @callback
+    def _async_update_changed_listeners(self, previous_data: _DataT) -> None:
+        """Update the listeners whose context changed in the data."""
+        data = self.data
+        if (
+            not isinstance(data, Mapping)
+            or not isinstance(previous_data, Mapping)
+            or data is previous_data
+        ):
+            # There is nothing to compare to
+            self.async_update_listeners()
+            return
+        metrics = self.update_metrics
+        for update_callback, context in list(self._listeners.values()):
+            if context is not None:
+                try:
+                    unchanged = previous_data.get(context, _MISSING) == data.get(
+                        context, _MISSING
+                    )
+                except TypeError:
+                    # The context is not hashable
+                    unchanged = False
+                if unchanged:
+                    metrics.skipped += 1
+                    continue
+            metrics.updated += 1
             update_callback()
 
     async def async_shutdown(self) -> None:
@@ -392,12 +443,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if not self.last_update_success and not previous_update_success:
             return
 
-        if (
-            self.always_update
-            or self.last_update_success != previous_update_success
-            or previous_data != self.data
-        ):
+        if self.last_update_success != previous_update_success:
             self.async_update_listeners()
+        elif self.always_update or previous_data != self.data:
+            if self.update_changed_contexts:
+                self._async_update_changed_listeners(previous_data)
+            else:
+                self.async_update_listeners()
 
     @callback
     def async_set_update_error(self, err: Exception) -> None:
@@ -414,6 +466,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
+        previous_data = self.data
+        previous_update_success = self.last_update_success
         self.data = data
         self.last_update_success = True
         self.logger.debug(
@@ -424,7 +478,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._listeners:
             self._schedule_refresh()
 
-        self.async_update_listeners()
+        if self.update_changed_contexts and previous_update_success:
+            self._async_update_changed_listeners(previous_data)
+        else:
+            self.async_update_listeners()
 
 
 class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
@@ -12,8 +12,11 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
+import threading
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,7 +28,8 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .core import HomeAssistant, callback
+from .const import EVENT_HOMEASSISTANT_STARTED
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -33,7 +37,8 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
-from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
+from .util.file import WriteError, write_utf8_file
+from .util.json import JSON_DECODE_EXCEPTIONS, json_loads, json_loads_object
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -48,6 +53,11 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_INTEGRATION_INDEX = "integration_index"
+# Seconds it took to import integrations and their platforms by module name
+DATA_IMPORT_TIMES = "integration_import_times"
+INTEGRATION_INDEX_FILE = ".storage/core.integration_index"
+INTEGRATION_INDEX_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -171,6 +181,136 @@ def async_setup(hass: HomeAssistant) -> None:
     _async_mount_config_dir(hass)
     hass.data[DATA_COMPONENTS] = {}
     hass.data[DATA_INTEGRATIONS] = {}
+    hass.data[DATA_IMPORT_TIMES] = {}
+
+
+class IntegrationIndex:
+    """Manifests and directory listings that are kept across restarts.
+
+    A manifest is reused as long as the mtime and size of the file are
+    unchanged and a directory listing as long as the mtime of the directory
+    is unchanged, so resolving integrations on start only needs to stat the
+    files instead of reading and parsing every manifest.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the index."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._manifests: dict[str, tuple[int, int, Manifest]] = {}
+        self._listings: dict[str, tuple[int, list[str]]] = {}
+        self._used: set[str] = set()
+        self._changed = False
+        self.hits = 0
+        self.misses = 0
+        self.resolve_time = 0.0
+
+    def load(self) -> None:
+        """Load the index from disk."""
+        try:
+            with open(self.path, encoding="utf-8") as fdesc:
+                data: dict[str, Any] = json_loads_object(fdesc.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid integration index %s: %s", self.path, err)
+            return
+        if data.get("version") != INTEGRATION_INDEX_VERSION:
+            return
+        # JSON stores the tuples as lists
+        self._manifests = {
+            path: tuple(entry) for path, entry in data["manifests"].items()
+        }
+        self._listings = {
+            path: tuple(entry) for path, entry in data["listings"].items()
+        }
+
+    def save(self) -> None:
+        """Save the index if manifests or listings changed."""
+        with self._lock:
+            for path in self._manifests.keys() - self._used:
+                # Keep manifests of integrations that were not loaded
+                # during this run unless they were removed
+                if not os.path.isfile(path):
+                    del self._manifests[path]
+                    self._changed = True
+            if not self._changed:
+                return
+            data = {
+                "version": INTEGRATION_INDEX_VERSION,
+                "manifests": self._manifests,
+                "listings": self._listings,
+            }
+            self._changed = False
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.json import json_dumps
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, json_dumps(data))
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Unable to save integration index %s: %s", self.path, err)
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest at a path or None if there is no manifest."""
+        start = time.monotonic()
+        path = str(manifest_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        entry = self._manifests.get(path)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            manifest = entry[2]
+            hit = True
+        else:
+            manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+            hit = False
+        with self._lock:
+            self._used.add(path)
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._manifests[path] = (stat.st_mtime_ns, stat.st_size, manifest)
+                self._changed = True
+            self.resolve_time += time.monotonic() - start
+        # Integration adds keys to the manifest
+        return cast(Manifest, dict(manifest))
+
+    def get_sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a directory."""
+        mtime = os.stat(path).st_mtime_ns
+        if (entry := self._listings.get(path)) is not None and entry[0] == mtime:
+            return entry[1]
+        names = [entry.name for entry in os.scandir(path) if entry.is_dir()]
+        with self._lock:
+            self._listings[path] = (mtime, names)
+            self._changed = True
+        return names
+
+
+async def async_load_integration_index(hass: HomeAssistant) -> None:
+    """Resolve integrations from the integration index.
+
+    The index is updated with the manifests that were read
+    once Home Assistant has started.
+    """
+    index = IntegrationIndex(hass.config.path(INTEGRATION_INDEX_FILE))
+    await hass.async_add_executor_job(index.load)
+    hass.data[DATA_INTEGRATION_INDEX] = index
+
+    async def _async_save_index(_event: Event) -> None:
+        """Save the index after start up."""
+        _LOGGER.debug(
+            "Resolved %s manifests from the integration index and read %s in %.3fs",
+            index.hits,
+            index.misses,
+            index.resolve_time,
+        )
+        await hass.async_add_executor_job(index.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_index)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -196,10 +336,14 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    index: IntegrationIndex | None = hass.data.get(DATA_INTEGRATION_INDEX)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if index is not None:
+            return [name for path in paths for name in index.get_sub_directories(path)]
         return [
-            entry
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
@@ -213,7 +357,7 @@ async def _async_get_custom_components(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
     )
     return {
         integration.domain: integration
@@ -556,14 +700,20 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index: IntegrationIndex | None = hass.data.get(DATA_INTEGRATION_INDEX)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
+            if index is None and not manifest_path.is_file():
                 continue
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if index is None:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                elif (index_manifest := index.get_manifest(manifest_path)) is None:
+                    continue
+                else:
+                    manifest = index_manifest
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -813,7 +963,7 @@ class Integration:
 
         try:
             cache[self.domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol, _import_module(self.hass, self.pkg_path)
             )
         except ImportError:
             raise
@@ -850,13 +1000,45 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module(self.hass, f"{self.pkg_path}.{platform_name}")
+
+    def preload_modules(self, platform_names: Iterable[str]) -> None:
+        """Import the component and the platforms it has into sys.modules.
+
+        This allows get_component and get_platform to return without
+        blocking the event loop. Errors are ignored, they are raised
+        again when the component or platform is loaded.
+
+        This method must be run in the executor.
+        """
+        if self.domain in self.hass.data[DATA_COMPONENTS]:
+            return
+        try:
+            _import_module(self.hass, self.pkg_path)
+            files = set(os.listdir(self.file_path))
+        except Exception:  # pylint: disable=broad-except
+            return
+        for platform_name in platform_names:
+            if f"{platform_name}.py" not in files and platform_name not in files:
+                continue
+            with suppress(Exception):
+                _import_module(self.hass, f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module and record how long importing it took."""
+    if name in sys.modules:
+        return importlib.import_module(name)
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    hass.data.setdefault(DATA_IMPORT_TIMES, {})[name] = time.perf_counter() - start
+    return module
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: list[str]
 ) -> dict[str, Integration]:
@@ -6,8 +6,12 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import json
 import logging
+import os
+import random
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -19,6 +23,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +232,49 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_event_keyed_helper(hass):
+    """Run 100k events through state changed event helper.
+
+    With 5000 tracked entities, one event per entity in turn.
+    """
+    count = 0
+    entity_id = "light.kitchen"
+    entities_to_track = 5000
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(entities_to_track):
+        async_track_state_change_event(hass, f"{entity_id}{idx}", listener)
+
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(f"{entity_id}{idx}", "off"),
+            "new_state": core.State(f"{entity_id}{idx}", "on"),
+        }
+        for idx in range(entities_to_track)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % entities_to_track])
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    runtime = timer() - start
+    print(f"{events_to_fire / runtime:.0f} events per second")
+    return runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +362,1088 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_staged_states(hass):
+    """Write 100k states to the recorder schema in commits of 2000.
+
+    Set RECORDER_BENCHMARK_DB_URL to a scratch database to compare SQLite,
+    MySQL and PostgreSQL. The recorder tables in it are dropped.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import Base, States
+    from homeassistant.components.recorder.table_managers.states import StatesManager
+
+    # pylint: enable=import-outside-toplevel
+
+    db_url = os.environ.get("RECORDER_BENCHMARK_DB_URL", "sqlite://")
+    states_to_write = 10**5
+    commit_size = 2000
+    entity_ids = [f"sensor.power_{idx}" for idx in range(200)]
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": entity_id,
+                "new_state": core.State(entity_id, str(idx)),
+            },
+        )
+        for idx, entity_id in enumerate(
+            entity_ids[idx % len(entity_ids)] for idx in range(states_to_write)
+        )
+    ]
+
+    def _write_orm(session: Session) -> None:
+        last_state: dict[str, States] = {}
+        for idx, event in enumerate(events, 1):
+            entity_id = event.data["entity_id"]
+            dbstate = States.from_event(event)
+            if old_state := last_state.get(entity_id):
+                dbstate.old_state = old_state
+            last_state[entity_id] = dbstate
+            session.add(dbstate)
+            if not idx % commit_size:
+                session.commit()
+                last_state.clear()
+
+    def _write_staged(session: Session) -> None:
+        states_manager = StatesManager()
+        states_manager.enable_staging()
+        staged = states_manager.staged
+        assert staged is not None
+        for idx, event in enumerate(events, 1):
+            entity_id = event.data["entity_id"]
+            old_state_row = states_manager.pop_pending_row(entity_id)
+            row = staged.append(
+                event,
+                entity_id,
+                None,
+                None,
+                None,
+                None,
+                None,
+                -1 if old_state_row is None else old_state_row,
+            )
+            states_manager.add_pending_row(entity_id, row)
+            if not idx % commit_size:
+                states_manager.insert_staged(session)
+                session.commit()
+                states_manager.post_commit_pending()
+
+    def _run() -> float:
+        engine = create_engine(db_url, future=True)
+        print("Using dialect:", engine.dialect.name)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        try:
+            with Session(engine) as session:
+                start = timer()
+                _write_orm(session)
+                print(f"ORM objects: {timer() - start}s")
+            with Session(engine) as session:
+                start = timer()
+                _write_staged(session)
+                return timer() - start
+        finally:
+            Base.metadata.drop_all(engine)
+            engine.dispose()
+
+    return await hass.async_add_executor_job(_run)
+
+
+@benchmark
+async def template_incremental_render(hass):
+    """Render a large template 1000 times, changing one sensor in between.
+
+    The template renders 1000 sensors one by one, an expanded group
+    of 200 lights and a loop over 500 switches.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.entity import DATA_ENTITY_SOURCE
+    from homeassistant.helpers.template import Template
+
+    # pylint: enable=import-outside-toplevel
+
+    hass.data[DATA_ENTITY_SOURCE] = {}
+    sensors = [f"sensor.power_{idx}" for idx in range(1000)]
+    lights = [f"light.room_{idx}" for idx in range(200)]
+    for entity_id in sensors:
+        hass.states.async_set(entity_id, "0")
+    for entity_id in lights:
+        hass.states.async_set(entity_id, "on")
+    for idx in range(500):
+        hass.states.async_set(f"switch.plug_{idx}", "off")
+    hass.states.async_set("group.lights", "on", {"entity_id": lights})
+    source = "".join(
+        f"{entity_id}: {{{{ states('{entity_id}') }}}}\n" for entity_id in sensors
+    )
+    source += (
+        "{% for light in expand('group.lights') %}{{ light.state }}{% endfor %}\n"
+        "{% for switch in states.switch %}{{ switch.state }}{% endfor %}"
+    )
+    renders = 1000
+
+    def _render(tmpl: Template) -> float:
+        start = timer()
+        for idx in range(renders):
+            hass.states.async_set(sensors[idx % len(sensors)], str(idx))
+            tmpl.async_render_to_info().result()
+        return timer() - start
+
+    print(f"Full renders: {_render(Template(source, hass))}s")
+    return _render(Template(source, hass, incremental=True))
+
+
+@benchmark
+async def statistics_sample_window(hass):
+    """Add 1000 samples to a full window of 20k and calculate statistics.
+
+    Runs the median, standard deviation and linear average on every sample.
+    """
+    # pylint: disable=import-outside-toplevel
+    import math
+    import statistics
+
+    from homeassistant.components.statistics.sensor import SampleWindow
+
+    # pylint: enable=import-outside-toplevel
+
+    window_size = 20000
+    samples = 1000
+    start_time = dt_util.utcnow()
+    values = [
+        (math.sin(idx / 100) * 20, start_time + timedelta(seconds=idx))
+        for idx in range(window_size + samples)
+    ]
+
+    def _average_linear(states, ages):
+        area = 0
+        for i in range(1, len(states)):
+            area += (
+                0.5
+                * (states[i] + states[i - 1])
+                * (ages[i] - ages[i - 1]).total_seconds()
+            )
+        return area / (ages[-1] - ages[0]).total_seconds()
+
+    states = collections.deque(maxlen=window_size)
+    ages = collections.deque(maxlen=window_size)
+    for value, age in values[:window_size]:
+        states.append(value)
+        ages.append(age)
+    start = timer()
+    for value, age in values[window_size:]:
+        states.append(value)
+        ages.append(age)
+        statistics.median(states)
+        statistics.stdev(states)
+        _average_linear(states, ages)
+    print(f"Full calculation: {timer() - start}s")
+
+    window = SampleWindow(window_size, sorted_values=True, circular=False)
+    for value, age in values[:window_size]:
+        window.append(value, age)
+    start = timer()
+    for value, age in values[window_size:]:
+        window.append(value, age)
+        window.median()
+        math.sqrt(window.variance)
+        window.area_linear / (window.ages[-1] - window.ages[0]).total_seconds()
+    return timer() - start
+
+
+@benchmark
+async def websocket_subscribe_entities(hass):
+    """Forward 5000 state changes to 40 subscribe_entities clients.
+
+    Compares a state changed listener and message per client
+    to the shared fanout of the websocket api.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import User
+    from homeassistant.auth.permissions.const import POLICY_READ
+    from homeassistant.components.websocket_api import messages
+    from homeassistant.components.websocket_api.commands import (
+        _async_get_entity_subscription_fanout,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    user = User(
+        name="bench",
+        is_owner=True,
+        is_active=True,
+        system_generated=False,
+        groups=[],
+        perm_lookup=None,
+    )
+    clients = 40
+    entity_ids = [f"light.room_{idx}" for idx in range(50)]
+
+    def _fire_state_changes() -> None:
+        for idx in range(5000):
+            hass.states.async_set(
+                entity_ids[idx % 50], "on" if idx % 100 < 50 else "off"
+            )
+
+    @core.callback
+    def _forward(send_message, msg_id, event):
+        permissions = user.permissions
+        if not permissions.access_all_entities(
+            POLICY_READ
+        ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
+            return
+        send_message(messages.cached_state_diff_message(msg_id, event))
+
+    queues = [collections.deque() for _ in range(clients)]
+    unsubs = [
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(_forward, queue.append, 7),
+            run_immediately=True,
+        )
+        for queue in queues
+    ]
+    start = timer()
+    _fire_state_changes()
+    print(f"Listener per client: {timer() - start}s")
+    for unsub in unsubs:
+        unsub()
+
+    fanout = _async_get_entity_subscription_fanout(hass)
+    queues = [collections.deque() for _ in range(clients)]
+    unsubs = [
+        fanout.async_subscribe(7, (queue.append, set(), user)) for queue in queues
+    ]
+    start = timer()
+    _fire_state_changes()
+    elapsed = timer() - start
+    for unsub in unsubs:
+        unsub()
+    return elapsed
+
+
+@benchmark
+async def storage_journal(hass):
+    """Save a registry with 5000 entries 100 times changing one entry each time.
+
+    Compares writing the whole data to appending the changes to the journal.
+    """
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant.helpers.storage import Store
+
+    # pylint: enable=import-outside-toplevel
+
+    data = {
+        "entities": [
+            {
+                "entity_id": f"light.room_{idx}",
+                "id": f"{idx:032x}",
+                "name": None,
+                "options": {"light": {"brightness": idx}},
+                "platform": "hue",
+            }
+            for idx in range(5000)
+        ]
+    }
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        timings = {}
+        for journal in (False, True):
+            store = Store(hass, 1, f"bench_{journal}", journal=journal)
+            start = timer()
+            for idx in range(100):
+                data["entities"][idx]["name"] = f"Room {idx}"
+                await store.async_save(data)
+            timings[journal] = timer() - start
+            metrics = store.write_metrics
+            print(
+                f"Journal {journal}: {timings[journal]}s, "
+                f"{metrics.bytes_written} bytes written, "
+                f"{metrics.serialization_time}s serializing"
+            )
+    return timings[True]
+
+
+@benchmark
+async def restore_state_dump(hass):
+    """Dump the states of 3000 restore entities 20 times changing 50 each time.
+
+    Compares writing all states to appending the changed ones to the journal.
+    """
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant.helpers import restore_state
+    from homeassistant.helpers.storage import Store
+
+    # pylint: enable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        timings = {}
+        for journal in (False, True):
+            data = restore_state.RestoreStateData(hass)
+            data.store = Store(
+                hass, 1, f"bench_{journal}", encoder=JSONEncoder, journal=journal
+            )
+            for idx in range(3000):
+                entity = restore_state.RestoreEntity()
+                entity.hass = hass
+                entity.entity_id = f"sensor.power_{idx}"
+                hass.states.async_set(
+                    entity.entity_id, "0", {"unit_of_measurement": "W", "idx": idx}
+                )
+                data.async_restore_entity_added(entity)
+            await data.async_dump_states()
+            start = timer()
+            for run in range(1, 21):
+                for idx in range(50):
+                    hass.states.async_set(
+                        f"sensor.power_{run * 50 + idx}",
+                        str(run),
+                        {"unit_of_measurement": "W"},
+                    )
+                await data.async_dump_states()
+            timings[journal] = timer() - start
+            metrics = data.store.write_metrics
+            print(
+                f"Journal {journal}: {timings[journal]}s, "
+                f"{metrics.bytes_written} bytes written"
+            )
+    return timings[True]
+
+
+@benchmark
+async def registry_lookups(hass):
+    """Look up the entities of 1000 devices and 50 areas among 10000 entities.
+
+    Compares the registry indexes to scanning all entries.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    entities = er.EntityRegistryItems()
+    for idx in range(10000):
+        entity_id = f"sensor.power_{idx}"
+        entities[entity_id] = er.RegistryEntry(
+            entity_id,
+            str(idx),
+            "zha",
+            area_id=f"area_{idx % 50}",
+            config_entry_id=f"entry_{idx % 10}",
+            device_id=f"device_{idx % 1000}",
+        )
+    registry = er.EntityRegistry(hass)
+    registry.entities = entities
+
+    start = timer()
+    for idx in range(1000):
+        device_id = f"device_{idx}"
+        [entry for entry in entities.values() if entry.device_id == device_id]
+    for idx in range(50):
+        area_id = f"area_{idx}"
+        [entry for entry in entities.values() if entry.area_id == area_id]
+    print(f"Scanning all entries: {timer() - start}s")
+
+    start = timer()
+    for idx in range(1000):
+        er.async_entries_for_device(registry, f"device_{idx}")
+    for idx in range(50):
+        er.async_entries_for_area(registry, f"area_{idx}")
+    return timer() - start
+
+
+@benchmark
+async def coordinator_changed_contexts(hass):
+    """Update 500 coordinator listeners 200 times with 5 changed values each time.
+
+    Compares calling every listener to only the ones whose context changed.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    def _listener(coordinator, entity_id):
+        hass.states.async_set(
+            entity_id, coordinator.data[entity_id], {"unit_of_measurement": "W"}
+        )
+
+    timings = {}
+    for update_changed_contexts in (False, True):
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="benchmark",
+            update_changed_contexts=update_changed_contexts,
+        )
+        data = {f"sensor.power_{idx}": 0 for idx in range(500)}
+        for entity_id in data:
+            coordinator.async_add_listener(
+                partial(_listener, coordinator, entity_id), entity_id
+            )
+        coordinator.async_set_updated_data(dict(data))
+        start = timer()
+        for run in range(200):
+            for idx in range(5):
+                data[f"sensor.power_{(run * 5 + idx) % 500}"] = run
+            coordinator.async_set_updated_data(dict(data))
+        timings[update_changed_contexts] = timer() - start
+        metrics = coordinator.update_metrics
+        print(
+            f"Changed contexts {update_changed_contexts}: "
+            f"{timings[update_changed_contexts]}s, "
+            f"{metrics.updated} updated, {metrics.skipped} skipped"
+        )
+    return timings[True]
+
+
+@benchmark
+async def entity_cached_attributes(hass):
+    """Write 50000 states of a power sensor with eight attributes.
+
+    Compares generating the attributes on every write to
+    reusing the cached attributes.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    class PowerSensor(Entity):
+        """Entity with attributes that do not change."""
+
+        _attr_extra_state_attributes = {f"attribute_{idx}": idx for idx in range(8)}
+        _attr_unit_of_measurement = "W"
+        _attr_name = "Power"
+
+    class CachedPowerSensor(PowerSensor):
+        """Power sensor that caches its attributes."""
+
+        _cache_attributes = True
+
+    timings = {}
+    for sensor_cls in (PowerSensor, CachedPowerSensor):
+        sensor = sensor_cls()
+        sensor.hass = hass
+        sensor.entity_id = f"sensor.{sensor_cls.__name__.lower()}"
+        start = timer()
+        for idx in range(50000):
+            sensor._attr_state = idx
+            sensor.async_write_ha_state()
+        timings[sensor_cls] = timer() - start
+    print(f"Generate every write: {timings[PowerSensor]}s")
+    return timings[CachedPowerSensor]
+
+
+@benchmark
+async def yaml_snapshot(hass):
+    """Load a configuration including 500 automation files 10 times.
+
+    Compares parsing all files to reusing them from a snapshot.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tempfile
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.config import load_yaml_config_file
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.mkdir(os.path.join(config_dir, "automations"))
+        for idx in range(500):
+            with open(
+                os.path.join(config_dir, "automations", f"automation_{idx}.yaml"),
+                "w",
+                encoding="utf-8",
+            ) as fil:
+                fil.write(
+                    f"- alias: Automation {idx}\n"
+                    "  trigger:\n"
+                    "    - platform: state\n"
+                    f"      entity_id: binary_sensor.motion_{idx}\n"
+                    "      to: 'on'\n"
+                    "  action:\n"
+                    "    - service: light.turn_on\n"
+                    f"      target: {{entity_id: light.room_{idx}}}\n"
+                    "      data: {brightness: 255, transition: 2}\n"
+                )
+        config_path = os.path.join(config_dir, "configuration.yaml")
+        with open(config_path, "w", encoding="utf-8") as fil:
+            fil.write("automation: !include_dir_merge_list automations\n")
+        snapshot_path = os.path.join(config_dir, ".storage", "core.yaml_snapshot")
+
+        timings = {}
+        for path in (None, snapshot_path):
+            start = timer()
+            for _ in range(10):
+                await hass.async_add_executor_job(
+                    load_yaml_config_file, config_path, None, path
+                )
+            timings[path] = timer() - start
+    print(f"Parse every load: {timings[None]}s")
+    return timings[snapshot_path]
+
+
+@benchmark
+async def integration_index(hass):
+    """Resolve the manifests of all built-in integrations 10 times.
+
+    Compares reading every manifest to resolving them from the index.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tempfile
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import components, loader
+
+    domains = [
+        entry.name
+        for entry in os.scandir(components.__path__[0])
+        if entry.is_dir() and not entry.name.startswith("_")
+    ]
+    logging.getLogger("homeassistant.loader").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as config_dir:
+        index_path = os.path.join(config_dir, "core.integration_index")
+        # Create the index like the previous start would have
+        hass.data[loader.DATA_INTEGRATION_INDEX] = loader.IntegrationIndex(index_path)
+        await hass.async_add_executor_job(
+            loader._resolve_integrations_from_root, hass, components, domains
+        )
+        await hass.async_add_executor_job(hass.data[loader.DATA_INTEGRATION_INDEX].save)
+
+        timings = {}
+        for use_index in (False, True):
+            hass.data.pop(loader.DATA_INTEGRATION_INDEX, None)
+            start = timer()
+            for _ in range(10):
+                if use_index:
+                    index = loader.IntegrationIndex(index_path)
+                    await hass.async_add_executor_job(index.load)
+                    hass.data[loader.DATA_INTEGRATION_INDEX] = index
+                await hass.async_add_executor_job(
+                    loader._resolve_integrations_from_root, hass, components, domains
+                )
+            timings[use_index] = timer() - start
+    print(f"Read every manifest: {timings[False]}s")
+    return timings[True]
+
+
+@benchmark
+async def condition_plan(hass):
+    """Evaluate an automation condition with an and and an or 50000 times.
+
+    Compares tracing the conditions to evaluating the compiled plan.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import condition, config_validation as cv, trace
+
+    # pylint: enable=import-outside-toplevel
+
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                "{{ states('sensor.power') | float(0) > 100 }}",
+                {
+                    "condition": "state",
+                    "entity_id": "binary_sensor.door",
+                    "state": "on",
+                },
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": "sensor.temperature",
+                            "below": 18,
+                        },
+                        {
+                            "condition": "state",
+                            "entity_id": "sun.sun",
+                            "state": "below_horizon",
+                        },
+                    ],
+                },
+            ],
+        }
+    )
+    check = await condition.async_from_config(hass, config)
+    hass.states.async_set("sensor.power", "150")
+    hass.states.async_set("binary_sensor.door", "off")
+    hass.states.async_set("sensor.temperature", "20")
+    hass.states.async_set("sun.sun", "above_horizon")
+
+    untraced = condition.async_get_untraced(check)
+
+    timings = {}
+    for traced in (True, False):
+        start = timer()
+        for _ in range(50000):
+            if traced:
+                trace.trace_clear()
+                check(hass)
+            else:
+                untraced(hass)
+        timings[traced] = timer() - start
+    print(f"Traced: {timings[True]}s")
+    return timings[False]
+
+
+@benchmark
+async def trace_storage(hass):
+    """Serialize 5 traces of 500 automations with 20 steps each.
+
+    Compares storing every trace with its configuration to storing
+    the configuration once per automation.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.automation.trace import AutomationTrace
+    from homeassistant.components.trace import _compact_traces
+    from homeassistant.helpers import trace
+    from homeassistant.helpers.json import ExtendedJSONEncoder
+
+    # pylint: enable=import-outside-toplevel
+
+    traces = {}
+    for idx in range(500):
+        config = {
+            "id": f"automation_{idx}",
+            "trigger": [{"platform": "state", "entity_id": f"sensor.power_{idx}"}],
+            "action": [
+                {"service": "light.turn_on", "target": {"entity_id": f"light.{step}"}}
+                for step in range(20)
+            ],
+        }
+        key_traces = traces[f"automation.automation_{idx}"] = []
+        for run in range(5):
+            trace.trace_clear()
+            automation_trace = AutomationTrace(
+                f"automation_{idx}", config, None, core.Context()
+            )
+            for step in range(20):
+                trace.trace_append_element(
+                    trace.TraceElement({"run": run, "step": step}, f"action/{step}")
+                )
+            automation_trace.set_trace(trace.trace_get(clear=False))
+            automation_trace.finished()
+            key_traces.append(automation_trace)
+
+    timings = {}
+    for compact in (False, True):
+        start = timer()
+        if compact:
+            data = {
+                key: _compact_traces(
+                    [action_trace.as_extended_dict() for action_trace in key_traces]
+                )
+                for key, key_traces in traces.items()
+            }
+        else:
+            data = {
+                key: [action_trace.as_dict() for action_trace in key_traces]
+                for key, key_traces in traces.items()
+            }
+        size = len(json.dumps(data, cls=ExtendedJSONEncoder))
+        timings[compact] = timer() - start
+        print(f"Compact {compact}: {timings[compact]}s, {size} bytes")
+    return timings[True]
+
+
+@benchmark
+async def mqtt_subscription_matching(hass):
+    """Match 5000 Zigbee2MQTT messages against 300 wildcard subscriptions.
+
+    The workload mirrors a Zigbee2MQTT setup with 300 devices and
+    compares running the matcher of every subscription to the topic trie.
+    """
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    # pylint: enable=import-outside-toplevel
+
+    job = core.HassJob(lambda msg: None)
+    topics = [
+        "homeassistant/+/+/config",
+        "homeassistant/+/+/+/config",
+        "tasmota/discovery/#",
+        *(f"zigbee2mqtt/device_{idx}/+/set" for idx in range(297)),
+    ]
+    messages = [
+        f"zigbee2mqtt/device_{idx % 300}{'/availability' if idx % 5 else ''}"
+        for idx in range(5000)
+    ]
+
+    def _matcher_for_topic(subscription):
+        matcher = MQTTMatcher()
+        matcher[subscription] = True
+        return lambda topic: next(matcher.iter_match(topic), False)
+
+    matchers = [_matcher_for_topic(topic) for topic in topics]
+    start = timer()
+    for topic in messages:
+        [matcher for matcher in matchers if matcher(topic)]
+    print(f"Match every subscription: {timer() - start}s")
+
+    trie = SubscriptionTrie()
+    for topic in topics:
+        trie.add(Subscription(topic, job))
+    start = timer()
+    for topic in messages:
+        trie.match(topic)
+    return timer() - start
+
+
+@benchmark
+async def mqtt_message_dispatch(hass):
+    """Dispatch 50000 messages received by the paho thread to 300 subscriptions.
+
+    Compares scheduling every message on the event loop to batching them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components.mqtt.client import MQTT
+    from homeassistant.components.mqtt.models import MqttData
+    from homeassistant.config_entries import ConfigEntry
+
+    # pylint: enable=import-outside-toplevel
+
+    count = 50000
+    entry = ConfigEntry(1, "mqtt", "MQTT", {}, "user")
+    client = MQTT(hass, entry, {"broker": "localhost"})
+    client.start(MqttData(client=client, config=[]))
+    received = 0
+    done = asyncio.Event()
+
+    @core.callback
+    def _message_received(msg):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    for idx in range(300):
+        await client.async_subscribe(f"zigbee2mqtt/device_{idx}", _message_received, 0)
+
+    messages = []
+    for idx in range(count):
+        msg = MQTTMessage(topic=f"zigbee2mqtt/device_{idx % 300}".encode())
+        msg.payload = b'{"state": "ON", "brightness": 255}'
+        messages.append(msg)
+
+    def _schedule_every_message():
+        for msg in messages:
+            hass.loop.call_soon_threadsafe(client._mqtt_handle_message, msg)
+
+    def _queue_messages():
+        for msg in messages:
+            client._mqtt_on_message(None, None, msg)
+
+    timings = {}
+    for receive in (_schedule_every_message, _queue_messages):
+        received = 0
+        done.clear()
+        start = timer()
+        await hass.async_add_executor_job(receive)
+        await done.wait()
+        timings[receive] = timer() - start
+    print(f"Schedule every message: {timings[_schedule_every_message]}s")
+    print(f"Batches: {client.message_queue_metrics.batches}")
+    return timings[_queue_messages]
+
+
+@benchmark
+async def mqtt_discovery(hass):
+    """Replay 3000 retained discovery messages after reconnecting to the broker.
+
+    Compares processing the unchanged payloads again to skipping them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components.mqtt import discovery
+    from homeassistant.components.mqtt.client import MQTT
+    from homeassistant.components.mqtt.const import DATA_MQTT
+    from homeassistant.components.mqtt.models import MqttData
+    from homeassistant.config_entries import ConfigEntries, ConfigEntry
+    from homeassistant.helpers.dispatcher import (
+        async_dispatcher_connect,
+        async_dispatcher_send,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    logging.getLogger(discovery.__name__).setLevel(logging.WARNING)
+    count = 3000
+    entry = ConfigEntry(1, "mqtt", "MQTT", {}, "user")
+    hass.config_entries = ConfigEntries(hass, {})
+    hass.config_entries._entries[entry.entry_id] = entry
+    hass.config_entries._domain_index["mqtt"] = [entry]
+    client = MQTT(hass, entry, {"broker": "localhost"})
+    mqtt_data = hass.data[DATA_MQTT] = MqttData(client=client, config=[])
+    client.start(mqtt_data)
+
+    @core.callback
+    def _discovery_done(discovery_payload):
+        discovery_hash = discovery_payload.discovery_data["discovery_hash"]
+        async_dispatcher_send(
+            hass, discovery.MQTT_DISCOVERY_DONE.format(discovery_hash), None
+        )
+
+    @core.callback
+    def _discovered(discovery_payload):
+        discovery_hash = discovery_payload.discovery_data["discovery_hash"]
+        async_dispatcher_connect(
+            hass,
+            discovery.MQTT_DISCOVERY_UPDATED.format(discovery_hash),
+            _discovery_done,
+        )
+        _discovery_done(discovery_payload)
+
+    async_dispatcher_connect(
+        hass, discovery.MQTT_DISCOVERY_NEW.format("sensor", "mqtt"), _discovered
+    )
+    await discovery.async_start(hass, "homeassistant", entry)
+
+    messages = []
+    for idx in range(count):
+        msg = MQTTMessage(
+            topic=f"homeassistant/sensor/0x{idx:016x}/temperature/config".encode()
+        )
+        msg.payload = json.dumps(
+            {
+                "~": f"zigbee2mqtt/0x{idx:016x}",
+                "avty": [{"t": "zigbee2mqtt/bridge/state"}],
+                "dev": {
+                    "ids": [f"zigbee2mqtt_0x{idx:016x}"],
+                    "mf": "Xiaomi",
+                    "mdl": "Aqara temperature, humidity and pressure sensor",
+                    "name": f"0x{idx:016x}",
+                    "sw": "3000-0001",
+                },
+                "dev_cla": "temperature",
+                "enabled_by_default": True,
+                "name": None,
+                "o": {"name": "Zigbee2MQTT", "sw": "1.33.1"},
+                "stat_cla": "measurement",
+                "stat_t": "~",
+                "uniq_id": f"0x{idx:016x}_temperature_zigbee2mqtt",
+                "unit_of_meas": "°C",
+                "val_tpl": "{{ value_json.temperature }}",
+            }
+        ).encode()
+        msg.retain = True
+        messages.append(msg)
+
+    async def _receive_messages():
+        # Retained messages are received again after reconnecting
+        client._retained_topics.clear()
+        start = timer()
+        for msg in messages:
+            client._mqtt_handle_message(msg)
+        await hass.async_block_till_done()
+        return timer() - start
+
+    discovered = await _receive_messages()
+    mqtt_data.discovery_payloads.clear()
+    processed = await _receive_messages()
+    skipped = await _receive_messages()
+    print(f"Discover: {discovered}s")
+    print(f"Process unchanged payloads: {processed}s")
+    print(discovery.async_discovery_diagnostics(hass))
+    return skipped
+
+
+@benchmark
+async def bluetooth_advertisement_replay(hass):
+    """Replay a minute of advertisements from 400 devices heard by six proxies."""
+    # pylint: disable=import-outside-toplevel
+    from bleak_retry_connector import BleakSlotManager
+    from bluetooth_adapters import BluetoothAdapters
+
+    from homeassistant.components.bluetooth import models
+    from homeassistant.components.bluetooth.base_scanner import BaseHaRemoteScanner
+    from homeassistant.components.bluetooth.manager import BluetoothManager
+    from homeassistant.components.bluetooth.match import IntegrationMatcher
+    from homeassistant.components.bluetooth.storage import BluetoothStorage
+    from homeassistant.config_entries import ConfigEntries
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    # pylint: enable=import-outside-toplevel
+
+    class _Scanner(BaseHaRemoteScanner):
+        """Scanner replaying the advertisements."""
+
+    hass.config_entries = ConfigEntries(hass, {})
+    integration_matcher = IntegrationMatcher(BLUETOOTH)
+    integration_matcher.async_setup()
+    manager = models.MANAGER = BluetoothManager(
+        hass,
+        integration_matcher,
+        BluetoothAdapters(),
+        BluetoothStorage(hass),
+        BleakSlotManager(),
+    )
+    received = 0
+
+    @core.callback
+    def _advertisement_received(service_info, change):
+        nonlocal received
+        received += 1
+
+    manager.async_register_callback(_advertisement_received, {"connectable": False})
+
+    rnd = random.Random(1)
+    payloads = (
+        ("ATC_A1B2C3", [], {"0000181a-0000-1000-8000-00805f9b34fb": b"\x01" * 13}, {}),
+        (None, [], {}, {76: b"\x10\x05\x01\x18\x7c\x3a\x2b"}),
+        ("GVH5075_1234", ["0000ec88-0000-1000-8000-00805f9b34fb"], {}, {1: b"\x00"}),
+        (None, [], {"0000fcd2-0000-1000-8000-00805f9b34fb": b"\x40\x00\x01"}, {}),
+    )
+    devices = []
+    for idx in range(400):
+        # A third of the devices advertise every 100ms, the
+        # rest every 1 to 10 seconds
+        interval = 0.1 if idx % 3 == 0 else rnd.uniform(1, 10)
+        devices.append((f"AA:BB:CC:DD:{idx // 256:02X}:{idx % 256:02X}", interval))
+
+    # Every proxy hears half of the devices and sends
+    # the advertisements in chunks of 16
+    chunks = []
+    for proxy in range(6):
+        scanner = _Scanner(hass, f"proxy_{proxy}", f"proxy_{proxy}", None, None, True)
+        scanner._new_info_callback = manager.scanner_adv_received
+        manager.async_register_scanner(scanner, True)
+        heard = []
+        for address, interval in rnd.sample(devices, 200):
+            name, uuids, service_data, manufacturer_data = payloads[
+                int(address[-2:], 16) % 4
+            ]
+            rssi = -60 - rnd.randint(0, 30)
+            when = rnd.uniform(0, interval)
+            while when < 60:
+                # Sensors send a new measurement every 10 seconds
+                measurement = int(when) // 10
+                heard.append(
+                    (
+                        when,
+                        (
+                            address,
+                            rssi + rnd.randint(-3, 3),
+                            name,
+                            uuids,
+                            {
+                                uuid: data + bytes([measurement])
+                                for uuid, data in service_data.items()
+                            },
+                            manufacturer_data,
+                            None,
+                            {},
+                        ),
+                    )
+                )
+                when += interval
+        heard.sort(key=lambda advertisement: advertisement[0])
+        chunks.extend(
+            (scanner, heard[idx][0], [adv for _, adv in heard[idx : idx + 16]])
+            for idx in range(0, len(heard), 16)
+        )
+    chunks.sort(key=lambda chunk: chunk[1])
+    count = sum(len(advertisements) for _, _, advertisements in chunks)
+
+    def _replay(offset):
+        for scanner, when, advertisements in chunks:
+            for advertisement in advertisements:
+                scanner._async_on_advertisement(*advertisement, offset + when)
+
+    # Fill the history first
+    _replay(0)
+    received = 0
+    start = timer()
+    _replay(60)
+    elapsed = timer() - start
+    print(f"Advertisements: {count}")
+    print(f"Callbacks: {received}")
+    return elapsed
+
+
+@benchmark
+async def bluetooth_match_index(hass):
+    """Match the advertisements of 400 devices against the integration matchers.
+
+    Compares matching every advertisement against the buckets
+    to the match cache keyed by the advertisement fingerprint.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+
+    from homeassistant.components.bluetooth.match import BluetoothMatcherIndex
+    from homeassistant.components.bluetooth.models import BluetoothServiceInfoBleak
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    # pylint: enable=import-outside-toplevel
+
+    index = BluetoothMatcherIndex()
+    for matcher in BLUETOOTH:
+        index.add(matcher)
+    index.build()
+
+    payloads = (
+        ("ATC_A1B2C3", [], {"0000181a-0000-1000-8000-00805f9b34fb": b"\x01" * 13}, {}),
+        (None, [], {}, {76: b"\x10\x05\x01\x18\x7c\x3a\x2b"}),
+        ("GVH5075_1234", ["0000ec88-0000-1000-8000-00805f9b34fb"], {}, {1: b"\x00"}),
+        (None, [], {"0000fcd2-0000-1000-8000-00805f9b34fb": b"\x40\x00\x01"}, {}),
+        ("Ruuvi 1A2B", [], {}, {1177: b"\x05\x12\xfc\x53\x94\xc3\x7c"}),
+    )
+    service_infos = []
+    for measurement in range(50):
+        for idx in range(400):
+            address = f"AA:BB:CC:DD:{idx // 256:02X}:{idx % 256:02X}"
+            name, uuids, service_data, manufacturer_data = payloads[idx % 5]
+            service_data = {
+                uuid: data + bytes([measurement]) for uuid, data in service_data.items()
+            }
+            manufacturer_data = {
+                manufacturer_id: data + bytes([measurement])
+                for manufacturer_id, data in manufacturer_data.items()
+            }
+            device = BLEDevice(address, name, {}, -60)
+            service_infos.append(
+                BluetoothServiceInfoBleak(
+                    name=name or address,
+                    address=address,
+                    rssi=-60,
+                    manufacturer_data=manufacturer_data,
+                    service_data=service_data,
+                    service_uuids=uuids,
+                    source="local",
+                    device=device,
+                    advertisement=AdvertisementData(
+                        name, manufacturer_data, service_data, uuids, -127, -60, ()
+                    ),
+                    connectable=True,
+                    time=0,
+                )
+            )
+
+    start = timer()
+    for service_info in service_infos:
+        index._match(service_info)
+    uncached = timer() - start
+    start = timer()
+    for service_info in service_infos:
+        index.match(service_info)
+    cached = timer() - start
+    print(f"Advertisements: {len(service_infos)}")
+    print(f"Without cache: {uncached}s")
+    print(f"Match cache: {index.diagnostics()}")
+    return cached
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
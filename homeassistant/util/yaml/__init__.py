@@ -2,7 +2,7 @@
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
-from .loader import Secrets, load_yaml, parse_yaml, secret_yaml
+from .loader import Secrets, load_yaml, parse_yaml, secret_yaml, yaml_snapshot
 from .objects import Input
 
 __all__ = [
@@ -14,6 +14,7 @@ __all__ = [
     "load_yaml",
     "secret_yaml",
     "parse_yaml",
+    "yaml_snapshot",
     "UndefinedSubstitution",
     "extract_inputs",
     "substitute",
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 import fnmatch
-from io import StringIO, TextIOWrapper
+from io import BytesIO, StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import pickle
+import tempfile
 from typing import Any, TextIO, TypeVar, overload
 
 import yaml
@@ -34,6 +37,206 @@ _DictT = TypeVar("_DictT", bound=dict)
 
 _LOGGER = logging.getLogger(__name__)
 
+YAML_SNAPSHOT_VERSION = 1
+
+# A file (path, mtime_ns, size), a directory listing (path, pattern, files)
+# or an environment variable (name, value) a parsed file was built from
+_Dependency = tuple[str, str, Any, Any]
+# Marks a parsed file that can not be reused from a snapshot
+_UNCACHEABLE: _Dependency = ("uncacheable", "", None, None)
+
+_SNAPSHOT_CLASSES = {
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+    ("homeassistant.util.yaml.objects", "Input"),
+    ("homeassistant.util.yaml.objects", "NodeDictClass"),
+    ("homeassistant.util.yaml.objects", "NodeListClass"),
+    ("homeassistant.util.yaml.objects", "NodeStrClass"),
+}
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that only creates the objects the YAML loader creates."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        """Return a class that is allowed in a snapshot."""
+        if (module, name) not in _SNAPSHOT_CLASSES:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed")
+        return super().find_class(module, name)
+
+
+def _file_dependency(path: str) -> _Dependency:
+    """Return the dependency on a file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ("file", path, None, None)
+    return ("file", path, stat.st_mtime_ns, stat.st_size)
+
+
+class YamlSnapshot:
+    """Parsed YAML files that are reused while their sources are unchanged.
+
+    Each parsed file is kept with everything it was built from: the file
+    itself, the files it includes, the directories it lists, the secrets
+    files and the environment variables it uses. The files are reused
+    as long as all of them are unchanged, so only the changed files and
+    the files including them are parsed again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the snapshot."""
+        self.path = path
+        self._entries: dict[str, tuple[tuple[_Dependency, ...], bytes]] = {}
+        self._used: set[str] = set()
+        self._checked: dict[_Dependency, bool] = {}
+        self._collecting: list[set[_Dependency]] = []
+        self._changed = False
+
+    def load(self) -> None:
+        """Load the snapshot from disk."""
+        try:
+            with open(self.path, "rb") as fdesc:
+                snapshot = _SnapshotUnpickler(fdesc).load()
+        except FileNotFoundError:
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Ignoring invalid YAML snapshot %s: %s", self.path, err)
+            return
+        if (
+            isinstance(snapshot, dict)
+            and snapshot.get("version") == YAML_SNAPSHOT_VERSION
+        ):
+            self._entries = snapshot["entries"]
+
+    def save(self) -> None:
+        """Save the snapshot if files were parsed or are no longer used."""
+        if unused := self._entries.keys() - self._used:
+            for fname in unused:
+                del self._entries[fname]
+            self._changed = True
+        if not self._changed:
+            return
+        data = pickle.dumps(
+            {"version": YAML_SNAPSHOT_VERSION, "entries": self._entries},
+            pickle.HIGHEST_PROTOCOL,
+        )
+        tmp_filename = ""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # The snapshot contains the secrets, the temporary
+            # file is only readable by the owner
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(self.path), delete=False
+            ) as fdesc:
+                tmp_filename = fdesc.name
+                fdesc.write(data)
+            os.replace(tmp_filename, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to save YAML snapshot %s: %s", self.path, err)
+        finally:
+            if tmp_filename and os.path.exists(tmp_filename):
+                with suppress(OSError):
+                    os.remove(tmp_filename)
+        self._changed = False
+
+    def record(self, dependency: _Dependency) -> None:
+        """Record a dependency of the files being parsed."""
+        if self._collecting:
+            self._collecting[-1].add(dependency)
+
+    def load_yaml(self, fname: str, secrets: Secrets | None) -> JSON_TYPE:
+        """Load a YAML file from the snapshot or parse it."""
+        self._used.add(fname)
+        if (value := self._get(fname)) is not None:
+            return value
+
+        dependencies = {dependency := _file_dependency(fname)}
+        self._collecting.append(dependencies)
+        try:
+            value = _load_yaml_file(fname, secrets)
+            if dependency[2] is None:
+                # Only files on disk can be checked for changes
+                dependencies.add(_UNCACHEABLE)
+        finally:
+            self._collecting.pop()
+            if self._collecting:
+                self._collecting[-1].update(dependencies)
+
+        if _UNCACHEABLE not in dependencies:
+            try:
+                data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # Constructors added by integrations may create
+                # objects that can not be stored
+                self.record(_UNCACHEABLE)
+            else:
+                self._entries[fname] = (tuple(dependencies), data)
+                self._changed = True
+        return value
+
+    def _get(self, fname: str) -> JSON_TYPE | None:
+        """Return the parsed file if nothing it was built from changed."""
+        if (entry := self._entries.get(fname)) is None:
+            return None
+        dependencies, data = entry
+        if not all(self._unchanged(dependency) for dependency in dependencies):
+            return None
+        try:
+            value: JSON_TYPE = _SnapshotUnpickler(BytesIO(data)).load()
+        except Exception:  # pylint: disable=broad-except
+            return None
+        # The included files are not loaded and must be kept as well
+        self._used.update(
+            dependency[1] for dependency in dependencies if dependency[0] == "file"
+        )
+        if self._collecting:
+            self._collecting[-1].update(dependencies)
+        return value
+
+    def _unchanged(self, dependency: _Dependency) -> bool:
+        """Return if a dependency is unchanged."""
+        if (unchanged := self._checked.get(dependency)) is not None:
+            return unchanged
+        kind, name, value, _ = dependency
+        if kind == "file":
+            unchanged = _file_dependency(name) == dependency
+        elif kind == "dir":
+            unchanged = tuple(_walk_files(name, value)) == dependency[3]
+        elif kind == "env":
+            unchanged = os.environ.get(name) == value
+        else:
+            unchanged = False
+        self._checked[dependency] = unchanged
+        return unchanged
+
+
+_SNAPSHOT: ContextVar[YamlSnapshot | None] = ContextVar("yaml_snapshot", default=None)
+
+
+@contextmanager
+def yaml_snapshot(path: str) -> Iterator[None]:
+    """Reuse the YAML files stored in a snapshot while loading YAML.
+
+    The snapshot is updated with the files that were parsed.
+    """
+    snapshot = YamlSnapshot(path)
+    snapshot.load()
+    token = _SNAPSHOT.set(snapshot)
+    try:
+        yield
+    finally:
+        _SNAPSHOT.reset(token)
+    snapshot.save()
+
+
+def _record_dependency(dependency: _Dependency) -> None:
+    """Record a dependency of the files being parsed into a snapshot."""
+    if (snapshot := _SNAPSHOT.get()) is not None:
+        snapshot.record(dependency)
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -58,6 +261,7 @@ class Secrets:
                 break
 
             secrets = self._load_secret_yaml(secret_dir)
+            _record_dependency(_file_dependency(str(secret_dir / SECRET_YAML)))
 
             if secret in secrets:
                 _LOGGER.debug(
@@ -150,6 +354,13 @@ LoaderType = FastSafeLoader | PythonSafeLoader
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    if (snapshot := _SNAPSHOT.get()) is not None:
+        return snapshot.load_yaml(fname, secrets)
+    return _load_yaml_file(fname, secrets)
+
+
+def _load_yaml_file(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -258,8 +469,8 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
-def _find_files(directory: str, pattern: str) -> Iterator[str]:
-    """Recursively load files in a directory."""
+def _walk_files(directory: str, pattern: str) -> Iterator[str]:
+    """Recursively find files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
@@ -268,6 +479,13 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_files(directory: str, pattern: str) -> list[str]:
+    """Recursively load files in a directory."""
+    files = list(_walk_files(directory, pattern))
+    _record_dependency(("dir", directory, pattern, tuple(files)))
+    return files
+
+
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
@@ -377,6 +595,7 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _record_dependency(("env", args[0], os.environ.get(args[0]), None))
 
     # Check for a default value
     if len(args) > 1:
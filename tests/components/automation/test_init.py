@@ -305,6 +305,47 @@ async def test_two_conditions_with_and(hass: HomeAssistant, calls) -> None:
     assert len(calls) == 1
 
 
+async def test_conditions_without_stored_traces(
+    hass: HomeAssistant, calls, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test conditions of an automation which stores no traces."""
+    entity_id = "test.entity"
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": [{"platform": "event", "event_type": "test_event"}],
+                "condition": [
+                    {"condition": "state", "entity_id": entity_id, "state": "100"},
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": entity_id,
+                        "below": 150,
+                    },
+                ],
+                "action": {"service": "test.automation"},
+                "trace": {"stored_traces": 0},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+    assert "Error evaluating condition in 'automation 0'" in caplog.text
+
+    hass.states.async_set(entity_id, 100)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.states.async_set(entity_id, 151)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 async def test_shorthand_conditions_template(hass: HomeAssistant, calls) -> None:
     """Test shorthand nation form in conditions."""
     assert await async_setup_component(
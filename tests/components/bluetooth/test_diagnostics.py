@@ -161,6 +161,10 @@ async def test_diagnostics(
                     "sources": {},
                     "timings": {},
                 },
+                "match_cache": {
+                    "integrations": {"fingerprints": 0, "hits": 0, "misses": 0},
+                    "callbacks": {"fingerprints": 0, "hits": 0, "misses": 0},
+                },
                 "connectable_history": [],
                 "all_history": [],
                 "scanners": [
@@ -333,6 +337,10 @@ async def test_diagnostics_macos(
                     "sources": {"44:44:33:11:23:45": "local"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "match_cache": {
+                    "integrations": {"fingerprints": 1, "hits": 0, "misses": 1},
+                    "callbacks": {"fingerprints": 0, "hits": 0, "misses": 0},
+                },
                 "connectable_history": [
                     {
                         "address": "44:44:33:11:23:45",
@@ -526,6 +534,10 @@ async def test_diagnostics_remote_adapter(
                     "sources": {"44:44:33:11:23:45": "esp32"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "match_cache": {
+                    "integrations": {"fingerprints": 1, "hits": 0, "misses": 1},
+                    "callbacks": {"fingerprints": 0, "hits": 0, "misses": 0},
+                },
                 "all_history": [
                     {
                         "address": "44:44:33:11:23:45",
@@ -31,6 +31,7 @@ from homeassistant.components.bluetooth.match import (
     ADDRESS,
     CONNECTABLE,
     LOCAL_NAME,
+    MANUFACTURER_DATA_START,
     MANUFACTURER_ID,
     SERVICE_DATA_UUID,
     SERVICE_UUID,
@@ -1504,6 +1505,81 @@ async def test_register_callback_by_manufacturer_id(
     assert service_info.manufacturer_id == 21
 
 
+async def test_register_callback_match_cache(
+    hass: HomeAssistant, mock_bleak_scanner_start: MagicMock, enable_bluetooth: None
+) -> None:
+    """Test callback matches are cached until the matchers change."""
+    mock_bt = []
+    callbacks = []
+
+    def _fake_subscriber(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Fake subscriber for the BleakScanner."""
+        callbacks.append(("start", service_info.manufacturer_data[21]))
+
+    def _fake_subscriber_2(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Fake subscriber for the BleakScanner."""
+        callbacks.append(("any", service_info.manufacturer_data[21]))
+
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with patch.object(hass.config_entries.flow, "async_init"):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        cancel = bluetooth.async_register_callback(
+            hass,
+            _fake_subscriber,
+            {MANUFACTURER_ID: 21, MANUFACTURER_DATA_START: [0x01]},
+            BluetoothScanningMode.ACTIVE,
+        )
+        rtx_device = generate_ble_device("44:44:33:11:23:45", "rtx")
+        for manufacturer_data in (b"\x01\x02", b"\x01\x03", b"\x02\x03"):
+            inject_advertisement(
+                hass,
+                rtx_device,
+                generate_advertisement_data(
+                    local_name="rtx", manufacturer_data={21: manufacturer_data}
+                ),
+            )
+        assert callbacks == [("start", b"\x01\x02"), ("start", b"\x01\x03")]
+
+        cancel_2 = bluetooth.async_register_callback(
+            hass,
+            _fake_subscriber_2,
+            {MANUFACTURER_ID: 21},
+            BluetoothScanningMode.ACTIVE,
+        )
+        inject_advertisement(
+            hass,
+            rtx_device,
+            generate_advertisement_data(
+                local_name="rtx", manufacturer_data={21: b"\x01\x04"}
+            ),
+        )
+        assert callbacks[2:] == [
+            ("any", b"\x02\x03"),
+            ("start", b"\x01\x04"),
+            ("any", b"\x01\x04"),
+        ]
+
+        diagnostics = await _get_manager().async_diagnostics()
+        assert diagnostics["match_cache"]["callbacks"] == {
+            "fingerprints": 1,
+            "hits": 1,
+            "misses": 3,
+        }
+
+        cancel()
+        cancel_2()
+
+
 async def test_register_callback_by_connectable(
     hass: HomeAssistant, mock_bleak_scanner_start: MagicMock, enable_bluetooth: None
 ) -> None:
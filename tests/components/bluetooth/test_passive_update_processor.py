@@ -35,6 +35,7 @@ from homeassistant.components.bluetooth.passive_update_processor import (
 from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
+    SensorEntity,
     SensorEntityDescription,
 )
 from homeassistant.config_entries import current_entry
@@ -1275,6 +1276,83 @@ async def test_passive_bluetooth_entity_with_entity_platform(
     cancel_coordinator()
 
 
+async def test_passive_bluetooth_entity_reuses_attributes(
+    hass: HomeAssistant,
+    mock_bleak_scanner_start: MagicMock,
+    mock_bluetooth_adapters: None,
+) -> None:
+    """Test entities only generate their attributes again when they change."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+
+    entity_platform = MockEntityPlatform(hass)
+
+    class PassiveBluetoothSensorEntity(PassiveBluetoothProcessorEntity, SensorEntity):
+        """A sensor entity using the processor data."""
+
+        @property
+        def native_value(self) -> Any:
+            """Return the native value."""
+            return self.processor.entity_data.get(self.entity_key)
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        return {"test": "data"}
+
+    pressures = iter((1234, 1235))
+
+    @callback
+    def _async_generate_mock_data(
+        data: dict[str, str],
+    ) -> PassiveBluetoothDataUpdate:
+        """Generate mock data."""
+        return PassiveBluetoothDataUpdate(
+            devices={},
+            entity_data={PassiveBluetoothEntityKey("pressure", None): next(pressures)},
+            entity_descriptions=NO_DEVICES_PASSIVE_BLUETOOTH_DATA_UPDATE.entity_descriptions,
+        )
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+    )
+    processor = PassiveBluetoothDataProcessor(_async_generate_mock_data)
+    coordinator.async_register_processor(processor)
+    cancel_coordinator = coordinator.async_start()
+
+    processor.async_add_entities_listener(
+        PassiveBluetoothSensorEntity,
+        lambda entities: hass.async_create_task(
+            entity_platform.async_add_entities(entities)
+        ),
+    )
+    entity_id = "test_domain.test_platform_aa_bb_cc_dd_ee_ff_pressure"
+    inject_bluetooth_service_info(hass, NO_DEVICES_BLUETOOTH_SERVICE_INFO)
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state.state == "1234"
+    assert state.attributes["unit_of_measurement"] == "hPa"
+
+    with patch.object(
+        PassiveBluetoothSensorEntity,
+        "_async_generate_attributes",
+        autospec=True,
+        side_effect=PassiveBluetoothSensorEntity._async_generate_attributes,
+    ) as mock_generate_attributes:
+        inject_bluetooth_service_info(hass, NO_DEVICES_BLUETOOTH_SERVICE_INFO_2)
+        await hass.async_block_till_done()
+
+    new_state = hass.states.get(entity_id)
+    assert new_state.state == "1235"
+    assert new_state.attributes is state.attributes
+    assert mock_generate_attributes.call_count == 0
+    cancel_coordinator()
+
+
 SENSOR_PASSIVE_BLUETOOTH_DATA_UPDATE = PassiveBluetoothDataUpdate(
     devices={
         None: DeviceInfo(
@@ -1,14 +1,18 @@
 """The tests the History component websocket_api."""
 import asyncio
+from collections.abc import Iterator
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import patch
 
+from aiohttp import web
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -452,6 +456,208 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_during_period_stream(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_stream sends chunks per entity."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(5):
+        hass.states.async_set("sensor.one", str(idx), attributes={"any": "attr"})
+        hass.states.async_set("sensor.two", str(idx * 10))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period_stream",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "significant_changes_only": False,
+            "chunk_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    states: dict[str, list[dict]] = {"sensor.one": [], "sensor.two": []}
+    chunks = 0
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        if response["event"].get("done"):
+            break
+        chunks += 1
+        assert len(response["event"]["states"]) == 1
+        for entity_id, entity_states in response["event"]["states"].items():
+            assert len(entity_states) <= 2
+            states[entity_id].extend(entity_states)
+
+    assert chunks == 6
+    assert [state["s"] for state in states["sensor.one"]] == ["0", "1", "2", "3", "4"]
+    assert states["sensor.one"][0]["a"] == {"any": "attr"}
+    assert [state["s"] for state in states["sensor.two"]] == [
+        "0",
+        "10",
+        "20",
+        "30",
+        "40",
+    ]
+
+
+async def test_history_during_period_stream_slow_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_stream waits for a slow client."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(5):
+        hass.states.async_set("sensor.one", str(idx))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    written_chunks = 0
+    written_when_read: list[int] = []
+    original_send_str = web.WebSocketResponse.send_str
+    original_chunks = recorder_history.get_significant_states_chunks_with_session
+
+    async def _slow_send_str(
+        wsock: web.WebSocketResponse, data: str, compress: int | None = None
+    ) -> None:
+        nonlocal written_chunks
+        await asyncio.sleep(0.01)
+        await original_send_str(wsock, data, compress)
+        written_chunks += data.count('"states"')
+
+    def _chunks(*args: Any, **kwargs: Any) -> Iterator[dict[str, list]]:
+        for states in original_chunks(*args, **kwargs):
+            written_when_read.append(written_chunks)
+            yield states
+
+    with patch.object(web.WebSocketResponse, "send_str", _slow_send_str), patch.object(
+        recorder_history, "get_significant_states_chunks_with_session", _chunks
+    ):
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        states = []
+        while not (response := await client.receive_json())["event"].get("done"):
+            states.extend(response["event"]["states"]["sensor.one"])
+
+    assert [state["s"] for state in states] == ["0", "1", "2", "3", "4"]
+    # Each chunk is only read once the previous ones were written
+    assert written_when_read == [0, 1, 2, 3, 4]
+
+
+async def test_history_during_period_stream_stalled_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_stream stops when a client stalls."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(5):
+        hass.states.async_set("sensor.one", str(idx))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    read_chunks = 0
+    stream_finished = threading.Event()
+    client_reads = asyncio.Event()
+    original_send_str = web.WebSocketResponse.send_str
+    original_chunks = recorder_history.get_significant_states_chunks_with_session
+
+    async def _stalled_send_str(
+        wsock: web.WebSocketResponse, data: str, compress: int | None = None
+    ) -> None:
+        if '"states"' in data:
+            await client_reads.wait()
+        await original_send_str(wsock, data, compress)
+
+    def _chunks(*args: Any, **kwargs: Any) -> Iterator[dict[str, list]]:
+        nonlocal read_chunks
+        try:
+            for states in original_chunks(*args, **kwargs):
+                read_chunks += 1
+                yield states
+        finally:
+            stream_finished.set()
+
+    with patch.object(
+        web.WebSocketResponse, "send_str", _stalled_send_str
+    ), patch.object(
+        recorder_history, "get_significant_states_chunks_with_session", _chunks
+    ), patch.object(
+        websocket_api, "HISTORY_STREAM_WRITE_TIMEOUT", 0.05
+    ):
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        # The recorder worker is released while the client is stalled
+        assert await hass.async_add_executor_job(stream_finished.wait, 5)
+        client_reads.set()
+        response = await client.receive_json()
+        assert response["event"]["states"]["sensor.one"][0]["s"] == "0"
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["error"]["code"] == "timeout"
+
+    assert read_chunks == 1
+
+
+async def test_history_during_period_stream_bad_start_time(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_stream bad start time."""
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period_stream",
+            "entity_ids": ["sensor.pet"],
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_history_stream_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
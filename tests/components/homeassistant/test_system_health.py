@@ -0,0 +1,26 @@
+"""Tests for Home Assistant system health."""
+from homeassistant.core import HomeAssistant
+from homeassistant.loader import DATA_IMPORT_TIMES
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_import_times(hass: HomeAssistant) -> None:
+    """Test the slowest integration imports are reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+    hass.data[DATA_IMPORT_TIMES] = {
+        "homeassistant.components.light": 0.25,
+        "homeassistant.components.zha": 1.5,
+        "homeassistant.components.zha.light": 0.5,
+        "custom_components.test": 0.75,
+    }
+
+    info = await get_system_health_info(hass, "homeassistant")
+
+    assert info["import_time"] == "3.00s"
+    assert info["slowest_imports"] == (
+        "zha (1.50s), custom_components.test (0.75s), zha.light (0.50s),"
+        " light (0.25s)"
+    )
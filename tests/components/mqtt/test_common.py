@@ -6,6 +6,7 @@ from datetime import datetime
 import json
 from pathlib import Path
 from typing import Any
+from unittest import mock
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
@@ -33,7 +34,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from tests.common import MockConfigEntry, async_fire_mqtt_message
-from tests.typing import MqttMockHAClientGenerator, MqttMockPahoClient
+from tests.typing import MqttMockHAClient, MqttMockHAClientGenerator, MqttMockPahoClient
 
 DEFAULT_CONFIG_DEVICE_INFO_ID = {
     "identifiers": ["helloworld"],
@@ -1156,6 +1157,16 @@ async def help_test_entity_name(
     assert state.name == f"Beer {expected_friendly_name}"
 
 
+def _assert_subscribed(mqtt_mock: MqttMockHAClient, topic: str) -> None:
+    """Assert a topic was subscribed, sensor state topics drop superseded messages."""
+    subscribe_calls = mqtt_mock.async_subscribe.call_args_list
+    assert (
+        mock.call(topic, ANY, ANY, ANY) in subscribe_calls
+        or mock.call(topic, ANY, ANY, ANY, drop_superseded_retained=True)
+        in subscribe_calls
+    )
+
+
 async def help_test_entity_id_update_subscriptions(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1184,7 +1195,7 @@ async def help_test_entity_id_update_subscriptions(
     assert state is not None
     assert mqtt_mock.async_subscribe.call_count == len(topics) + 2 + DISCOVERY_COUNT
     for topic in topics:
-        mqtt_mock.async_subscribe.assert_any_call(topic, ANY, ANY, ANY)
+        _assert_subscribed(mqtt_mock, topic)
     mqtt_mock.async_subscribe.reset_mock()
 
     entity_registry.async_update_entity(
@@ -1198,7 +1209,7 @@ async def help_test_entity_id_update_subscriptions(
     state = hass.states.get(f"{domain}.milk")
     assert state is not None
     for topic in topics:
-        mqtt_mock.async_subscribe.assert_any_call(topic, ANY, ANY, ANY)
+        _assert_subscribed(mqtt_mock, topic)
 
 
 async def help_test_entity_id_update_discovery_update(
@@ -20,6 +20,22 @@ default_config = {
     "birth_message": {},
     "broker": "mock-broker",
 }
+EMPTY_MESSAGE_QUEUE = {
+    "queue_depth": 0,
+    "batches": 0,
+    "messages": 0,
+    "max_queue_depth": 0,
+    "last_batch_latency": 0.0,
+    "max_batch_latency": 0.0,
+    "superseded_retained": 0,
+}
+EMPTY_DISCOVERY = {
+    "messages": 0,
+    "unchanged": 0,
+    "processed": 0,
+    "time_to_settle": None,
+    "throughput": None,
+}
 
 
 @pytest.fixture(autouse=True)
@@ -48,6 +64,8 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
+        "message_queue": EMPTY_MESSAGE_QUEUE,
+        "discovery": EMPTY_DISCOVERY,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
 
@@ -132,6 +150,14 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
+        "message_queue": EMPTY_MESSAGE_QUEUE,
+        "discovery": {
+            "messages": 2,
+            "unchanged": 0,
+            "processed": 2,
+            "time_to_settle": ANY,
+            "throughput": ANY,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -141,6 +167,14 @@ async def test_entry_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": default_config,
+        "message_queue": EMPTY_MESSAGE_QUEUE,
+        "discovery": {
+            "messages": 2,
+            "unchanged": 0,
+            "processed": 2,
+            "time_to_settle": ANY,
+            "throughput": ANY,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -259,6 +293,14 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
+        "message_queue": EMPTY_MESSAGE_QUEUE,
+        "discovery": {
+            "messages": 1,
+            "unchanged": 0,
+            "processed": 1,
+            "time_to_settle": ANY,
+            "throughput": ANY,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -268,5 +310,13 @@ async def test_redact_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": expected_config,
+        "message_queue": EMPTY_MESSAGE_QUEUE,
+        "discovery": {
+            "messages": 1,
+            "unchanged": 0,
+            "processed": 1,
+            "time_to_settle": ANY,
+            "throughput": ANY,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
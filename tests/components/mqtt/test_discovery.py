@@ -25,6 +25,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 
@@ -575,6 +576,97 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+@patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
+async def test_unchanged_discovery_skipped(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test unchanged discovery payloads are not processed again."""
+    await mqtt_mock_entry()
+    metrics = hass.data["mqtt"].discovery_metrics
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Beer"
+    assert hass.data["mqtt"].discovery_payloads[("binary_sensor", "bla")] == (
+        '{ "name": "Beer", "state_topic": "test-topic" }'
+    )
+
+    # Retained discovery messages are sent again after reconnecting
+    caplog.clear()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert "Component has already been discovered" not in caplog.text
+    assert metrics.messages == 2
+    assert metrics.unchanged == 1
+    assert metrics.processed == 1
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+    assert metrics.messages == 3
+    assert metrics.unchanged == 1
+    assert metrics.processed == 2
+
+    # The payload is processed again after the entity was removed
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    assert ("binary_sensor", "bla") not in hass.data["mqtt"].discovery_payloads
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.milk") is not None
+    assert metrics.unchanged == 1
+    assert metrics.processed == 4
+
+
+@patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
+async def test_discovered_entities_added_together(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test entities discovered together are added in one call."""
+    await mqtt_mock_entry()
+    with patch.object(
+        EntityPlatform,
+        "async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        for name in ("beer", "milk", "water"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/{name}/config",
+                json.dumps({"name": name, "state_topic": "test-topic"}),
+            )
+        await hass.async_block_till_done()
+
+    assert len(mock_add_entities.mock_calls) == 1
+    assert len(mock_add_entities.mock_calls[0][1][1]) == 3
+    for name in ("beer", "milk", "water"):
+        assert hass.states.get(f"binary_sensor.{name}") is not None
+
+
 @patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
 async def test_removal(
     hass: HomeAssistant,
@@ -8,12 +8,17 @@ import ssl
 from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1294,6 +1299,127 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+def test_subscription_trie() -> None:
+    """Test matching topics with the subscription trie."""
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, ha.HassJob(lambda msg: None))
+        for topic in (
+            "home/+/light/#",
+            "home/+/+/state",
+            "#",
+            "home/kitchen/+/state",
+            "$SYS/#",
+            "home/+",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def _matches(topic: str) -> list[str]:
+        return [subscription.topic for subscription in trie.match(topic)]
+
+    # Matches are in the order the subscriptions were added
+    assert _matches("home/kitchen/light/state") == [
+        "home/+/light/#",
+        "home/+/+/state",
+        "#",
+        "home/kitchen/+/state",
+    ]
+    assert _matches("home/kitchen/light") == ["home/+/light/#", "#"]
+    assert _matches("home/kitchen") == ["#", "home/+"]
+    assert _matches("home") == ["#"]
+    assert _matches("$SYS/broker/uptime") == ["$SYS/#"]
+    assert _matches("$SYS") == ["$SYS/#"]
+    assert trie.has_topic("home/+/+/state")
+    assert not trie.has_topic("home/+/+")
+
+    trie.remove(subscriptions["#"])
+    trie.remove(subscriptions["home/+/light/#"])
+    assert _matches("home/kitchen/light") == []
+    assert _matches("home/hall/light/state") == ["home/+/+/state"]
+    assert list(trie) == [
+        subscriptions[topic]
+        for topic in ("home/+/+/state", "home/kitchen/+/state", "$SYS/#", "home/+")
+    ]
+    with pytest.raises(ValueError):
+        trie.remove(subscriptions["#"])
+
+
+async def test_subscribe_order_of_callbacks(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test exact subscriptions are called before wildcards in subscribe order."""
+    await mqtt_mock_entry()
+    calls: list[str] = []
+
+    for topic in ("test-topic/#", "test-topic/+", "test-topic/on", "+/on"):
+
+        @callback
+        def record_topic(msg: ReceiveMessage, topic: str = topic) -> None:
+            calls.append(topic)
+
+        await mqtt.async_subscribe(hass, topic, record_topic)
+
+    async_fire_mqtt_message(hass, "test-topic/on", "test-payload")
+    await hass.async_block_till_done()
+    assert calls == ["test-topic/on", "test-topic/#", "test-topic/+", "+/on"]
+
+
+async def test_receive_messages_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test messages received by the paho thread are dispatched in batches."""
+    mqtt_mock = await mqtt_mock_entry()
+    calls: list[str] = []
+    latest_calls: list[str] = []
+
+    @callback
+    def record_calls(msg: ReceiveMessage) -> None:
+        calls.append(msg.payload)
+
+    @callback
+    def record_latest_calls(msg: ReceiveMessage) -> None:
+        latest_calls.append(msg.payload)
+
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(
+        hass, "test-topic/#", record_latest_calls, drop_superseded_retained=True
+    )
+
+    def receive_messages() -> None:
+        for payload in ("0", "1", "2", "3", "4"):
+            msg = MQTTMessage(topic=b"test-topic/state")
+            msg.payload = payload.encode()
+            msg.retain = True
+            mqtt_mock._mqtt_on_message(None, None, msg)
+        msg = MQTTMessage(topic=b"test-topic/other")
+        msg.payload = b"5"
+        mqtt_mock._mqtt_on_message(None, None, msg)
+
+    with patch("homeassistant.components.mqtt.client.MESSAGE_BATCH_SIZE", 3):
+        await hass.async_add_executor_job(receive_messages)
+        await hass.async_block_till_done()
+        await hass.async_block_till_done()
+
+    # A subscription receives the first retained message of a topic only,
+    # unless it only wants the newest retained message of a batch
+    assert calls == ["0", "5"]
+    assert latest_calls == ["2", "5"]
+    metrics = mqtt_mock.message_queue_diagnostics()
+    assert metrics == {
+        "queue_depth": 0,
+        "batches": 2,
+        "messages": 6,
+        "max_queue_depth": 6,
+        "last_batch_latency": ANY,
+        "max_batch_latency": ANY,
+        "superseded_retained": 3,
+    }
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -0,0 +1,206 @@
+"""Test states table manager."""
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.table_managers.states import (
+    StatesHistoryCache,
+    StatesManager,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+
+
+async def test_staged_states_link_old_states(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test staged states in the same commit are linked to each other."""
+    instance = recorder.get_instance(hass)
+    states_manager = StatesManager()
+    states_manager.enable_staging()
+    staged = states_manager.staged
+    assert staged is not None
+
+    def _stage_and_commit(states: list[tuple[str, str]]) -> None:
+        with instance.get_session() as session:
+            for entity_id, state in states:
+                event = Event(
+                    EVENT_STATE_CHANGED,
+                    {"entity_id": entity_id, "new_state": State(entity_id, state)},
+                )
+                old_state_row = states_manager.pop_pending_row(entity_id)
+                old_state_id = (
+                    None
+                    if old_state_row is not None
+                    else states_manager.pop_committed(entity_id)
+                )
+                row = staged.append(
+                    event,
+                    entity_id,
+                    None,
+                    None,
+                    None,
+                    None,
+                    old_state_id,
+                    -1 if old_state_row is None else old_state_row,
+                )
+                states_manager.add_pending_row(entity_id, row)
+            states_manager.insert_staged(session)
+            session.commit()
+            states_manager.post_commit_pending()
+
+    def _get_states() -> dict[str, States]:
+        with instance.get_session() as session:
+            return {
+                row.state: row
+                for row in session.query(
+                    States.state_id, States.old_state_id, States.state
+                ).filter(States.entity_id.in_(["test.one", "test.two"]))
+            }
+
+    await instance.async_add_executor_job(
+        _stage_and_commit,
+        [
+            ("test.one", "s1"),
+            ("test.two", "s2"),
+            ("test.one", "s3"),
+            ("test.one", "s4"),
+        ],
+    )
+    assert len(staged) == 0
+    await instance.async_add_executor_job(
+        _stage_and_commit, [("test.two", "s5"), ("test.one", "s6")]
+    )
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert len(states) == 6
+    assert states["s1"].old_state_id is None
+    assert states["s2"].old_state_id is None
+    assert states["s3"].old_state_id == states["s1"].state_id
+    assert states["s4"].old_state_id == states["s3"].state_id
+    assert states["s5"].old_state_id == states["s2"].state_id
+    assert states["s6"].old_state_id == states["s4"].state_id
+
+
+def test_history_cache_load_evict_and_trim() -> None:
+    """Test the history cache merges commits while loading and stays bounded."""
+    history_cache = StatesHistoryCache(window=100, max_rows=6)
+
+    def _fetch_rows(cached_from: float) -> list[tuple[str, float, float | None]]:
+        assert cached_from == 900
+        # Committed while the rows are fetched
+        history_cache.add_pending("test.one", "on", 950, None)
+        history_cache.add_pending("test.one", "off", 960, None)
+        history_cache.post_commit_pending()
+        return [("off", 800, None), ("on", 950, None)]
+
+    history_cache.load("test.one", 1000, _fetch_rows)
+    assert history_cache.get("test.one", 899, None, True, None) is None
+    assert history_cache.get("test.one", 900, None, True, None) == [
+        ("off", None),
+        ("on", 950),
+        ("off", 960),
+    ]
+
+    history_cache.add_pending("test.one", "off", 970, 960)
+    history_cache.add_pending("test.one", "on", 980, None)
+    history_cache.add_pending("test.two", "on", 980, None)
+    history_cache.post_commit_pending()
+    assert history_cache.get("test.one", 955, 980, True, None) == [
+        ("on", None),
+        ("off", 960),
+    ]
+    assert history_cache.get("test.one", 955, None, False, 1) == [("off", 960)]
+    assert history_cache.get("test.two", 955, None, True, None) is None
+
+    history_cache.load("test.two", 1000, lambda cached_from: [("on", 980, None)])
+    history_cache.add_pending("test.two", "off", 990, None)
+    history_cache.post_commit_pending()
+    # test.one is the least recently used entity and over the budget
+    assert history_cache.get("test.one", 955, None, True, None) is None
+    assert history_cache.get("test.two", 985, None, True, None) == [
+        ("on", None),
+        ("off", 990),
+    ]
+
+    # Rows older than the window are trimmed except the last one before it
+    history_cache.add_pending("test.two", "on", 1200, None)
+    history_cache.post_commit_pending()
+    assert history_cache.get("test.two", 1099, None, True, None) is None
+    assert history_cache.get("test.two", 1100, None, True, None) == [
+        ("off", None),
+        ("on", 1200),
+    ]
+
+    history_cache.evict(["test.two"])
+    assert history_cache.get("test.two", 1100, None, True, None) is None
+
+
+async def test_staged_states_retry_after_error(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a retried insert does not insert the generations written before."""
+    instance = recorder.get_instance(hass)
+    states_manager = StatesManager()
+    states_manager.enable_staging()
+    staged = states_manager.staged
+    assert staged is not None
+
+    def _stage_and_commit_with_error() -> None:
+        first_row = staged.append(
+            Event(EVENT_STATE_CHANGED, {"new_state": State("test.retry", "s1")}),
+            "test.retry",
+            None,
+            None,
+            None,
+            None,
+            None,
+            -1,
+        )
+        staged.append(
+            Event(EVENT_STATE_CHANGED, {"new_state": State("test.retry", "s2")}),
+            "test.retry",
+            None,
+            None,
+            None,
+            None,
+            None,
+            first_row,
+        )
+        with instance.get_session() as session:
+            execute = session.execute
+            calls = 0
+
+            def _fail_second_generation(*args: Any, **kwargs: Any) -> Any:
+                nonlocal calls
+                calls += 1
+                if calls == 2:
+                    raise OperationalError("insert", "params", "database is locked")
+                return execute(*args, **kwargs)
+
+            with patch.object(
+                session, "execute", side_effect=_fail_second_generation
+            ), pytest.raises(OperationalError):
+                states_manager.insert_staged(session)
+            states_manager.insert_staged(session)
+            session.commit()
+            states_manager.post_commit_pending()
+
+    def _get_states() -> list[States]:
+        with instance.get_session() as session:
+            return list(
+                session.query(
+                    States.state_id, States.old_state_id, States.state
+                ).filter(States.entity_id == "test.retry")
+            )
+
+    await instance.async_add_executor_job(_stage_and_commit_with_error)
+    assert len(staged) == 0
+    states = await instance.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["s1", "s2"]
+    assert states[1].old_state_id == states[0].state_id
@@ -245,6 +245,70 @@ def test_state_changes_during_period(
     assert_multiple_states_equal_without_context(states[:limit], hist[entity_id])
 
 
+def test_state_changes_during_period_from_history_cache(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test state changes without attributes are served from the history cache."""
+    hass = hass_recorder()
+    entity_id = "media_player.test"
+
+    def set_state(state, attributes=None):
+        """Set the state."""
+        hass.states.set(entity_id, state, attributes)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=10)
+
+    with freeze_time(start) as freezer:
+        set_state("idle")
+        freezer.move_to(point)
+        set_state("YouTube")
+        hist = history.state_changes_during_period(
+            hass, start, None, entity_id, no_attributes=True
+        )
+        assert [state.state for state in hist[entity_id]] == ["YouTube"]
+
+        # New states are added to the cache when they are committed
+        freezer.tick()
+        set_state("idle")
+        freezer.tick()
+        set_state("idle", {"volume": 1})
+        freezer.tick()
+        set_state("Netflix")
+        freezer.move_to(end)
+        set_state("Plex")
+
+    def _state_changes(**kwargs):
+        return [
+            (state.state, state.last_updated, state.last_changed)
+            for state in history.state_changes_during_period(
+                hass,
+                point + timedelta(milliseconds=500),
+                end,
+                entity_id,
+                no_attributes=True,
+                **kwargs,
+            )[entity_id]
+        ]
+
+    with patch.object(
+        history.modern, "session_scope", side_effect=AssertionError
+    ), patch.object(history.modern, "_get_run_start_ts_for_utc_point_in_time"):
+        cached = _state_changes()
+        cached_descending_limited = _state_changes(descending=True, limit=2)
+        cached_no_start_state = _state_changes(include_start_time_state=False)
+
+    assert [state for state, _, _ in cached] == ["YouTube", "idle", "Netflix"]
+    get_instance(hass).states_manager.history_cache.reset()
+    with patch.object(history.modern, "_get_run_start_ts_for_utc_point_in_time"):
+        assert _state_changes() == cached
+        assert _state_changes(descending=True, limit=2) == cached_descending_limited
+        assert _state_changes(include_start_time_state=False) == cached_no_start_state
+
+
 def test_state_changes_during_period_descending(
     hass_recorder: Callable[..., HomeAssistant]
 ) -> None:
@@ -384,11 +384,23 @@ def test_saving_state_with_exception(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    event_session = get_instance(hass).event_session
+    execute = event_session.execute
+
+    def _throw_if_inserting_states(statement, *args, **kwargs):
+        # Staged states are inserted with a statement instead of the flush
+        if (
+            getattr(statement, "is_insert", False)
+            and statement.table.name == States.__tablename__
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return execute(statement, *args, **kwargs)
+
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
+        event_session,
         "flush",
         side_effect=_throw_if_state_in_session,
-    ):
+    ), patch.object(event_session, "execute", side_effect=_throw_if_inserting_states):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
 
@@ -1221,39 +1233,45 @@ def test_auto_statistics(hass_recorder: Callable[..., HomeAssistant], freezer) -
         EVENT_RECORDER_HOURLY_STATISTICS_GENERATED, async_hourly_stats_updated_listener
     )
 
-    real_compile_statistics = statistics.compile_statistics
+    def run_statistics_at_time(hass, test_time):
+        """Advance the clock and wait for statistics to be collected and written."""
+        run_tasks_at_time(hass, test_time)
+        hass.block_till_done()
+        get_instance(hass).block_till_done()
+
+    real_insert_compiled_statistics = statistics.insert_compiled_statistics
     with patch(
-        "homeassistant.components.recorder.statistics.compile_statistics",
-        side_effect=real_compile_statistics,
+        "homeassistant.components.recorder.statistics.insert_compiled_statistics",
+        side_effect=real_insert_compiled_statistics,
         autospec=True,
-    ) as compile_statistics:
+    ) as insert_compiled_statistics:
         # Advance 5 minutes, and the statistics task should run
         test_time = test_time + timedelta(minutes=5)
         freezer.move_to(test_time.isoformat())
-        run_tasks_at_time(hass, test_time)
-        assert len(compile_statistics.mock_calls) == 1
+        run_statistics_at_time(hass, test_time)
+        assert len(insert_compiled_statistics.mock_calls) == 1
         hass.block_till_done()
         assert len(stats_5min) == 1
         assert len(stats_hourly) == 0
 
-        compile_statistics.reset_mock()
+        insert_compiled_statistics.reset_mock()
 
         # Advance 5 minutes, and the statistics task should run again
         test_time = test_time + timedelta(minutes=5)
         freezer.move_to(test_time.isoformat())
-        run_tasks_at_time(hass, test_time)
-        assert len(compile_statistics.mock_calls) == 1
+        run_statistics_at_time(hass, test_time)
+        assert len(insert_compiled_statistics.mock_calls) == 1
         hass.block_till_done()
         assert len(stats_5min) == 2
         assert len(stats_hourly) == 1
 
-        compile_statistics.reset_mock()
+        insert_compiled_statistics.reset_mock()
 
         # Advance less than 5 minutes. The task should not run.
         test_time = test_time + timedelta(minutes=3)
         freezer.move_to(test_time.isoformat())
-        run_tasks_at_time(hass, test_time)
-        assert len(compile_statistics.mock_calls) == 0
+        run_statistics_at_time(hass, test_time)
+        assert len(insert_compiled_statistics.mock_calls) == 0
         hass.block_till_done()
         assert len(stats_5min) == 2
         assert len(stats_hourly) == 1
@@ -1261,8 +1279,8 @@ def test_auto_statistics(hass_recorder: Callable[..., HomeAssistant], freezer) -
         # Advance 5 minutes, and the statistics task should run again
         test_time = test_time + timedelta(minutes=5)
         freezer.move_to(test_time.isoformat())
-        run_tasks_at_time(hass, test_time)
-        assert len(compile_statistics.mock_calls) == 1
+        run_statistics_at_time(hass, test_time)
+        assert len(insert_compiled_statistics.mock_calls) == 1
         hass.block_till_done()
         assert len(stats_5min) == 3
         assert len(stats_hourly) == 1
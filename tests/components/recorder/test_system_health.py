@@ -1,4 +1,5 @@
 """Test recorder system health."""
+from datetime import timedelta
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -7,8 +8,9 @@ from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
-from .common import async_wait_recording_done
+from .common import async_wait_recording_done, do_adhoc_statistics
 
 from tests.common import get_system_health_info
 from tests.typing import RecorderInstanceGenerator
@@ -35,6 +37,24 @@ async def test_recorder_system_health(
     }
 
 
+async def test_recorder_system_health_statistics_durations(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health shows how long compiling statistics took."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert "statistics_collect_duration" not in info
+
+    start = dt_util.utcnow().replace(minute=55, second=0, microsecond=0)
+    do_adhoc_statistics(hass, start=start - timedelta(hours=1))
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["statistics_collect_duration"].endswith(" s")
+    assert info["statistics_insert_duration"].endswith(" s")
+    assert info["statistics_hourly_duration"].endswith(" s")
+
+
 @pytest.mark.parametrize(
     "dialect_name", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -18,7 +18,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.components.statistics import DOMAIN as STATISTICS_DOMAIN
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import SampleWindow, StatisticsSensor
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -1434,3 +1434,40 @@ async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
 
     assert hass.states.get("sensor.test") is None
     assert hass.states.get("sensor.cputest")
+
+
+def test_sample_window_aggregates() -> None:
+    """Test the running aggregates match a calculation over all samples."""
+    start = datetime(2023, 1, 1, tzinfo=dt_util.UTC)
+    window = SampleWindow(5, sorted_values=True, circular=True)
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 1000, -3, 6, 6, 0.1, 12]
+
+    for idx, value in enumerate(values):
+        window.append(value, start + timedelta(seconds=idx * idx))
+        if idx == 10:
+            window.popleft()
+        states = list(window.states)
+        ages = list(window.ages)
+        assert len(window) == len(states) == min(idx + 1, 5) - (idx == 10)
+        assert window.sum == pytest.approx(sum(states))
+        assert window.sorted_values == sorted(states)
+        assert window.median() == statistics.median(states)
+        assert window.sum_differences == pytest.approx(
+            sum(abs(j - i) for i, j in zip(states, states[1:]))
+        )
+        assert window.area_step == pytest.approx(
+            sum(
+                states[i - 1] * (ages[i] - ages[i - 1]).total_seconds()
+                for i in range(1, len(states))
+            )
+        )
+        if len(states) >= 2:
+            assert window.variance == pytest.approx(statistics.variance(states))
+            assert window.percentile(20) == pytest.approx(
+                statistics.quantiles(states, n=100, method="exclusive")[19]
+            )
+
+    while window.states:
+        window.popleft()
+    assert window.sum == window.m2 == window.area_linear == 0
+    assert window.sorted_values == []
@@ -1,6 +1,7 @@
 """Test Trace websocket API."""
 import asyncio
 from collections import defaultdict
+from copy import deepcopy
 import json
 from typing import Any
 from unittest.mock import patch
@@ -9,9 +10,14 @@ import pytest
 from pytest_unordered import unordered
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DEFAULT_STORED_TRACES,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.helpers.trace import TraceElement, variables_cv
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
@@ -38,7 +44,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -53,14 +59,15 @@ async def _setup_automation_or_script(
             configs = {**configs, **script_config}
 
     if stored_traces is not None:
+        trace_config = {**(trace_config or {}), "stored_traces": stored_traces}
+
+    if trace_config is not None:
         if domain == "script":
             for config in configs.values():
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
         else:
             for config in configs:
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
 
     assert await async_setup_component(hass, domain, {domain: configs})
 
@@ -72,6 +79,31 @@ async def _run_automation_or_script(hass, domain, config, event, context=None):
         await hass.services.async_call("script", config["id"], context=context)
 
 
+def _saved_traces(traces):
+    """Return the stored form of the traces of scripts or automations."""
+    saved_traces = {}
+    for key, key_traces in traces.items():
+        shared = {
+            shared_key: key_traces[-1]["extended_dict"][shared_key]
+            for shared_key in ("config", "blueprint_inputs")
+        }
+        for trace in key_traces:
+            # The short dict is not stored since it is part of the extended dict
+            assert trace["short_dict"].items() <= trace["extended_dict"].items()
+        saved_traces[key] = {
+            **shared,
+            "traces": [
+                {
+                    trace_key: value
+                    for trace_key, value in trace["extended_dict"].items()
+                    if trace_key not in shared or value != shared[trace_key]
+                }
+                for trace in key_traces
+            ],
+        }
+    return saved_traces
+
+
 def _assert_raw_config(domain, config, trace):
     if domain == "script":
         config = {"sequence": config["action"]}
@@ -418,7 +450,8 @@ async def test_get_trace(
 
     # Check that saved data is same as the serialized traces
     assert "trace.saved_traces" in hass_storage
-    assert hass_storage["trace.saved_traces"]["data"] == traces
+    assert hass_storage["trace.saved_traces"]["version"] == 2
+    assert hass_storage["trace.saved_traces"]["data"] == _saved_traces(traces)
 
 
 @pytest.mark.parametrize("domain", ["automation", "script"])
@@ -474,8 +507,9 @@ async def test_restore_traces(
             "item_id": trace["item_id"],
         }
 
-    # Check that loaded data is same as the serialized traces
-    assert hass_storage["trace.saved_traces"]["data"] == traces
+    # Check that the data was migrated and is same as the serialized traces
+    assert traces == saved_traces["data"]
+    assert hass_storage["trace.saved_traces"]["data"] == _saved_traces(traces)
 
     # Check restored contexts
     await _assert_contexts(client, next_id, contexts)
@@ -488,7 +522,8 @@ async def test_restore_traces(
 
     # Check that saved data is same as the serialized traces
     assert "trace.saved_traces" in hass_storage
-    assert hass_storage["trace.saved_traces"] == saved_traces
+    assert hass_storage["trace.saved_traces"]["version"] == 2
+    assert hass_storage["trace.saved_traces"]["data"] == _saved_traces(traces)
 
 
 @pytest.mark.parametrize("domain", ["automation", "script"])
@@ -587,6 +622,159 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_sampling(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test traces of runs which are not sampled are only kept if they failed."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [sun_config, moon_config],
+        trace_config={"stored_traces": 10, "sample_every": 3},
+    )
+
+    for _ in range(2):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+    for _ in range(6):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 2
+    assert len(_find_traces(response["result"], domain, "moon")) == 2
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_sampling_slow_run(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test traces of runs which are not sampled are kept if they were slow."""
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [moon_config],
+        trace_config={"sample_every": 100, "slow_run": 0},
+    )
+
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "moon")) == 3
+
+
+async def test_trace_shared_variables(hass: HomeAssistant) -> None:
+    """Test equal variables of finished traces are shared."""
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "variables": {"room": {"name": "kitchen", "lights": ["light.ceiling"]}},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, "automation", [moon_config])
+
+    for _ in range(2):
+        await _run_automation_or_script(hass, "automation", moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    first, second = (
+        trace._trace["trigger/0"][0]._variables
+        for trace in hass.data[DATA_TRACE]["automation.moon"].values()
+    )
+    assert first["room"] == {"name": "kitchen", "lights": ["light.ceiling"]}
+    assert second["room"] is first["room"]
+    assert second["trigger"] is not first["trigger"]
+
+
+@pytest.mark.parametrize(
+    ("shared_value", "value"),
+    [
+        (True, 1),
+        (1, 1.0),
+        ([True], [1]),
+        ({"on": 1}, {"on": 1.0}),
+        ({True: "on"}, {1: "on"}),
+        ({1}, {True}),
+    ],
+)
+def test_trace_shared_variables_same_type(shared_value: Any, value: Any) -> None:
+    """Test equal variables of different types are not shared."""
+    variables_cv.set(None)
+    element = TraceElement({"value": value}, "action/0")
+    shared_variables = {"value": shared_value}
+    element.share_variables(shared_variables)
+    assert element.as_dict()["changed_variables"]["value"] is value
+    assert shared_variables["value"] is value
+
+    # A copy of the same type is shared
+    variables_cv.set(None)
+    element = TraceElement({"value": value}, "action/0")
+    shared_variables = {"value": deepcopy(value)}
+    element.share_variables(shared_variables)
+    assert element.as_dict()["changed_variables"]["value"] is shared_variables["value"]
+
+
+@pytest.mark.parametrize(
+    ("domain", "num_moon_traces"), [("automation", 2), ("script", 4)]
+)
+async def test_trace_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain, num_moon_traces
+) -> None:
+    """Test the oldest traces are evicted when over the trace element budget."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    with patch("homeassistant.components.trace.MAX_TRACE_ELEMENTS", 4):
+        await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    for _ in range(5):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 0
+    assert len(_find_traces(response["result"], domain, "moon")) == num_moon_traces
+    budget = hass.data[DATA_TRACE_BUDGET]
+    assert budget.element_count == 4
+    # The shared variables are dropped with the last trace
+    assert set(budget._shared_variables) == {f"{domain}.moon"}
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -17,7 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1260,6 +1260,60 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_multiple_connections(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribe entities on multiple connections shares one listener."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    all_client = await hass_ws_client(hass)
+    one_client = await hass_ws_client(hass)
+
+    await all_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await one_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.one"]}
+    )
+    for client in (all_client, one_client):
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "on")
+
+    msg = await all_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {"c": {"light.two": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+    for client in (all_client, one_client):
+        msg = await client.receive_json()
+        assert msg["id"] == 7
+        assert msg["event"] == {
+            "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    await one_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await one_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.one", "off")
+    msg = await all_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+    await all_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await all_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
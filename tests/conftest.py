@@ -383,6 +383,15 @@ def reset_hass_threading_local_object() -> Generator[None, None, None]:
     ha._hass.__dict__.clear()
 
 
+@pytest.fixture(autouse=True)
+def yaml_snapshot_in_tmp_path(tmp_path) -> Generator[None, None, None]:
+    """Keep the YAML snapshot out of the config directories of the tests."""
+    with patch(
+        "homeassistant.config.YAML_SNAPSHOT_FILE", str(tmp_path / "core.yaml_snapshot")
+    ):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def bcrypt_cost() -> Generator[None, None, None]:
     """Run with reduced rounds during tests, to speed up uses."""
@@ -824,6 +824,177 @@ async def test_not_condition_shorthand(hass: HomeAssistant) -> None:
     assert not test(hass)
 
 
+async def test_untraced_conditions(hass: HomeAssistant) -> None:
+    """Test conditions are evaluated by their plan when not traced."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {"condition": "template", "value_template": "true"},
+            {
+                "condition": "or",
+                "conditions": [
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.temperature",
+                        "state": "100",
+                    },
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.temperature",
+                        "below": 50,
+                    },
+                ],
+            },
+            {
+                "condition": "not",
+                "conditions": [
+                    {
+                        "condition": "template",
+                        "value_template": "{{ is_state('sensor.door', 'open') }}",
+                    },
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.door",
+                        "state": "open",
+                        "enabled": False,
+                    },
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    untraced = condition.async_get_untraced(test)
+    trace.trace_clear()
+    hass.states.async_set("sensor.door", "closed")
+    for state, result in (("100", True), ("40", True), ("60", False)):
+        hass.states.async_set("sensor.temperature", state)
+        assert untraced(hass) is result
+        assert test(hass) is result
+    hass.states.async_set("sensor.door", "open")
+    hass.states.async_set("sensor.temperature", "100")
+    trace.trace_clear()
+    assert untraced(hass) is False
+    assert not trace.trace_get(clear=False)
+
+    # The result is the same when traced
+    assert test(hass) is False
+    assert trace.trace_get(clear=False)
+
+
+async def test_untraced_condition_raises(hass: HomeAssistant) -> None:
+    """Test errors of conditions which are not traced."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature2",
+                "above": 110,
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    untraced = condition.async_get_untraced(test)
+    with pytest.raises(ConditionError) as err:
+        untraced(hass)
+    assert [error.index for error in err.value.errors] == [0, 1]
+
+    # An error does not matter if another condition short-circuits
+    hass.states.async_set("sensor.temperature2", 90)
+    assert untraced(hass) is False
+
+
+async def test_compiled_conditions_ordered_by_cost(hass: HomeAssistant) -> None:
+    """Test a compiled plan evaluates the cheapest conditions first."""
+    clock = 0.0
+    calls: list[str] = []
+
+    def _check(name: str, cost: float, result: bool) -> condition.ConditionCheckerType:
+        def check(hass: HomeAssistant, variables: Any = None) -> bool:
+            nonlocal clock
+            calls.append(name)
+            clock += cost
+            return result
+
+        return check
+
+    plan = condition.async_compile_conditions(
+        "and",
+        [
+            _check("expensive", 10, False),
+            _check("cheap", 1, False),
+            condition.async_get_untraced(
+                await condition.async_from_config(
+                    hass,
+                    cv.CONDITION_SCHEMA(
+                        {"condition": "template", "value_template": "true"}
+                    ),
+                )
+            ),
+        ],
+        False,
+        False,
+    )
+
+    with patch(
+        "homeassistant.helpers.condition.perf_counter", side_effect=lambda: clock
+    ):
+        # The first evaluation is timed, the static template is folded
+        assert plan(hass) is False
+        assert calls == ["expensive"]
+        assert plan(hass) is False
+        assert calls == ["expensive", "cheap"]
+
+
+async def test_compiled_conditions_constant(hass: HomeAssistant) -> None:
+    """Test constant conditions are folded when compiled."""
+    true_check = await condition.async_from_config(
+        hass,
+        cv.CONDITION_SCHEMA({"condition": "template", "value_template": "true"}),
+    )
+    false_check = await condition.async_from_config(
+        hass,
+        cv.CONDITION_SCHEMA({"condition": "template", "value_template": "false"}),
+    )
+    disabled_check = await condition.async_from_config(
+        hass,
+        cv.CONDITION_SCHEMA(
+            {"condition": "template", "value_template": "false", "enabled": False}
+        ),
+    )
+
+    assert condition.async_compile_conditions("and", [], False, False)(hass) is True
+    assert (
+        condition.async_compile_conditions(
+            "and", [true_check, disabled_check], False, False
+        )(hass)
+        is True
+    )
+    assert (
+        condition.async_compile_conditions("or", [true_check, false_check], True, True)(
+            hass
+        )
+        is True
+    )
+    assert (
+        condition.async_compile_conditions(
+            "not", [false_check, disabled_check], True, False
+        )(hass)
+        is True
+    )
+
+
 async def test_time_window(hass: HomeAssistant) -> None:
     """Test time condition windows."""
     sixam = "06:00:00"
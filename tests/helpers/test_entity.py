@@ -15,6 +15,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -29,6 +30,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     get_test_home_assistant,
     mock_integration,
     mock_registry,
@@ -762,6 +764,60 @@ async def test_capability_attrs(hass: HomeAssistant) -> None:
     assert state.attributes["always"] == "there"
 
 
+async def test_cached_attributes(hass: HomeAssistant) -> None:
+    """Test entities caching their attributes only generate them when dirty."""
+
+    class CachedEntity(entity.Entity):
+        """Entity that caches its attributes."""
+
+        _cache_attributes = True
+
+    ent = CachedEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = "1"
+    ent._attr_extra_state_attributes = {"power": 1}
+    ent.async_write_ha_state()
+    attributes = hass.states.get("hello.world").attributes
+    assert attributes == {"power": 1}
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent._attr_state = "2"
+    ent._attr_extra_state_attributes = {"power": 2}
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    state = hass.states.get("hello.world")
+    assert state.state == "2"
+    assert state.attributes is attributes
+    assert len(events) == 1
+
+    # Writing the same state again does not fire
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    ent.async_mark_attributes_dirty()
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    state = hass.states.get("hello.world")
+    assert state.attributes == {"power": 2}
+    assert len(events) == 2
+
+    # Unchanged attributes keep the attributes of the current state
+    attributes = state.attributes
+    ent.async_mark_attributes_dirty()
+    ent._attr_state = "3"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes is attributes
+
+    # The availability changes the attributes
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.state == STATE_UNAVAILABLE
+    assert state.attributes == {}
+
+
 async def test_warn_slow_write_state(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1476,6 +1476,50 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_indexes() -> None:
+    """Test the indexes of the EntityRegistryItems container."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="entry_a",
+        device_id="device_a",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "zha", config_entry_id="entry_a", device_id="device_a"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device_a") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry_a") == [entry1, entry2]
+    assert entities.get_entries_for_platform("hue") == [entry1]
+    assert entities.get_entries_for_platform("zha") == [entry2]
+
+    # Updating an entry keeps its position unless the indexed value changes
+    entry1 = entities["test.entity1"] = attr.evolve(entry1, name="Entity 1")
+    assert entities.get_entries_for_device_id("device_a") == [entry1, entry2]
+    entry1 = entities["test.entity1"] = attr.evolve(
+        entry1, area_id="living_room", device_id="device_b"
+    )
+    assert entities.get_entries_for_device_id("device_a") == [entry2]
+    assert entities.get_entries_for_device_id("device_b") == [entry1]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("living_room") == [entry1]
+
+    del entities["test.entity1"]
+    del entities["test.entity2"]
+
+    assert entities.get_entries_for_device_id("device_a") == []
+    assert entities.get_entries_for_device_id("device_b") == []
+    assert entities.get_entries_for_area_id("living_room") == []
+    assert entities.get_entries_for_config_entry_id("entry_a") == []
+    assert entities.get_entries_for_platform("hue") == []
+
+
 async def test_disabled_by_str_not_allowed(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
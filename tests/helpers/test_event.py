@@ -17,6 +17,7 @@ from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import area_registry as ar, entity_registry as er
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
@@ -2232,6 +2233,104 @@ async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_incremental(hass: HomeAssistant) -> None:
+    """Test tracked templates only re-render the parts using changed states."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("light.kitchen", "on")
+    rendered = []
+    runs = []
+
+    def _track(value: str) -> str:
+        rendered.append(value)
+        return value
+
+    @ha.callback
+    def track_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    template = Template(
+        (
+            "{{ track(states('sensor.one')) }}-{{ track(states('sensor.two')) }}-"
+            "{% for light in states.light %}{{ track(light.state) }}{% endfor %}"
+        ),
+        hass,
+    )
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template, {"track": _track}, timedelta(seconds=0))],
+        track_callback,
+    )
+    await hass.async_block_till_done()
+    assert template.incremental is True
+    assert info.listeners == {
+        "all": False,
+        "domains": {"light"},
+        "entities": {"sensor.one", "sensor.two"},
+        "time": False,
+    }
+    assert rendered == ["1", "2", "on"]
+
+    rendered.clear()
+    hass.states.async_set("sensor.two", "3")
+    await hass.async_block_till_done()
+    assert runs == ["1-3-on"]
+    assert rendered == ["3"]
+
+    rendered.clear()
+    hass.states.async_set("light.hallway", "off")
+    await hass.async_block_till_done()
+    assert runs == ["1-3-on", "1-3-onoff"]
+    assert rendered == ["on", "off"]
+
+
+async def test_track_template_result_incremental_registry(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test tracked templates using a registry are fully rendered."""
+    area = area_registry.async_create("Kitchen")
+    for object_id in ("one", "two"):
+        entity_registry.async_get_or_create(
+            "light", "test", object_id, suggested_object_id=object_id
+        )
+    entity_registry.async_update_entity("light.one", area_id=area.id)
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("sensor.one", "1")
+    runs = []
+
+    @ha.callback
+    def track_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    template = Template(
+        (
+            "{{ area_entities('kitchen') | map('states') | join(',') }}-"
+            "{{ states('sensor.one') }}"
+        ),
+        hass,
+    )
+    async_track_template_result(
+        hass,
+        [TrackTemplate(template, None, timedelta(seconds=0))],
+        track_callback,
+    )
+    await hass.async_block_till_done()
+
+    entity_registry.async_update_entity("light.two", area_id=area.id)
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    assert runs == ["on,off-2"]
+
+
 async def test_track_template_result_errors(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
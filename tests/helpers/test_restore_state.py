@@ -16,6 +16,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_RESOLUTION,
+    STATE_EXPIRATION,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -346,6 +348,119 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_dump_data_expiration(hass: HomeAssistant) -> None:
+    """Test states are kept for the expiration and last seen resolution."""
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    data.last_states = {
+        "input_boolean.b0": StoredState(
+            State("input_boolean.b0", "off"),
+            None,
+            now - STATE_EXPIRATION - LAST_SEEN_RESOLUTION / 2,
+        ),
+        "input_boolean.b1": StoredState(
+            State("input_boolean.b1", "off"),
+            None,
+            now - STATE_EXPIRATION - LAST_SEEN_RESOLUTION - timedelta(minutes=1),
+        ),
+    }
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    written_states = mock_write_data.mock_calls[0][1][0]
+    assert [item["state"]["entity_id"] for item in written_states] == [
+        "input_boolean.b0"
+    ]
+
+
+async def test_dump_only_changed_states(hass: HomeAssistant) -> None:
+    """Test that the dicts of unchanged states are reused between dumps."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(2):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+
+    first_states = mock_write_data.mock_calls[0][1][0]
+    written_states = mock_write_data.mock_calls[1][1][0]
+    assert written_states[0] is first_states[0]
+    assert written_states[1] is not first_states[1]
+    assert written_states[1]["state"]["state"] == "off"
+
+    # The last seen time is refreshed once it gets too old
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(days=2),
+    ):
+        await data.async_dump_states()
+
+    refreshed_states = mock_write_data.mock_calls[0][1][0]
+    assert refreshed_states[0] is not written_states[0]
+    assert refreshed_states[0]["state"] == written_states[0]["state"]
+    assert refreshed_states[0]["last_seen"] > written_states[0]["last_seen"]
+
+
+async def test_load_states_lazily(hass: HomeAssistant) -> None:
+    """Test that stored states are only deserialized when they are restored."""
+    now = dt_util.utcnow()
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save(
+        [
+            StoredState(State("input_boolean.b0", "on"), None, now).as_dict(),
+            StoredState(State("input_boolean.b1", "on"), None, now).as_dict(),
+        ]
+    )
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    with patch(
+        "homeassistant.helpers.restore_state.State.from_dict",
+        wraps=State.from_dict,
+    ) as mock_from_dict:
+        await async_load(hass)
+        data = async_get(hass)
+        assert mock_from_dict.call_count == 0
+        assert isinstance(data.last_states["input_boolean.b0"], StoredState)
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert mock_from_dict.call_count == 1
+
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        assert mock_from_dict.call_count == 1
+
+    assert state is not None
+    assert state.state == "on"
+    assert data.last_states["input_boolean.b1"].last_seen == now
+    written_states = mock_write_data.mock_calls[0][1][0]
+    assert [item["state"]["entity_id"] for item in written_states] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+    ]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -16,7 +16,8 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import async_fire_time_changed, async_test_home_assistant
@@ -679,6 +680,207 @@ async def test_loading_corrupt_file_known_domain(
     await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    def _load_store() -> dict[str, Any] | None:
+        return storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+
+    def _read(path: str) -> str:
+        with open(path, encoding="utf-8") as fdesc:
+            return fdesc.read()
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    journal_path = f"{store.path}{storage.JOURNAL_POSTFIX}"
+    data: dict[str, Any] = {
+        "entities": [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}],
+        "name": "registry",
+    }
+    await store.async_save(data)
+    assert store.write_metrics.writes == 1
+    assert store.write_metrics.journal_writes == 0
+    assert not os.path.exists(journal_path)
+    snapshot = await hass.async_add_executor_job(_read, store.path)
+
+    data["entities"][1]["name"] = "changed"
+    await store.async_save(data)
+    data["entities"].append({"id": "3", "name": "three"})
+    await store.async_save(data)
+    data["entities"].pop(0)
+    data["name"] = "renamed"
+    await store.async_save(data)
+    # Saving unchanged data does not write anything
+    await store.async_save(data)
+
+    metrics = storage.async_get_write_metrics(hass)[MOCK_KEY]
+    assert metrics is store.write_metrics
+    assert metrics.writes == 1
+    assert metrics.journal_writes == 3
+    assert metrics.bytes_written == len(snapshot) + os.path.getsize(journal_path)
+    assert await hass.async_add_executor_job(_read, store.path) == snapshot
+    assert await _load_store() == data
+
+    # A change that was not written completely is ignored
+    journal = await hass.async_add_executor_job(_read, journal_path)
+    with open(journal_path, "a", encoding="utf-8") as fdesc:
+        fdesc.write('{"k":"name","v":"tru')
+    assert await _load_store() == data
+
+    # A new key compacts the journal into a snapshot
+    data["areas"] = []
+    await store.async_save(data)
+    assert metrics.writes == 2
+    assert not os.path.exists(journal_path)
+
+    # A journal of an older snapshot is ignored
+    with open(journal_path, "w", encoding="utf-8") as fdesc:
+        fdesc.write(journal)
+    assert await _load_store() == data
+
+    await store.async_remove()
+    assert not os.path.exists(store.path)
+    assert not os.path.exists(journal_path)
+
+    # The first write after removing the data is a snapshot
+    data["name"] = "after remove"
+    await store.async_save(data)
+    data["entities"][0]["name"] = "changed again"
+    await store.async_save(data)
+    assert metrics.writes == 3
+    assert await _load_store() == data
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compacts_large_deltas(tmpdir: py.path.local) -> None:
+    """Test a journaled store writes a snapshot when the journal grows too large."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    journal_path = f"{store.path}{storage.JOURNAL_POSTFIX}"
+    data = [{"id": str(idx), "value": 0} for idx in range(10)]
+    with patch.object(storage, "JOURNAL_MIN_COMPACT_SIZE", 0):
+        await store.async_save(data)
+        data[0]["value"] = 1
+        await store.async_save(data)
+        assert store.write_metrics.journal_writes == 1
+        assert os.path.exists(journal_path)
+
+        for item in data:
+            item["value"] = "a much longer value than before"
+        await store.async_save(data)
+        assert store.write_metrics.journal_writes == 1
+        assert store.write_metrics.writes == 2
+        assert not os.path.exists(journal_path)
+
+    assert (
+        await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+        == data
+    )
+
+    with pytest.raises(ValueError):
+        storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True, encoder=Mock)
+
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True, encoder=JSONEncoder
+    )
+    data.append({"id": "10", "value": 0})
+    await store.async_save(data)
+    assert (
+        await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+        == data
+    )
+
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        '{"k":"missing","v":[],"i":0}',
+        '{"k":"entities","i":5,"v":{"id":"5"}}',
+        '{"k":"name","i":0,"v":"r"}',
+    ],
+)
+async def test_journal_change_not_matching_snapshot(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture, record: str
+) -> None:
+    """Test the rest of a journal is ignored if a change does not apply."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data: dict[str, Any] = {"entities": [{"id": "1"}], "name": "registry"}
+    await store.async_save(data)
+    data["entities"][0]["id"] = "2"
+    await store.async_save(data)
+    with open(f"{store.path}{storage.JOURNAL_POSTFIX}", "a", encoding="utf-8") as fd:
+        fd.write(f'{record}\n{{"k":"name","v":"renamed"}}\n')
+
+    assert (
+        await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+        == data
+    )
+    assert "Ignoring the rest of journal" in caplog.text
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into a snapshot when stopping."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    journal_path = f"{store.path}{storage.JOURNAL_POSTFIX}"
+    data: dict[str, Any] = {"entities": [{"id": "1"}, {"id": "2"}], "name": "one"}
+    await store.async_save(data)
+    data["entities"][1]["id"] = "3"
+    data["name"] = "two"
+    await store.async_save(data)
+    assert os.path.exists(journal_path)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert not os.path.exists(journal_path)
+    assert store.write_metrics.writes == 2
+    # Versions which do not replay the journal see all changes
+    snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert snapshot["data"] == data
+
+    # A pending change is written as a snapshot too
+    data["name"] = "three"
+    hass.state = CoreState.stopping
+    store.async_delay_save(lambda: data, 10)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert not os.path.exists(journal_path)
+    assert store.write_metrics.writes == 3
+    snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert snapshot["data"] == data
+
+    await hass.async_stop(force=True)
+
+
 async def test_os_error_is_fatal(tmpdir: py.path.local) -> None:
     """Test OSError during load is fatal."""
     loop = asyncio.get_running_loop()
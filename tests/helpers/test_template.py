@@ -4749,6 +4749,95 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_incremental(hass: HomeAssistant) -> None:
+    """Test incremental templates only re-render fragments with changed states."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("light.kitchen", "on")
+    calls: list[str] = []
+
+    def _track(value: str) -> str:
+        calls.append(value)
+        return value
+
+    tmpl = template.Template(
+        (
+            "{{ track(states('sensor.one')) }}-{{ track(states('sensor.two')) }}-"
+            "{% for light in states.light %}{{ track(light.state) }}{% endfor %}"
+        ),
+        hass,
+        incremental=True,
+    )
+    variables = {"track": _track}
+
+    info = tmpl.async_render_to_info(variables)
+    assert_result_info(info, "1-2-on", ["sensor.one", "sensor.two"], ["light"])
+    assert calls == ["1", "2", "on"]
+
+    calls.clear()
+    hass.states.async_set("sensor.two", "3")
+    info = tmpl.async_render_to_info(variables)
+    assert_result_info(info, "1-3-on", ["sensor.one", "sensor.two"], ["light"])
+    assert calls == ["3"]
+
+    calls.clear()
+    hass.states.async_set("light.hallway", "off")
+    info = tmpl.async_render_to_info(variables)
+    assert_result_info(
+        info,
+        "1-3-onoff",
+        ["sensor.one", "sensor.two"],
+        ["light"],
+    )
+    assert calls == ["on", "off"]
+
+    calls.clear()
+    info = tmpl.async_render_to_info({"track": _track})
+    assert_result_info(
+        info,
+        "1-3-onoff",
+        ["sensor.one", "sensor.two"],
+        ["light"],
+    )
+    assert calls == ["1", "3", "on", "off"]
+
+
+async def test_render_to_info_incremental_not_split(hass: HomeAssistant) -> None:
+    """Test incremental templates that can not be split are fully rendered."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    tmpl = template.Template(
+        (
+            "{% set one = states('sensor.one') %}"
+            "{{ one }}-{{ states('sensor.two') }}-{{ one }}"
+        ),
+        hass,
+        incremental=True,
+    )
+    assert_result_info(
+        tmpl.async_render_to_info(), "1-2-1", ["sensor.one", "sensor.two"]
+    )
+    hass.states.async_set("sensor.one", "3")
+    assert_result_info(
+        tmpl.async_render_to_info(), "3-2-3", ["sensor.one", "sensor.two"]
+    )
+
+    tmpl = template.Template(
+        "{{ states('sensor.one') }}-{{ states('sensor.two') | float }}",
+        hass,
+        incremental=True,
+    )
+    hass.states.async_set("sensor.two", "unknown")
+    info = tmpl.async_render_to_info()
+    with pytest.raises(TemplateError, match="no default was specified"):
+        info.result()
+    assert info.entities == {"sensor.one", "sensor.two"}
+    hass.states.async_set("sensor.two", "4")
+    assert_result_info(
+        tmpl.async_render_to_info(), "3-4.0", ["sensor.one", "sensor.two"]
+    )
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
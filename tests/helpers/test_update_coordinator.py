@@ -673,6 +673,72 @@ async def test_only_callback_on_change_when_always_update_is_false(
     remove_callbacks()
 
 
+async def test_only_callback_changed_contexts(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test we only callback the listeners whose context changed."""
+    callback_a = Mock()
+    callback_b = Mock()
+    callback_all = Mock()
+    crd.update_changed_contexts = True
+    remove_callbacks = [
+        crd.async_add_listener(callback_a, "a"),
+        crd.async_add_listener(callback_b, "b"),
+        crd.async_add_listener(callback_all),
+    ]
+    mocked_data = None
+    mocked_exception = None
+
+    async def _update_method() -> int:
+        if mocked_exception is not None:
+            raise mocked_exception
+        return mocked_data
+
+    crd.update_method = _update_method
+
+    mocked_data = {"a": 1, "b": 1}
+    await crd.async_refresh()
+    assert callback_a.call_count == 1
+    assert callback_b.call_count == 1
+    assert callback_all.call_count == 1
+
+    mocked_data = {"a": 2, "b": 1}
+    await crd.async_refresh()
+    assert callback_a.call_count == 2
+    assert callback_b.call_count == 1
+    assert callback_all.call_count == 2
+    assert crd.update_metrics == update_coordinator.CoordinatorUpdateMetrics(
+        updated=5, skipped=1
+    )
+
+    # All listeners are called when the coordinator becomes unavailable
+    mocked_exception = aiohttp.ClientError("Client Failure #1")
+    await crd.async_refresh()
+    assert callback_a.call_count == 3
+    assert callback_b.call_count == 2
+    assert callback_all.call_count == 3
+
+    # and when it recovers
+    mocked_exception = None
+    await crd.async_refresh()
+    assert callback_a.call_count == 4
+    assert callback_b.call_count == 3
+    assert callback_all.call_count == 4
+
+    crd.async_set_updated_data({"b": 2})
+    assert callback_a.call_count == 5
+    assert callback_b.call_count == 4
+    assert callback_all.call_count == 5
+
+    crd.async_set_updated_data({"b": 2})
+    assert callback_a.call_count == 5
+    assert callback_b.call_count == 4
+    assert callback_all.call_count == 6
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_always_callback_when_always_update_is_true(
     crd: update_coordinator.DataUpdateCoordinator[int], caplog: pytest.LogCaptureFixture
 ) -> None:
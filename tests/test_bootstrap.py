@@ -2,13 +2,14 @@
 import asyncio
 from collections.abc import Generator, Iterable
 import glob
+import logging
 import os
-from typing import Any
+from typing import Any, cast
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, loader, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -220,6 +221,115 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_stage_2_does_not_wait_for_stage_1_setup(hass: HomeAssistant) -> None:
+    """Test stage 2 integrations do not wait for slow stage 1 integrations."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    cloud_event = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            if domain == "cloud":
+                await cloud_event.wait()
+            order.append(domain)
+            if domain == "normal_integration":
+                cloud_event.set()
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="cloud", async_setup=gen_domain_setup("cloud"))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            async_setup=gen_domain_setup("normal_integration"),
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="cloud_integration",
+            async_setup=gen_domain_setup("cloud_integration"),
+            partial_manifest={"after_dependencies": ["cloud"]},
+        ),
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "normal_integration": {}, "cloud_integration": {}}
+    )
+
+    assert order == ["normal_integration", "cloud", "cloud_integration"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_cancelled_setup_is_not_logged_as_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test cancelling a setup task propagates the cancellation."""
+    slow_event = asyncio.Event()
+
+    async def async_setup(hass, config):
+        await slow_event.wait()
+        return True
+
+    mock_integration(hass, MockModule(domain="slow", async_setup=async_setup))
+    mock_integration(hass, MockModule(domain="waiting", dependencies=["slow"]))
+    integrations = await loader.async_get_integrations(hass, ["slow", "waiting"])
+    _, tasks = bootstrap._async_start_setup_graph(
+        hass,
+        {"slow", "waiting"},
+        {},
+        cast(dict[str, Integration], integrations),
+        {},
+        asyncio.Semaphore(1),
+    )
+    await asyncio.sleep(0)
+    waiting_task = next(
+        task for task in tasks if task.get_name() == "setup component waiting"
+    )
+    waiting_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+    slow_event.set()
+    await asyncio.wait(tasks)
+    assert "Error setting up integration waiting" not in caplog.text
+    assert "slow" in hass.config.components
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_timeline_logged(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the setup timeline and critical path are logged."""
+    caplog.set_level(logging.DEBUG, "homeassistant.bootstrap")
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(
+        hass,
+        MockModule(
+            domain="first_dep", partial_manifest={"after_dependencies": ["root"]}
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(domain="second_dep", dependencies=["first_dep"]),
+    )
+    mock_integration(hass, MockModule(domain="unrelated"))
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"root": {}, "second_dep": {}, "first_dep": {}, "unrelated": {}}
+    )
+
+    assert "Integration setup timeline" in caplog.text
+    assert (
+        "Critical path of the integration setup: root -> first_dep -> second_dep"
+        in caplog.text
+    )
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_frontend_before_recorder(hass: HomeAssistant) -> None:
     """Test frontend is setup before recorder."""
@@ -798,6 +798,48 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can route events by a key in the event data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def listener_that_throws(event):
+        """Mock listener that throws."""
+        raise ValueError
+
+    job = ha.HassJob(listener)
+    index = {"light.kitchen": [ha.HassJob(listener_that_throws), job]}
+    listeners_before = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed("test", "entity_id", index)
+    assert hass.bus.async_listeners()["test"] == listeners_before + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    index["light.other"] = [job]
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == listeners_before
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []
@@ -1125,6 +1167,22 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_shares_read_only_attributes(hass: HomeAssistant) -> None:
+    """Test read only attributes are shared between states."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    attributes = hass.states.get("light.bowl").attributes
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set("light.bowl", "off", attributes)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert hass.states.get("light.bowl").attributes is attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
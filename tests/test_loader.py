@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import pathlib
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -206,6 +208,68 @@ async def test_get_integration_custom_component(
     assert integration.name == "Test Package"
 
 
+async def test_integration_index(
+    hass: HomeAssistant, enable_custom_integrations: None, tmp_path: pathlib.Path
+) -> None:
+    """Test manifests are resolved from the integration index."""
+    index_path = str(tmp_path / ".storage" / "core.integration_index")
+    hass.data[loader.DATA_INTEGRATION_INDEX] = index = loader.IntegrationIndex(
+        index_path
+    )
+    integrations = await loader.async_get_integrations(hass, ["hue", "test_package"])
+    assert index.hits == 0
+    assert index.misses > 2
+    await hass.async_add_executor_job(index.save)
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    hass.data[loader.DATA_INTEGRATION_INDEX] = index = loader.IntegrationIndex(
+        index_path
+    )
+    await hass.async_add_executor_job(index.load)
+    with patch("homeassistant.loader.json_loads") as mock_json_loads:
+        cached = await loader.async_get_integrations(hass, ["hue", "test_package"])
+    assert not mock_json_loads.called
+    assert index.misses == 0
+    assert index.hits > 2
+    for domain in ("hue", "test_package"):
+        assert cached[domain].manifest == integrations[domain].manifest
+        assert cached[domain].file_path == integrations[domain].file_path
+
+    # A changed manifest is read again
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "one"}')
+    assert index.get_manifest(manifest_path) == {"domain": "one"}
+    manifest_path.write_text('{"domain": "other"}')
+    assert index.get_manifest(manifest_path) == {"domain": "other"}
+    assert index.get_manifest(tmp_path / "missing.json") is None
+
+
+async def test_preload_modules(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test preloading the modules of an integration in the executor."""
+    integration = await loader.async_get_integration(hass, "test")
+    for name in ("custom_components.test", "custom_components.test.light"):
+        sys.modules.pop(name, None)
+
+    await hass.async_add_executor_job(
+        integration.preload_modules, ["light", "not_a_platform"]
+    )
+
+    assert "custom_components.test" in sys.modules
+    assert "custom_components.test.light" in sys.modules
+    assert "custom_components.test.not_a_platform" not in sys.modules
+    import_times = hass.data[loader.DATA_IMPORT_TIMES]
+    assert import_times.keys() >= {
+        "custom_components.test",
+        "custom_components.test.light",
+    }
+    assert (
+        integration.get_platform("light") is sys.modules["custom_components.test.light"]
+    )
+
+
 def test_integration_properties(hass: HomeAssistant) -> None:
     """Test integration properties."""
     integration = loader.Integration(
@@ -3,6 +3,7 @@ import importlib
 import io
 import os
 import pathlib
+import pickle
 from typing import Any
 import unittest
 from unittest.mock import patch
@@ -615,3 +616,102 @@ def test_string_annotated(try_both_loaders) -> None:
             getattr(value, "__config_file__", None) == expected_annotations[key][1][0]
         )
         assert getattr(value, "__line__", None) == expected_annotations[key][1][1]
+
+
+def test_yaml_snapshot(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, try_both_loaders
+) -> None:
+    """Test parsed files are reused from a snapshot until they change."""
+    snapshot_path = str(tmp_path / ".storage" / "core.yaml_snapshot")
+    config_path = str(tmp_path / YAML_CONFIG_FILE)
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "one.yaml").write_text("sequence: []")
+    (tmp_path / YAML_CONFIG_FILE).write_text(
+        "name: !env_var SNAPSHOT_NAME\n"
+        "password: !secret password\n"
+        "script: !include_dir_named scripts\n"
+    )
+    (tmp_path / yaml.SECRET_YAML).write_text("password: secret")
+    monkeypatch.setenv("SNAPSHOT_NAME", "Home")
+
+    def load() -> tuple[dict, list[str]]:
+        with patch(
+            "homeassistant.util.yaml.loader._load_yaml_file",
+            wraps=yaml_loader._load_yaml_file,
+        ) as mock_load:
+            conf = load_yaml_config_file(
+                config_path, yaml.Secrets(tmp_path), snapshot_path
+            )
+        return conf, [os.path.basename(call.args[0]) for call in mock_load.mock_calls]
+
+    conf, parsed = load()
+    assert conf == {
+        "name": "Home",
+        "password": "secret",
+        "script": {"one": {"sequence": []}},
+    }
+    assert parsed == [YAML_CONFIG_FILE, yaml.SECRET_YAML, "one.yaml"]
+    assert os.stat(snapshot_path).st_mode & 0o777 == 0o600
+
+    conf, parsed = load()
+    assert parsed == []
+    assert conf["name"] == "Home"
+    assert conf["script"]["one"].__config_file__ == str(
+        tmp_path / "scripts" / "one.yaml"
+    )
+    assert conf["script"]["one"].__line__ == 1
+
+    # A changed include is parsed again together with the files including it
+    (tmp_path / "scripts" / "one.yaml").write_text("sequence: [] ")
+    conf, parsed = load()
+    assert parsed == [YAML_CONFIG_FILE, "one.yaml"]
+
+    (tmp_path / "scripts" / "two.yaml").write_text("sequence: []")
+    conf, parsed = load()
+    assert parsed == [YAML_CONFIG_FILE, "two.yaml"]
+    assert set(conf["script"]) == {"one", "two"}
+
+    monkeypatch.setenv("SNAPSHOT_NAME", "Away")
+    conf, parsed = load()
+    assert parsed == [YAML_CONFIG_FILE]
+    assert conf["name"] == "Away"
+
+    (tmp_path / yaml.SECRET_YAML).write_text("password: changed")
+    conf, parsed = load()
+    assert parsed == [YAML_CONFIG_FILE, yaml.SECRET_YAML]
+    assert conf["password"] == "changed"
+
+    # Files loaded without a snapshot are always parsed
+    with patch(
+        "homeassistant.util.yaml.loader._load_yaml_file",
+        wraps=yaml_loader._load_yaml_file,
+    ) as mock_load:
+        load_yaml_config_file(config_path, yaml.Secrets(tmp_path))
+    assert len(mock_load.mock_calls) == 4
+
+
+@pytest.mark.parametrize("hass_config_yaml", ["key: value"])
+def test_yaml_snapshot_not_on_disk(
+    tmp_path: pathlib.Path, try_both_loaders, mock_hass_config_yaml: None
+) -> None:
+    """Test files that can not be checked for changes are not stored."""
+    snapshot_path = tmp_path / "core.yaml_snapshot"
+    assert load_yaml_config_file(YAML_CONFIG_FILE, None, str(snapshot_path)) == {
+        "key": "value"
+    }
+    assert not snapshot_path.exists()
+
+
+def test_yaml_snapshot_invalid(
+    tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a snapshot with objects the loader does not create is ignored."""
+    snapshot_path = tmp_path / "core.yaml_snapshot"
+    snapshot_path.write_bytes(
+        pickle.dumps({"version": 1, "entries": {}, "x": pathlib.Path()})
+    )
+    (tmp_path / YAML_CONFIG_FILE).write_text("key: value")
+    assert load_yaml_config_file(
+        str(tmp_path / YAML_CONFIG_FILE), None, str(snapshot_path)
+    ) == {"key": "value"}
+    assert "Ignoring invalid YAML snapshot" in caplog.text